@@ -0,0 +1,328 @@
+"""
+Benchmark LDaCATabulator over the bundled test crates and synthetic crates.
+
+Corpora are served from a local HTTP server, so the suite runs offline.
+Each crate is timed for a cold load (download, extract, tabulate), a warm
+load (validated cache), ``get_text``, ``get_people``,
+``drop_high_null_columns`` and ``get_corpus_info``. Results are written as
+JSON; ``--compare`` checks them against an earlier run and exits with
+status 1 when an operation became slower than ``--threshold`` times its
+baseline median.
+
+Run from the repository root::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --quick --compare results.json
+"""
+
+# ========== Python Standard Library ==========
+import argparse
+import contextlib
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+# ========== Third-Party Dependencies ==========
+import pandas as pd
+
+# ========== Project-Specific Imports ==========
+from benchmarks.synthetic import corpus_id, synthetic_crate
+from src.ldacatabulator.tabulator import LDaCATabulator
+from tests.conftest import CRATES, CorpusServer, zip_crate
+
+# -------------------------
+# Constants
+# -------------------------
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BUNDLED_CRATES = ("minimal", "wide", "utf8", "textfiles", "languageFamily")
+OBJECT_COUNTS = (1_000, 10_000, 100_000)
+PROPERTY_COUNTS = (10, 100, 1_000)
+# Synthetic crates above this many object properties are skipped by default
+MAX_CELLS = 10_000_000
+REPEAT = 3
+THRESHOLD = 1.25
+OPERATIONS = (
+    "cold_load",
+    "warm_load",
+    "get_text",
+    "get_people",
+    "drop_high_null_columns",
+    "get_corpus_info",
+)
+
+
+# -------------------------------------------------------------
+# Measurement helpers
+# -------------------------------------------------------------
+def _summary(runs: list[float]) -> dict:
+    return {
+        "runs": runs,
+        "first": runs[0],
+        "min": min(runs),
+        "median": statistics.median(runs),
+    }
+
+
+def measure(func, repeat: int) -> dict:
+    """
+    Time func ``repeat`` times. The first run is reported separately, since
+    it includes work later runs reuse (e.g. materialising an entity table).
+    An exception ends the measurement and is reported instead.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        runs.append(time.perf_counter() - start)
+    return _summary(runs)
+
+
+@contextlib.contextmanager
+def _working_dir(path: Path):
+    """
+    Create a fresh cache directory holding a copy of the configs, and run
+    in it so that the relative config paths resolve there.
+    """
+    path.mkdir(parents=True)
+    shutil.copytree(REPO_ROOT / "configs", path / "configs")
+    with contextlib.chdir(path):
+        yield path
+
+
+def bench_crate(url: str, workdir: Path, repeat: int) -> dict:
+    """
+    Run every operation against the corpus at url.
+
+    Returns
+    -------
+    dict
+        ``{operation: timings}``, plus the ``stats`` of the first cold load.
+    """
+    results = {}
+    loaded = {}
+
+    def cold_load():
+        with _working_dir(workdir / f"cold-{len(loaded)}") as cache:
+            loaded[len(loaded)] = LDaCATabulator(url, cache_dir=cache)
+
+    results["cold_load"] = measure(cold_load, repeat)
+    if not loaded:
+        return results
+    results["stats"] = loaded[0].stats.as_dict()
+
+    last = workdir / f"cold-{len(loaded) - 1}"
+    with contextlib.chdir(last):
+        tabs = []
+        results["warm_load"] = measure(lambda: tabs.append(LDaCATabulator(url, cache_dir=last)), repeat)
+        tab = tabs[-1] if tabs else loaded[len(loaded) - 1]
+
+        results["get_text"] = measure(tab.get_text, repeat)
+        results["get_people"] = measure(tab.get_people, repeat)
+
+        try:
+            full = tab.get_text(full_df=True)
+        except Exception:
+            full = None
+        if full is None:
+            results["drop_high_null_columns"] = {"error": "no RepositoryObject table"}
+        else:
+            results["drop_high_null_columns"] = measure(
+                lambda: LDaCATabulator.drop_high_null_columns(full), repeat
+            )
+
+        results["get_corpus_info"] = measure(tab.get_corpus_info, repeat)
+    return results
+
+
+# -------------------------------------------------------------
+# Suite
+# -------------------------------------------------------------
+def crate_specs(
+    bundled: bool = True,
+    objects=OBJECT_COUNTS,
+    properties=PROPERTY_COUNTS,
+    max_cells: int = MAX_CELLS,
+    ):
+    """
+    Yield ``(name, url_path, zip_builder, details)`` for the crates to run.
+    """
+    if bundled:
+        for name in BUNDLED_CRATES:
+            yield name, f"/~{name}.zip", lambda name=name: zip_crate(CRATES / name), {"kind": "bundled"}
+
+    for n in objects:
+        for p in properties:
+            details = {"kind": "synthetic", "objects": n, "properties": p}
+            if n * p > max_cells:
+                yield corpus_id(n, p), None, None, {**details, "skipped": f"more than {max_cells} cells"}
+                continue
+            yield corpus_id(n, p), f"/{corpus_id(n, p)}.zip", lambda n=n, p=p: synthetic_crate(n, p), details
+
+
+def run_suite(specs, repeat: int = REPEAT, log=None) -> dict:
+    """
+    Serve each crate locally, benchmark it and return the results document.
+    """
+    server = CorpusServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    entries = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="ldaca-bench-") as tmp:
+            for name, path, build, details in specs:
+                entry = {"crate": name, **details}
+                entries.append(entry)
+                if build is None:
+                    continue
+                if log:
+                    log(f"{name}: building crate")
+                body = build()
+                entry["zip_bytes"] = len(body)
+                url = server.serve_file(path, body)
+                if log:
+                    log(f"{name}: running")
+                results = bench_crate(url, Path(tmp) / name, repeat)
+                entry["stats"] = results.pop("stats", None)
+                entry["operations"] = results
+                server.files.pop(path)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return {"meta": environment(repeat), "results": entries}
+
+
+def environment(repeat: int) -> dict:
+    """
+    Describe the machine and versions a run was made with.
+    """
+    def version(dist: str) -> str | None:
+        try:
+            return metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            return None
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "rocrate_tabular": version("rocrate-tabular"),
+        "repeat": repeat,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD) -> list[dict]:
+    """
+    Return the operations whose median grew past threshold times the
+    baseline median.
+    """
+    def medians(doc):
+        return {
+            (entry["crate"], op): timing["median"]
+            for entry in doc["results"]
+            for op, timing in entry.get("operations", {}).items()
+            if "median" in timing
+        }
+
+    before = medians(baseline)
+    regressions = []
+    for key, median in medians(current).items():
+        if key in before and before[key] > 0 and median > threshold * before[key]:
+            regressions.append({
+                "crate": key[0],
+                "operation": key[1],
+                "baseline": before[key],
+                "current": median,
+                "ratio": median / before[key],
+            })
+    return regressions
+
+
+def format_table(doc: dict) -> str:
+    """
+    Render the medians of a results document as a text table.
+    """
+    lines = [f"{'crate':<28}" + "".join(f"{op:>24}" for op in OPERATIONS)]
+    for entry in doc["results"]:
+        cells = []
+        for op in OPERATIONS:
+            timing = entry.get("operations", {}).get(op)
+            if timing is None:
+                cells.append("-")
+            elif "error" in timing:
+                cells.append("error")
+            else:
+                cells.append(f"{timing['median'] * 1000:.1f} ms")
+        lines.append(f"{entry['crate']:<28}" + "".join(f"{c:>24}" for c in cells))
+    return "\n".join(lines)
+
+
+# -------------------------------------------------------------
+# Command line
+# -------------------------------------------------------------
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--output", type=Path, help="write the JSON results here (default: stdout)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="runs per operation")
+    parser.add_argument("--objects", type=int, nargs="*", default=list(OBJECT_COUNTS),
+                        help="RepositoryObject counts of the synthetic crates")
+    parser.add_argument("--properties", type=int, nargs="*", default=list(PROPERTY_COUNTS),
+                        help="property counts of the synthetic crates")
+    parser.add_argument("--max-cells", type=int, default=MAX_CELLS,
+                        help="skip synthetic crates with more objects x properties")
+    parser.add_argument("--no-bundled", action="store_true", help="skip the bundled test crates")
+    parser.add_argument("--quick", action="store_true",
+                        help="only the smallest synthetic crate, one run per operation")
+    parser.add_argument("--compare", type=Path, help="baseline results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.objects, args.properties, args.repeat = [min(OBJECT_COUNTS)], [min(PROPERTY_COUNTS)], 1
+
+    def log(message):
+        print(message, file=sys.stderr)
+
+    specs = crate_specs(not args.no_bundled, args.objects, args.properties, args.max_cells)
+    doc = run_suite(specs, args.repeat, log=log)
+    log(format_table(doc))
+
+    text = json.dumps(doc, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(doc, json.loads(args.compare.read_text(encoding="utf-8")), args.threshold)
+        for r in regressions:
+            log(f"REGRESSION {r['crate']} {r['operation']}: "
+                f"{r['baseline'] * 1000:.1f} ms -> {r['current'] * 1000:.1f} ms ({r['ratio']:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
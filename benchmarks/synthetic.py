@@ -0,0 +1,132 @@
+# ========== Python Standard Library ==========
+import json
+import random
+import zipfile
+from io import BytesIO
+
+# -------------------------
+# Constants
+# -------------------------
+# Properties every RepositoryObject has, counted in ``properties``
+BASE_PROPERTIES = ("name", "description", "dateCreated", "author", "ldac:mainText")
+# One extra property in SPARSE_EVERY is almost always empty, so
+# ``drop_high_null_columns`` has columns to remove
+SPARSE_EVERY = 10
+SPARSE_FILL = 200
+PEOPLE_PER_OBJECT = 0.1
+WORDS = (
+    "corpus", "language", "speaker", "recording", "transcript", "annotation",
+    "dialect", "interview", "archive", "metadata", "community", "text",
+)
+
+
+def corpus_id(objects: int, properties: int) -> str:
+    """
+    Return the identifier (and URL file name) of a synthetic crate.
+    """
+    return f"synthetic-{objects}x{properties}"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _graph(objects: int, properties: int, rng: random.Random) -> list[dict]:
+    root_id = corpus_id(objects, properties)
+    people = max(1, int(objects * PEOPLE_PER_OBJECT))
+    extra = max(0, properties - len(BASE_PROPERTIES))
+
+    graph = [
+        {
+            "@id": "ro-crate-metadata.json",
+            "@type": "CreativeWork",
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
+            "about": {"@id": root_id},
+        },
+        {
+            "@id": root_id,
+            "@type": ["Dataset", "RepositoryCollection"],
+            "name": f"Synthetic corpus {objects} x {properties}",
+            "description": "Generated benchmark crate",
+            "datePublished": "2025-01-01",
+            "publisher": {"@id": "#publisher"},
+            "hasMember": [{"@id": f"#object-{i}"} for i in range(objects)],
+        },
+        {"@id": "#publisher", "@type": "Organization", "name": "Benchmark Publisher"},
+    ]
+
+    for i in range(people):
+        graph.append({
+            "@id": f"#person-{i}",
+            "@type": "Person",
+            "name": f"Speaker {i}",
+            "gender": rng.choice(("female", "male", "unknown")),
+            "birthDate": str(1920 + rng.randrange(90)),
+        })
+
+    for i in range(objects):
+        node = {
+            "@id": f"#object-{i}",
+            "@type": "RepositoryObject",
+            "name": f"Document {i}",
+            "description": _sentence(rng, 8),
+            "dateCreated": str(1950 + rng.randrange(70)),
+            "author": {"@id": f"#person-{rng.randrange(people)}"},
+            "ldac:mainText": {"@id": f"text/{i:06d}.txt"},
+        }
+        for p in range(extra):
+            if p % SPARSE_EVERY == SPARSE_EVERY - 1 and i % SPARSE_FILL:
+                continue
+            node[f"local:prop{p:04d}"] = rng.choice(WORDS)
+        graph.append(node)
+        graph.append({"@id": f"text/{i:06d}.txt", "@type": "File", "encodingFormat": "text/plain"})
+
+    return graph
+
+
+def _preview(metadata: str) -> str:
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">\n"
+        f"<script type=\"application/ld+json\">{metadata}</script>\n"
+        "</head><body><h1>Synthetic corpus</h1></body></html>\n"
+    )
+
+
+def synthetic_crate(objects: int, properties: int, seed: int = 0) -> bytes:
+    """
+    Build a zipped LDaCA-style RO-Crate for benchmarking.
+
+    The crate has ``objects`` RepositoryObjects with ``properties``
+    properties each (a tenth of the extra ones nearly empty), one Person per
+    ten objects, a text file per object and an HTML preview embedding the
+    JSON-LD, like published LDaCA corpora. Its root dataset is
+    ``corpus_id(objects, properties)``, which the URL must end with for
+    ``get_corpus_info`` to find it.
+
+    Parameters
+    ----------
+    objects : int
+        Number of RepositoryObject entities.
+    properties : int
+        Number of properties per RepositoryObject, at least the
+        ``BASE_PROPERTIES``.
+    seed : int, optional
+        Random seed, so the same crate is generated on every run.
+
+    Returns
+    -------
+    bytes
+        The ZIP archive.
+    """
+    rng = random.Random(seed)
+    metadata = json.dumps(
+        {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": _graph(objects, properties, rng)}
+    )
+
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("ro-crate-metadata.json", metadata)
+        zf.writestr("ro-crate-preview.html", _preview(metadata))
+        for i in range(objects):
+            zf.writestr(f"text/{i:06d}.txt", _sentence(rng, 40))
+    return buf.getvalue()
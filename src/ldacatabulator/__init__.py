@@ -0,0 +1,33 @@
+# ========== Python Standard Library ==========
+import importlib
+
+# -------------------------
+# Constants
+# -------------------------
+# Public names and the submodule defining them. They are imported on first
+# access, so ``import ldacatabulator`` loads no submodule and no dependency.
+_EXPORTS = {
+    "LDaCATabulator": "tabulator",
+    "build_corpus_database": "tabulator",
+    "LDaCACollection": "collection",
+    "load_many": "collection",
+    "aload_many": "collection",
+    "CrateGraph": "metadata",
+    "LoadStats": "stats",
+    "cache_info": "storage",
+    "cache_prune": "storage",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,119 @@
+# ========== Python Standard Library ==========
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# ========== Third-Party Dependencies ==========
+if TYPE_CHECKING:
+    import pandas as pd
+
+# -------------------------
+# Constants
+# -------------------------
+ARROW_SUFFIX = ".arrow"
+
+
+def require_pyarrow():
+    """
+    Import pyarrow, which is only needed when Arrow materialisation is on.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Arrow materialisation requires pyarrow. Install the `arrow` extra, "
+            "e.g. `uv sync --extra arrow` or `pip install 'ldaca-loader[arrow]'`."
+        ) from e
+    return pa
+
+
+# -------------------------------------------------------------
+# Arrow IPC copies of the cleaned entity tables, stored next to
+# the corpus database so later sessions can memory-map them
+# instead of converting SQLite rows into Python objects.
+# -------------------------------------------------------------
+class ArrowStore:
+    """
+    Directory of Arrow IPC files holding cleaned entity tables.
+
+    Files are written uncompressed so they can be memory-mapped, and read
+    back as Arrow-backed DataFrames (``pd.ArrowDtype`` columns) without
+    copying the data. Each file name carries the table, the variant (cleaned
+    or full, with or without text) and a key derived from the table config,
+    so a changed configuration never reads a stale file.
+
+    Parameters
+    ----------
+    root : pathlib.Path
+        Directory holding the files, usually ``<database>.arrow``.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @classmethod
+    def for_database(cls, database: Path) -> "ArrowStore":
+        """
+        Return the store that belongs to a corpus database.
+        """
+        return cls(Path(database).with_suffix(ARROW_SUFFIX))
+
+    def path(self, name: str, variant: str, key: str) -> Path:
+        """
+        Return the file path of a table variant.
+        """
+        return self.root / f"{name}--{variant}--{key}{ARROW_SUFFIX}"
+
+    def read(self, name: str, variant: str, key: str) -> pd.DataFrame | None:
+        """
+        Memory-map a stored table, or return ``None`` if it is not stored.
+        """
+        path = self.path(name, variant, key)
+        if not path.exists():
+            return None
+
+        import pandas as pd
+
+        pa = require_pyarrow()
+        # The mapping outlives the file handle: the table's buffers keep it
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def write(self, name: str, variant: str, key: str, df: pd.DataFrame) -> bool:
+        """
+        Store df, replacing older versions of the same table variant.
+
+        Returns ``False`` without writing anything if the frame cannot be
+        represented in Arrow (e.g. columns mixing incompatible types).
+        """
+        pa = require_pyarrow()
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(name, variant, key)
+        # Unique per writer, as threads may store the same table at once
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+
+        for old in self.root.glob(f"{name}--{variant}--*{ARROW_SUFFIX}"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        return True
+
+    def clear(self) -> None:
+        """
+        Remove every stored table.
+        """
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,289 @@
+# ========== Python Standard Library ==========
+import hashlib
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+# -------------------------
+# Constants
+# -------------------------
+SOURCE_TABLE = "_ldaca_source"
+SOURCE_FIELDS = ("url", "etag", "last_modified", "digest", "selection", "built_at")
+TABLES_TABLE = "_ldaca_tables"
+COLUMN_STATS_TABLE = "_ldaca_column_stats"
+# Present while the tables of rocrate_tabular lag behind an incremental update
+STALE_TABLE = "_ldaca_stale_base"
+
+
+# -------------------------------------------------------------
+# Bookkeeping tables stored alongside the tabulated corpus data.
+# They let later loads decide what can be reused without
+# downloading or rebuilding anything.
+# -------------------------------------------------------------
+def write_source_record(database: Path, record: dict) -> dict:
+    """
+    Record where a corpus database was built from.
+
+    Parameters
+    ----------
+    database : pathlib.Path
+        Path to the corpus SQLite database.
+    record : dict
+        Source details: ``url`` plus the validators returned by the server
+        (``etag``, ``last_modified``), the archive ``digest`` and the member
+        ``selection`` used when extracting it. A
+        ``built_at`` timestamp is added unless the record already has one.
+
+    Returns
+    -------
+    dict
+        The stored record, including its ``built_at`` timestamp.
+    """
+    values = dict.fromkeys(SOURCE_FIELDS)
+    values.update({k: record.get(k) for k in SOURCE_FIELDS})
+    values["built_at"] = values["built_at"] or datetime.now(timezone.utc).isoformat()
+
+    conn = sqlite3.connect(database)
+    try:
+        with conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {SOURCE_TABLE} "
+                f"({', '.join(f'{name} TEXT' for name in SOURCE_FIELDS)})"
+            )
+            conn.execute(f"DELETE FROM {SOURCE_TABLE}")
+            conn.execute(
+                f"INSERT INTO {SOURCE_TABLE} VALUES ({', '.join('?' * len(SOURCE_FIELDS))})",
+                [values[name] for name in SOURCE_FIELDS],
+            )
+    finally:
+        conn.close()
+
+    return values
+
+
+def read_source_record(database: Path) -> dict | None:
+    """
+    Return the source record of a corpus database, or ``None`` when the
+    database does not exist or was not built by this package.
+    """
+    if not Path(database).exists():
+        return None
+
+    conn = sqlite3.connect(database)
+    try:
+        row = conn.execute(
+            f"SELECT {', '.join(SOURCE_FIELDS)} FROM {SOURCE_TABLE} LIMIT 1"
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+    return dict(zip(SOURCE_FIELDS, row)) if row else None
+
+
+def clear_source_record(database: Path) -> None:
+    """
+    Forget where a database was built from, so it is not reused until it is
+    built or updated again.
+    """
+    if not Path(database).exists():
+        return
+
+    conn = sqlite3.connect(database, timeout=30)
+    try:
+        with conn:
+            conn.execute(f"DROP TABLE IF EXISTS {SOURCE_TABLE}")
+    finally:
+        conn.close()
+
+
+def config_hash(config: dict, table_name: str, text_prop: str | None = None) -> str:
+    """
+    Fingerprint the configuration that shapes one entity table.
+
+    Only the table's own entry under ``"tables"`` and the top-level settings
+    are hashed, so swapping in a corpus config leaves the hashes of tables it
+    does not mention unchanged.
+    """
+    config = config or {}
+    relevant = {
+        "table": config.get("tables", {}).get(table_name),
+        "settings": {k: v for k, v in config.items() if k != "tables"},
+        "text_prop": text_prop,
+    }
+    encoded = json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@contextmanager
+def _reading(database: Path, conn: sqlite3.Connection | None):
+    """
+    Yield conn, or a connection to database opened for the block.
+    """
+    if conn is not None:
+        yield conn
+        return
+    conn = sqlite3.connect(database)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def read_table_records(database: Path, conn: sqlite3.Connection | None = None) -> dict:
+    """
+    Return ``{table_name: config_hash}`` for the entity tables already
+    materialised in a corpus database, read through conn when given (e.g.
+    a reader's open connection) instead of a new connection.
+    """
+    if conn is None and not Path(database).exists():
+        return {}
+
+    with _reading(database, conn) as conn:
+        try:
+            rows = conn.execute(
+                f"SELECT t.name, t.config_hash FROM {TABLES_TABLE} t "
+                "JOIN sqlite_master m ON m.type = 'table' AND m.name = t.name"
+            ).fetchall()
+        except sqlite3.Error:
+            return {}
+
+    return dict(rows)
+
+
+def write_table_record(database: Path, table_name: str, config_hash: str) -> None:
+    """
+    Record that table_name was materialised with the given config hash.
+    """
+    conn = sqlite3.connect(database, timeout=30)
+    try:
+        with conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {TABLES_TABLE} "
+                "(name TEXT PRIMARY KEY, config_hash TEXT, built_at TEXT)"
+            )
+            conn.execute(
+                f"INSERT OR REPLACE INTO {TABLES_TABLE} VALUES (?, ?, ?)",
+                (table_name, config_hash, datetime.now(timezone.utc).isoformat()),
+            )
+    finally:
+        conn.close()
+
+
+def clear_table_records(database: Path) -> None:
+    """
+    Forget every materialised entity table and its column statistics, e.g.
+    after the crate was tabulated again, which also brings the base tables
+    up to date.
+    """
+    if not Path(database).exists():
+        return
+
+    conn = sqlite3.connect(database, timeout=30)
+    try:
+        with conn:
+            conn.execute(f"DROP TABLE IF EXISTS {TABLES_TABLE}")
+            conn.execute(f"DROP TABLE IF EXISTS {COLUMN_STATS_TABLE}")
+            conn.execute(f"DROP TABLE IF EXISTS {STALE_TABLE}")
+    finally:
+        conn.close()
+
+
+def drop_table_record(database: Path, table_name: str) -> None:
+    """
+    Forget that table_name was materialised, so it is flattened again on
+    its next use.
+    """
+    conn = sqlite3.connect(database, timeout=30)
+    try:
+        with conn:
+            conn.execute(f"DELETE FROM {TABLES_TABLE} WHERE name = ?", (table_name,))
+            conn.execute(f"DELETE FROM {COLUMN_STATS_TABLE} WHERE name = ?", (table_name,))
+    except sqlite3.OperationalError:
+        pass
+    finally:
+        conn.close()
+
+
+def mark_base_stale(database: Path) -> None:
+    """
+    Record that only the materialised entity tables were updated, so the
+    crate must be tabulated again before another table is materialised.
+    """
+    conn = sqlite3.connect(database, timeout=30)
+    try:
+        with conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {STALE_TABLE} (since TEXT)")
+            conn.execute(f"INSERT INTO {STALE_TABLE} VALUES (?)", (datetime.now(timezone.utc).isoformat(),))
+    finally:
+        conn.close()
+
+
+def base_is_stale(database: Path) -> bool:
+    """
+    Return whether the database was updated incrementally since it was last
+    tabulated in full (see ``mark_base_stale``).
+    """
+    if not Path(database).exists():
+        return False
+
+    conn = sqlite3.connect(database)
+    try:
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (STALE_TABLE,)
+        ).fetchone() is not None
+    finally:
+        conn.close()
+
+
+def write_column_stats(database: Path, table_name: str, row_count: int, counts: dict) -> None:
+    """
+    Record the row count of table_name and the non-null count of each of its
+    columns, replacing earlier statistics of the table.
+    """
+    conn = sqlite3.connect(database, timeout=30)
+    try:
+        with conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {COLUMN_STATS_TABLE} "
+                "(name TEXT, column_name TEXT, row_count INTEGER, non_null INTEGER, "
+                "PRIMARY KEY (name, column_name))"
+            )
+            conn.execute(f"DELETE FROM {COLUMN_STATS_TABLE} WHERE name = ?", (table_name,))
+            conn.executemany(
+                f"INSERT INTO {COLUMN_STATS_TABLE} VALUES (?, ?, ?, ?)",
+                [(table_name, column, row_count, count) for column, count in counts.items()],
+            )
+    finally:
+        conn.close()
+
+
+def read_column_stats(
+    database: Path,
+    table_name: str,
+    conn: sqlite3.Connection | None = None,
+    ) -> tuple[int, dict] | None:
+    """
+    Return ``(row_count, {column: non_null_count})`` recorded for
+    table_name, in column order, or ``None`` when there are none. Read
+    through conn when given.
+    """
+    if conn is None and not Path(database).exists():
+        return None
+
+    with _reading(database, conn) as conn:
+        try:
+            rows = conn.execute(
+                f"SELECT column_name, row_count, non_null FROM {COLUMN_STATS_TABLE} "
+                "WHERE name = ? ORDER BY rowid",
+                (table_name,),
+            ).fetchall()
+        except sqlite3.Error:
+            return None
+
+    if not rows:
+        return None
+    return rows[0][1], {column: count for column, _, count in rows}
@@ -0,0 +1,147 @@
+# ========== Python Standard Library ==========
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from functools import cache
+from typing import TYPE_CHECKING, Hashable
+
+# ========== Third-Party Dependencies ==========
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@cache
+def _pandas_3() -> bool:
+    # Checked on first use, when pandas is already loaded by the frame
+    # being cached.
+    import pandas as pd
+
+    return int(pd.__version__.split(".")[0]) >= 3
+
+
+def _copy_on_write() -> bool:
+    # Always on from pandas 3.0; an option in pandas 2.x
+    import pandas as pd
+
+    return _pandas_3() or pd.options.mode.copy_on_write is True
+
+
+def _read_only(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a frame over read-only views of the numpy columns of df, so
+    writing to it raises instead of changing df. Extension arrays cannot be
+    made read-only and are copied; for Arrow-backed columns this is cheap.
+    """
+    import pandas as pd
+    from pandas.api.types import is_extension_array_dtype
+
+    columns = {}
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if is_extension_array_dtype(column.dtype):
+            columns[i] = column.array.copy()
+        else:
+            view = column.to_numpy(copy=False).view()
+            view.flags.writeable = False
+            columns[i] = view
+    out = pd.DataFrame(columns, index=df.index, copy=False)
+    out.columns = df.columns
+    return out
+
+
+def _isolated(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a frame through which a caller cannot modify df, without copying
+    its data: a shallow copy under Copy-on-Write, otherwise read-only views.
+    """
+    if _copy_on_write():
+        return df.copy(deep=False)
+    return _read_only(df)
+
+
+# -------------------------------------------------------------
+# In-memory cache of the DataFrames returned by the accessors,
+# so repeated calls in an interactive session skip SQLite and
+# the pandas clean-up steps.
+# -------------------------------------------------------------
+class FrameCache:
+    """
+    Least-recently-used cache of DataFrames bounded by memory use.
+
+    Frames are stored as handed in and every ``get`` returns a frame that
+    shares their data but cannot change it: a shallow copy under pandas
+    Copy-on-Write (always on from pandas 3), otherwise one whose numpy
+    columns are read-only, so writing to it raises ``ValueError``; call
+    ``.copy()`` on it first. When the total size exceeds ``max_bytes`` the least
+    recently used frames are evicted; a frame larger than the whole budget
+    is not cached.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Memory budget in bytes, as measured by
+        ``DataFrame.memory_usage(deep=True)``.
+    """
+
+    def __init__(self, max_bytes: int):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[Hashable, tuple[pd.DataFrame, int]] = OrderedDict()
+        # Shared by the threads of one corpus
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._frames
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        """
+        Return the cached frame for key, isolated from the cache, or ``None``.
+        """
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+        return _isolated(entry[0])
+
+    def put(self, key: Hashable, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cache df under key and return an isolated frame for the caller to use.
+        """
+        size = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            self.discard(key)
+            if size <= self.max_bytes:
+                self._frames[key] = (df, size)
+                self.current_bytes += size
+                while self.current_bytes > self.max_bytes:
+                    _, (_, evicted) = self._frames.popitem(last=False)
+                    self.current_bytes -= evicted
+        return _isolated(df)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Drop the frame cached under key, if any.
+        """
+        with self._lock:
+            entry = self._frames.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """
+        Drop every cached frame.
+        """
+        with self._lock:
+            self._frames.clear()
+            self.current_bytes = 0
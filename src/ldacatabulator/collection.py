@@ -0,0 +1,302 @@
+# ========== Python Standard Library ==========
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+# ========== Third-Party Dependencies ==========
+if TYPE_CHECKING:
+    import pandas as pd
+
+# ========== Project-Specific Imports ==========
+from .storage import enforce_quota
+from .tabulator import LDaCATabulator, build_corpus_database
+
+# -------------------------
+# Constants
+# -------------------------
+DOWNLOAD_WORKERS = 4
+CORPUS_COLUMN = "corpus"
+
+
+def _fetch_worker(url: str, options: dict) -> LDaCATabulator:
+    """
+    Download and extract one corpus, leaving its database build pending.
+    """
+    tab = LDaCATabulator(url, lazy=True, **options)
+    tab._defer_quota = True
+    tab._ensure_extracted()
+    return tab
+
+
+# -------------------------------------------------------------
+# Several corpora loaded side by side, with accessors that
+# combine their tables.
+# -------------------------------------------------------------
+class LDaCACollection:
+    """
+    A set of LDaCA corpora loaded together.
+
+    Use ``LDaCACollection.load`` (or ``load_many``) to download and
+    tabulate many corpora in parallel. A corpus that fails to load does not
+    stop the others: its exception is kept in ``errors`` instead.
+
+    Parameters
+    ----------
+    corpora : dict[str, LDaCATabulator] | None, optional
+        Loaded corpora keyed by URL.
+    errors : dict[str, Exception] | None, optional
+        Exceptions of corpora that failed, keyed by URL.
+
+    Attributes
+    ----------
+    corpora : dict[str, LDaCATabulator]
+        Loaded corpora keyed by URL, in the order the URLs were given.
+    errors : dict[str, Exception]
+        Exceptions raised while loading (or reading tables from) a corpus,
+        keyed by URL.
+    """
+
+    def __init__(self, corpora: dict | None = None, errors: dict | None = None):
+        self.corpora = dict(corpora or {})
+        self.errors = dict(errors or {})
+
+    def __len__(self) -> int:
+        return len(self.corpora)
+
+    def __iter__(self) -> Iterator[LDaCATabulator]:
+        return iter(self.corpora.values())
+
+    def __getitem__(self, url: str) -> LDaCATabulator:
+        return self.corpora[url]
+
+    def close(self):
+        """
+        Close the database connections of every corpus.
+        """
+        for tab in self.corpora.values():
+            tab.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # -----------------------------------------------
+    # Loading
+    # -----------------------------------------------
+    @classmethod
+    def load(
+        cls,
+        urls: Iterable[str],
+        max_workers: int = DOWNLOAD_WORKERS,
+        build_workers: int | None = None,
+        use_processes: bool = True,
+        **options,
+        ) -> "LDaCACollection":
+        """
+        Download, extract and tabulate many corpora in parallel.
+
+        Downloads run on up to ``max_workers`` threads. As soon as a corpus
+        is extracted, its database is built in a process pool, each worker
+        with its own ``ROCrateTabulator``, so the CPU-bound tabulation of
+        one corpus overlaps with the downloads of the others. Corpora that
+        are already cached are not rebuilt. Once all are loaded, other
+        corpora are evicted if the cache exceeds its quota; those of the
+        collection are kept.
+
+        Parameters
+        ----------
+        urls : iterable of str
+            Corpus ZIP URLs. Duplicates are loaded once.
+        max_workers : int, optional
+            Number of download threads. Default is 4.
+        build_workers : int | None, optional
+            Number of build processes. Default is the number of CPUs.
+        use_processes : bool, optional
+            Build databases in worker processes. Processes are started with
+            the ``spawn`` method, so scripts must guard their entry point
+            with ``if __name__ == "__main__":``. With ``False`` the builds
+            run on the download threads instead. Default is ``True``.
+        **options
+            Keyword arguments passed to every ``LDaCATabulator``, e.g.
+            ``extract="text"`` or ``offline=True``.
+
+        Returns
+        -------
+        LDaCACollection
+            The loaded corpora and the errors of those that failed.
+        """
+        urls = list(dict.fromkeys(urls))
+        options.pop("lazy", None)
+        corpora, errors = {}, {}
+
+        if use_processes:
+            builds = ProcessPoolExecutor(build_workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            builds = None
+
+        with ThreadPoolExecutor(max_workers) as downloads:
+            try:
+                pending = {}
+                fetches = {downloads.submit(_fetch_worker, url, options): url for url in urls}
+                for future in as_completed(fetches):
+                    url = fetches[future]
+                    try:
+                        tab = future.result()
+                    except Exception as e:
+                        errors[url] = e
+                        continue
+                    if not tab._needs_build:
+                        corpora[url] = tab
+                    elif builds is not None:
+                        args = (
+                            str(tab.extract_to),
+                            str(tab.database),
+                            tab._pending_record,
+                            tab._pending_update,
+                        )
+                        pending[builds.submit(build_corpus_database, *args)] = (url, tab)
+                    else:
+                        pending[downloads.submit(tab._ensure_database)] = (url, tab)
+
+                for future in as_completed(pending):
+                    url, tab = pending[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors[url] = e
+                        continue
+                    tab._needs_build = False
+                    tab._pending_record = None
+                    tab._pending_update = None
+                    corpora[url] = tab
+            finally:
+                if builds is not None:
+                    builds.shutdown()
+
+        enforce_quota(options.get("cache_quota"), options.get("cache_dir"), keep=urls)
+        return cls(
+            {url: corpora[url] for url in urls if url in corpora},
+            {url: errors[url] for url in urls if url in errors},
+        )
+
+    @classmethod
+    async def aload(
+        cls,
+        urls: Iterable[str],
+        max_concurrency: int = DOWNLOAD_WORKERS,
+        build_executor=None,
+        **options,
+        ) -> "LDaCACollection":
+        """
+        Asynchronous ``load``: load many corpora with
+        ``LDaCATabulator.aload``, at most ``max_concurrency`` downloads at a
+        time. ``build_executor`` and ``options`` are passed to each load.
+        The cache quota is enforced once, after all are loaded.
+        """
+        import asyncio
+
+        urls = list(dict.fromkeys(urls))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(
+            *(
+                LDaCATabulator.aload(
+                    url, semaphore=semaphore, build_executor=build_executor, prune=False, **options
+                )
+                for url in urls
+            ),
+            return_exceptions=True,
+        )
+        await asyncio.get_running_loop().run_in_executor(
+            None, enforce_quota, options.get("cache_quota"), options.get("cache_dir"), urls
+        )
+        corpora = {url: r for url, r in zip(urls, results) if isinstance(r, LDaCATabulator)}
+        errors = {url: r for url, r in zip(urls, results) if isinstance(r, Exception)}
+        return cls(corpora, errors)
+
+    # -----------------------------------------------
+    # Combined tables
+    # -----------------------------------------------
+    @staticmethod
+    def corpus_name(tab: LDaCATabulator) -> str:
+        """
+        Return the label used in the ``corpus`` column for a corpus.
+        """
+        if tab.extract_to is not None:
+            return Path(tab.extract_to).name
+        return LDaCATabulator._names_from_zip_url(tab.url)[0]
+
+    def _combine(self, accessor: str, **kwargs) -> pd.DataFrame:
+        import pandas as pd
+
+        frames = []
+        for url, tab in self.corpora.items():
+            try:
+                df = getattr(tab, accessor)(**kwargs)
+            except Exception as e:
+                self.errors[url] = e
+                continue
+            if df is None:
+                continue
+            df = df.copy(deep=False)
+            df.insert(0, CORPUS_COLUMN, self.corpus_name(tab))
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame(columns=[CORPUS_COLUMN])
+        return pd.concat(frames, ignore_index=True, sort=False)
+
+    def get_text(self, **kwargs) -> pd.DataFrame:
+        """
+        Return the text tables of all corpora stacked, with a ``corpus``
+        column. Keyword arguments are passed to ``LDaCATabulator.get_text``.
+        """
+        return self._combine("get_text", **kwargs)
+
+    def get_people(self, **kwargs) -> pd.DataFrame:
+        """
+        Return the Person tables of all corpora stacked, with a ``corpus``
+        column.
+        """
+        return self._combine("get_people", **kwargs)
+
+    def get_organization(self, **kwargs) -> pd.DataFrame:
+        """
+        Return the Organization tables of all corpora stacked, with a
+        ``corpus`` column.
+        """
+        return self._combine("get_organization", **kwargs)
+
+    def get_speaker(self, **kwargs) -> pd.DataFrame:
+        """
+        Return the Speaker tables of all corpora stacked, with a ``corpus``
+        column.
+        """
+        return self._combine("get_speaker", **kwargs)
+
+
+def load_many(
+    urls: Iterable[str],
+    max_workers: int = DOWNLOAD_WORKERS,
+    **options,
+    ) -> LDaCACollection:
+    """
+    Load many corpora in parallel. See ``LDaCACollection.load``.
+    """
+    return LDaCACollection.load(urls, max_workers=max_workers, **options)
+
+
+async def aload_many(
+    urls: Iterable[str],
+    max_concurrency: int = DOWNLOAD_WORKERS,
+    **options,
+    ) -> LDaCACollection:
+    """
+    Load many corpora without blocking the event loop. See
+    ``LDaCACollection.aload``.
+    """
+    return await LDaCACollection.aload(urls, max_concurrency=max_concurrency, **options)
@@ -0,0 +1,153 @@
+# ========== Python Standard Library ==========
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Constants
+# -------------------------
+# Settings of every read connection: map up to 256 MiB of the database
+# file, keep up to 64 MiB of pages in its cache (negative values are KiB)
+# and sort or group in memory.
+READ_PRAGMAS = {
+    "mmap_size": 256 * 1024**2,
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+}
+# Files SQLite keeps next to a database in WAL or rollback journal mode
+DATABASE_SIDECARS = ("-wal", "-shm", "-journal")
+
+
+def enable_wal(database: Path) -> bool:
+    """
+    Switch a database to write-ahead logging, so readers neither block nor
+    are blocked by the connection that materialises tables. The journal
+    mode is stored in the file; returns ``False`` if it could not be set
+    (e.g. while another connection holds a lock).
+    """
+    conn = sqlite3.connect(database, timeout=30)
+    try:
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    except sqlite3.OperationalError:
+        logger.debug("Could not enable WAL for %s.", database, exc_info=True)
+        return False
+    finally:
+        conn.close()
+    return mode.lower() == "wal"
+
+
+def remove_database(database: Path) -> None:
+    """
+    Delete a database together with its WAL, shared-memory and journal
+    files, so a database later built at the same path does not pick up a
+    stale log.
+    """
+    database = Path(database)
+    database.unlink(missing_ok=True)
+    for suffix in DATABASE_SIDECARS:
+        database.with_name(database.name + suffix).unlink(missing_ok=True)
+
+
+def publish_database(source: Path, database: Path) -> None:
+    """
+    Move a complete database built at source into place with an atomic
+    rename. The WAL and shared-memory files of the database it replaces are
+    removed first, so the new file never picks up the old log; connections
+    still open on the old file keep reading it until they are replaced.
+    """
+    database = Path(database)
+    for suffix in DATABASE_SIDECARS:
+        database.with_name(database.name + suffix).unlink(missing_ok=True)
+    os.replace(source, database)
+
+
+# -------------------------------------------------------------
+# Read-only connections shared by the accessors of one corpus,
+# instead of a new connection (and a cold page cache) per call.
+# -------------------------------------------------------------
+class ReadConnections:
+    """
+    One read-only connection to a corpus database per thread.
+
+    Connections are opened with a ``mode=ro`` URI and ``query_only``, with
+    the settings in ``READ_PRAGMAS``, and reused by later reads on the same
+    thread. A connection is replaced when the database was rebuilt since it
+    was opened: after ``invalidate()``, or when the file at the path is a
+    different one.
+
+    ``close()`` closes the connections of every thread. Call it once no
+    read is running; a later read opens a new connection.
+
+    Parameters
+    ----------
+    database : path-like
+        Path to the SQLite database.
+    """
+
+    def __init__(self, database: Path):
+        self.database = Path(database)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open = set()
+        self._generation = 0
+
+    def _identity(self) -> tuple:
+        st = os.stat(self.database)
+        return self._generation, st.st_dev, st.st_ino
+
+    def _connect(self) -> sqlite3.Connection:
+        uri = f"{self.database.resolve().as_uri()}?mode=ro"
+        # Only the owning thread reads through it; close() may run elsewhere
+        conn = sqlite3.connect(uri, uri=True, timeout=30, check_same_thread=False)
+        for name, value in READ_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        conn.execute("PRAGMA query_only=1")
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it if needed.
+        """
+        identity = self._identity()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.identity == identity:
+            return conn
+        if conn is not None:
+            self._discard(conn)
+        conn = self._connect()
+        with self._lock:
+            self._open.add(conn)
+        self._local.conn, self._local.identity = conn, identity
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._open.discard(conn)
+        # Closing twice (after close()) is a no-op
+        conn.close()
+        self._local.conn = None
+
+    def invalidate(self) -> None:
+        """
+        Mark every open connection as outdated, e.g. after the database was
+        rebuilt. Each thread replaces its connection on its next read.
+        """
+        with self._lock:
+            self._generation += 1
+
+    def close(self) -> None:
+        """
+        Close the connections of every thread.
+        """
+        with self._lock:
+            conns, self._open = self._open, set()
+            self._generation += 1
+        for conn in conns:
+            conn.close()
+
+    def __len__(self) -> int:
+        return len(self._open)
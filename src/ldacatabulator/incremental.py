@@ -0,0 +1,499 @@
+# ========== Python Standard Library ==========
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+# ========== Project-Specific Imports ==========
+from .bookkeeping import (
+    config_hash,
+    drop_table_record,
+    mark_base_stale,
+    read_column_stats,
+    read_table_records,
+    write_column_stats,
+)
+from .metadata import DESCRIPTOR_ID, CrateGraph, reference_id, text_references
+from .query import non_null_counts, quote_identifier, table_columns
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Constants
+# -------------------------
+ENTITY_ID_COLUMN = "entity_id"
+# Column by which the base tables of rocrate_tabular name the entity a row describes
+SOURCE_ID_COLUMN = "source_id"
+# Above this share of changed entities a full rebuild is not slower
+MAX_CHANGED_FRACTION = 0.5
+PARTIAL_SCHEMA = "partial"
+IDS_TABLE = "_ldaca_update_ids"
+# Kept next to the database: CRC-32 and size of each extracted file
+MEMBERS_SUFFIX = ".members.json"
+
+
+# -------------------------------------------------------------
+# Differences between two versions of a crate graph
+# -------------------------------------------------------------
+@dataclass
+class GraphDiff:
+    """
+    Entities added, changed and removed between two versions of a crate,
+    by ``@id``.
+    """
+
+    added: set = field(default_factory=set)
+    changed: set = field(default_factory=set)
+    removed: set = field(default_factory=set)
+    size: int = 0
+
+    @property
+    def touched(self) -> set:
+        return self.added | self.changed | self.removed
+
+    @property
+    def fraction(self) -> float:
+        """
+        Share of the entities of the larger version that differ.
+        """
+        return len(self.touched) / self.size if self.size else 0.0
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def diff_graphs(old: CrateGraph, new: CrateGraph) -> GraphDiff:
+    """
+    Compare two versions of a crate graph node by node. Nodes are compared
+    by content, so a change of key order is not a change.
+    """
+    diff = GraphDiff(size=max(len(old), len(new)))
+    for node_id, node in new.nodes.items():
+        previous = old.get(node_id)
+        if previous is None:
+            diff.added.add(node_id)
+        elif previous != node:
+            diff.changed.add(node_id)
+    diff.removed = set(old.nodes) - set(new.nodes)
+    return diff
+
+
+def text_files(graph: CrateGraph, text_props: Iterable[str]) -> set[str]:
+    """
+    Return the paths of the text files the entities of graph refer to.
+    """
+    return {path for node in graph for path in text_references(node, text_props)}
+
+
+def changed_files(old_members: dict, new_members: dict, graph: CrateGraph, text_props: Iterable[str]) -> set[str]:
+    """
+    Return the text files of graph whose content differs between two
+    versions of the crate, or that only one of them has.
+
+    Versions are compared by the ``{name: (crc32, size)}`` of their
+    extracted files, as recorded in the ZIP (see ``ingest.fetch_archive``),
+    so no file is read.
+    """
+    return {path for path in text_files(graph, text_props) if old_members.get(path) != new_members.get(path)}
+
+
+def file_members(directory: Path, names: Iterable[str]) -> dict:
+    """
+    Return ``{name: (crc32, size)}`` of the named files in directory, read
+    from disk; for folders extracted before members were recorded.
+    """
+    members = {}
+    for name in names:
+        path = Path(directory) / name
+        if not path.is_file():
+            continue
+        crc = size = 0
+        with open(path, "rb") as f:
+            while block := f.read(1024 * 1024):
+                crc = zlib.crc32(block, crc)
+                size += len(block)
+        members[name] = (crc, size)
+    return members
+
+
+def write_members(path: Path, members: dict) -> None:
+    """
+    Store the ``{name: (crc32, size)}`` of an extracted corpus.
+    """
+    tmp = Path(path).with_name(f".{Path(path).name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(members, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_members(path: Path) -> dict | None:
+    """
+    Return the members stored by ``write_members``, or ``None`` if there are
+    none.
+    """
+    try:
+        members = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return {name: tuple(value) for name, value in members.items()}
+
+
+@dataclass
+class UpdatePlan:
+    """
+    What changed in a new version of a corpus, and what is needed to patch
+    the database of the previous version. Plans are picklable, so worker
+    processes can apply them.
+
+    Attributes
+    ----------
+    diff : GraphDiff
+        Changed entities.
+    files : set[str]
+        Text files whose content changed.
+    configs : list[dict]
+        Configurations an entity table of the database may have been
+        materialised with; a table is patched with the one matching its
+        recorded config hash.
+    text_prop : str
+        Text property the tables were materialised with.
+    text_props : tuple[str, ...]
+        Properties referring to text files.
+    """
+
+    diff: GraphDiff
+    files: set
+    configs: list
+    text_prop: str
+    text_props: tuple = ()
+
+
+def plan_update(
+    old_graph: CrateGraph,
+    new_graph: CrateGraph,
+    old_members: dict,
+    new_members: dict,
+    configs: list,
+    text_prop: str,
+    text_props: tuple = (),
+    ) -> UpdatePlan | None:
+    """
+    Compare two versions of a corpus, given their graphs and the
+    ``{name: (crc32, size)}`` of their extracted files, and return how to
+    update its database in place, or ``None`` when so much changed that a
+    full rebuild is preferable.
+    """
+    diff = diff_graphs(old_graph, new_graph)
+    if diff.fraction > MAX_CHANGED_FRACTION:
+        logger.info("%d of %d entities changed; rebuilding in full.", len(diff.touched), diff.size)
+        return None
+    files = changed_files(old_members, new_members, new_graph, text_props)
+    return UpdatePlan(diff, files, configs, text_prop, tuple(text_props))
+
+
+# -------------------------------------------------------------
+# Rows to replace and the partial crate they are built from
+# -------------------------------------------------------------
+def _expanded_props(config: dict, table_name: str, text_props: Iterable[str]) -> tuple[str, ...]:
+    table = (config or {}).get("tables", {}).get(table_name) or {}
+    return tuple(dict.fromkeys([*table.get("expand_props", []), *text_props]))
+
+
+def affected_ids(plan: UpdatePlan, graph: CrateGraph, table_name: str, config: dict) -> set[str]:
+    """
+    Return the ids of the rows of an entity table that must be replaced: the
+    changed entities plus those of the table whose expanded properties or
+    text files changed.
+    """
+    touched = plan.diff.touched
+    props = _expanded_props(config, table_name, plan.text_props)
+    ids = set(touched)
+    for node in graph.of_type(table_name):
+        if node["@id"] in ids:
+            continue
+        refs = [reference_id(v) for prop in props for v in _as_list(node.get(prop))]
+        if any(ref in touched for ref in refs) or any(
+            path in plan.files for path in text_references(node, plan.text_props)
+        ):
+            ids.add(node["@id"])
+    return ids
+
+
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def write_partial_crate(
+    graph: CrateGraph,
+    extract_to: Path,
+    dest: Path,
+    entities: dict[str, set[str]],
+    configs: dict[str, dict],
+    text_props: Iterable[str],
+    extra: Iterable[str] = (),
+    ) -> None:
+    """
+    Write a crate holding only the given entities of each table, the
+    entities their expanded properties refer to and their text files.
+
+    Parameters
+    ----------
+    entities : dict[str, set[str]]
+        Ids to include per entity table.
+    configs : dict[str, dict]
+        Configuration each table is materialised with.
+    extra : iterable of str, optional
+        Further ids to include on their own, for the base tables.
+    """
+    text_props = tuple(text_props)
+    keep = {DESCRIPTOR_ID, *(node_id for node_id in extra if node_id in graph)}
+    root = graph.root
+    if root is not None:
+        keep.add(root["@id"])
+
+    files = set()
+    for table_name, ids in entities.items():
+        props = _expanded_props(configs[table_name], table_name, text_props)
+        for node_id in ids:
+            node = graph.get(node_id)
+            if node is None:
+                continue
+            keep.add(node_id)
+            for prop in props:
+                keep.update(ref for ref in map(reference_id, _as_list(node.get(prop))) if ref in graph)
+            files.update(text_references(node, text_props))
+
+    dest.mkdir(parents=True, exist_ok=True)
+    nodes = [node for node_id, node in graph.nodes.items() if node_id in keep]
+    metadata = {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": nodes}
+    (dest / DESCRIPTOR_ID).write_text(json.dumps(metadata), encoding="utf-8")
+
+    for path in files:
+        source = Path(extract_to) / path
+        if not source.is_file():
+            continue
+        target = dest / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+
+# -------------------------------------------------------------
+# Patching the materialised entity tables
+# -------------------------------------------------------------
+def _merge_table(conn: sqlite3.Connection, table_name: str, ids: set[str], database: Path) -> bool:
+    """
+    Replace the rows of ids in table_name with those of the attached
+    partial database, adding any new columns. Returns ``False`` when the
+    table has no entity id column to match rows by.
+    """
+    columns = table_columns(conn, table_name)
+    if ENTITY_ID_COLUMN not in columns:
+        return False
+    partial_columns = table_columns(conn, table_name, PARTIAL_SCHEMA)
+    if partial_columns and ENTITY_ID_COLUMN not in partial_columns:
+        return False
+
+    table = quote_identifier(table_name)
+    for column in partial_columns:
+        if column not in columns:
+            conn.execute(f"ALTER TABLE main.{table} ADD COLUMN {quote_identifier(column)}")
+            columns.append(column)
+
+    conn.execute(f"DELETE FROM temp.{IDS_TABLE}")
+    conn.executemany(f"INSERT OR IGNORE INTO temp.{IDS_TABLE} VALUES (?)", ((i,) for i in ids))
+    matching = f" WHERE {ENTITY_ID_COLUMN} IN (SELECT id FROM temp.{IDS_TABLE})"
+
+    stats = read_column_stats(database, table_name)
+    _, removed = non_null_counts(conn, table_name, columns, matching)
+    removed_rows = conn.execute(f"SELECT COUNT(*) FROM main.{table}{matching}").fetchone()[0]
+    conn.execute(f"DELETE FROM main.{table}{matching}")
+    if partial_columns:
+        selected = ", ".join(quote_identifier(c) for c in partial_columns)
+        conn.execute(
+            f"INSERT INTO main.{table} ({selected}) "
+            f"SELECT {selected} FROM {PARTIAL_SCHEMA}.{table}{matching}"
+        )
+    added_rows, added = non_null_counts(conn, table_name, columns, matching)
+
+    # The stored null counts are adjusted by the replaced rows only
+    if stats is not None:
+        row_count, counts = stats
+        counts = {
+            c: counts.get(c, 0) - removed.get(c, 0) + added.get(c, 0) for c in columns
+        }
+        conn.commit()
+        write_column_stats(database, table_name, row_count - removed_rows + added_rows, counts)
+    return True
+
+
+def _merge_base_tables(conn: sqlite3.Connection, ids: set[str], entity_tables: set[str]) -> bool:
+    """
+    Replace the rows describing ids in the base tables of the database (the
+    tables ``crate_to_db`` fills, such as the ``property`` table of
+    rocrate_tabular) with those of the attached partial database. Returns
+    ``False`` when a base table has no source id column to match rows by.
+    """
+    tables = [
+        name
+        for (name,) in conn.execute(f"SELECT name FROM {PARTIAL_SCHEMA}.sqlite_master WHERE type = 'table'")
+        if name not in entity_tables and not name.startswith(("sqlite_", "_ldaca_"))
+    ]
+    conn.execute(f"DELETE FROM temp.{IDS_TABLE}")
+    conn.executemany(f"INSERT OR IGNORE INTO temp.{IDS_TABLE} VALUES (?)", ((i,) for i in ids))
+    matching = f" WHERE {SOURCE_ID_COLUMN} IN (SELECT id FROM temp.{IDS_TABLE})"
+
+    selections = {}
+    for table_name in tables:
+        columns = table_columns(conn, table_name)
+        info = conn.execute(
+            f"PRAGMA {PARTIAL_SCHEMA}.table_info({quote_identifier(table_name)})"
+        ).fetchall()
+        if SOURCE_ID_COLUMN not in columns or SOURCE_ID_COLUMN not in (row[1] for row in info):
+            return False
+        # Integer primary keys are row ids, assigned afresh in the database
+        selections[table_name] = ", ".join(
+            quote_identifier(row[1])
+            for row in info
+            if row[1] in columns and not (row[5] and row[2].upper() == "INTEGER")
+        )
+
+    for table_name, selected in selections.items():
+        table = quote_identifier(table_name)
+        conn.execute(f"DELETE FROM main.{table}{matching}")
+        conn.execute(
+            f"INSERT INTO main.{table} ({selected}) "
+            f"SELECT {selected} FROM {PARTIAL_SCHEMA}.{table}{matching}"
+        )
+    return True
+
+
+def apply_update(
+    plan: UpdatePlan,
+    graph: CrateGraph,
+    extract_to: Path,
+    database: Path,
+    new_tabulator: Callable,
+    ) -> list[str]:
+    """
+    Update the materialised entity tables of a corpus database in place
+    from a new version of the corpus.
+
+    The rows of changed entities are rebuilt by tabulating a partial crate
+    holding only those entities (see ``write_partial_crate``) and replace
+    the old rows, matched by ``entity_id``. Tables that cannot be matched
+    that way, or whose configuration is unknown, are dropped from the
+    bookkeeping and materialised again on their next use. The rows of the
+    changed entities in the base tables of the tabulator are replaced the
+    same way, matched by ``source_id``, so tables materialised later see
+    the new version. Should a base table have no such column, the
+    database is marked instead so that the crate is tabulated again
+    before another table is materialised (see
+    ``bookkeeping.mark_base_stale``).
+
+    Parameters
+    ----------
+    plan : UpdatePlan
+        What changed (see ``plan_update``).
+    graph : CrateGraph
+        Graph of the new version.
+    extract_to : pathlib.Path
+        Folder of the new version.
+    database : pathlib.Path
+        Database of the previous version, updated in place.
+    new_tabulator : callable
+        Returns a fresh ``ROCrateTabulator``.
+
+    Returns
+    -------
+    list[str]
+        The tables that were patched.
+    """
+    if not plan.diff and not plan.files:
+        return []
+
+    configs, entities = {}, {}
+    for table_name, table_hash in read_table_records(database).items():
+        config = next(
+            (c for c in plan.configs if config_hash(c, table_name, plan.text_prop) == table_hash), None
+        )
+        if config is None:
+            drop_table_record(database, table_name)
+            continue
+        ids = affected_ids(plan, graph, table_name, config)
+        if ids:
+            configs[table_name], entities[table_name] = config, ids
+
+    patched, stale = [], []
+    # Tables materialised with the same configuration share a partial build
+    groups = {}
+    for table_name, config in configs.items():
+        groups.setdefault(json.dumps(config, sort_keys=True, default=str), []).append(table_name)
+    # The first build also holds every changed entity, for the base tables
+    base_ids = plan.diff.touched
+    base_patched = not base_ids
+    if base_ids and not groups:
+        groups[None] = []
+
+    with tempfile.TemporaryDirectory(prefix=".update-", dir=Path(database).parent) as tmp:
+        for n, tables in enumerate(groups.values()):
+            crate = Path(tmp) / f"crate-{n}"
+            partial_db = Path(tmp) / f"partial-{n}.db"
+            write_partial_crate(
+                graph,
+                extract_to,
+                crate,
+                {t: entities[t] for t in tables},
+                configs,
+                plan.text_props,
+                extra=base_ids if n == 0 else (),
+            )
+            tb = new_tabulator()
+            tb.config = configs[tables[0]] if tables else next(iter(plan.configs), {})
+            tb.text_prop = plan.text_prop
+            tb.crate_to_db(str(crate), str(partial_db))
+            built = []
+            for table_name in tables:
+                try:
+                    tb.entity_table(table_name)
+                    built.append(table_name)
+                except Exception:
+                    # No entity of the table is left in the partial crate
+                    logger.debug("No %s rows in the partial crate.", table_name)
+            close = getattr(getattr(tb, "db", None), "close", None)
+            if close is not None:
+                close()
+
+            conn = sqlite3.connect(database, timeout=30)
+            try:
+                conn.execute(f"ATTACH DATABASE ? AS {PARTIAL_SCHEMA}", (str(partial_db),))
+                conn.execute(f"CREATE TEMP TABLE {IDS_TABLE} (id TEXT PRIMARY KEY)")
+                for table_name in tables:
+                    # Rows that should exist but were not built cannot be patched in
+                    expected = entities[table_name] & set(graph.types.get(table_name, ()))
+                    if table_name not in built and expected:
+                        stale.append(table_name)
+                    elif _merge_table(conn, table_name, entities[table_name], database):
+                        patched.append(table_name)
+                    else:
+                        stale.append(table_name)
+                if n == 0 and base_ids:
+                    base_patched = _merge_base_tables(conn, base_ids, set(built))
+                conn.commit()
+            finally:
+                conn.close()
+
+    for table_name in stale:
+        drop_table_record(database, table_name)
+    if not base_patched:
+        mark_base_stale(database)
+    return patched
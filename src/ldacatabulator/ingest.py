@@ -0,0 +1,1186 @@
+# ========== Python Standard Library ==========
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import shutil
+import struct
+import time
+import zipfile
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+# ========== Third-Party Dependencies ==========
+if TYPE_CHECKING:
+    import requests
+
+# ========== Project-Specific Imports ==========
+from .metadata import CrateGraph, text_references
+from .stats import LoadStats
+
+# -------------------------
+# Constants
+# -------------------------
+CHUNK_SIZE = 1024 * 1024
+RANGE_BLOCK_SIZE = 1024 * 1024
+MAX_RANGE_BLOCK_SIZE = 16 * 1024 * 1024
+REQUEST_TIMEOUT = 20
+
+LOCAL_HEADER_SIG = b"PK\x03\x04"
+DATA_DESCRIPTOR_SIG = b"PK\x07\x08"
+ARCHIVE_END_SIGS = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06", b"PK\x06\x07")
+END_RECORD_SIG = b"PK\x05\x06"
+# End of central directory record without comment, and the longest comment
+END_RECORD_SIZE = 22
+MAX_COMMENT_SIZE = 0xFFFF
+
+FLAG_ENCRYPTED = 0x01
+FLAG_DATA_DESCRIPTOR = 0x08
+FLAG_UTF8 = 0x800
+ZIP64_EXTRA_ID = 0x0001
+
+METADATA_FILE = "ro-crate-metadata.json"
+PREVIEW_FILE = "ro-crate-preview.html"
+EXTRACT_POLICIES = ("all", "text", "metadata")
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+PART_SUFFIX = ".zip.part"
+# Small reads keep most of the received bytes when a connection drops
+PART_CHUNK_SIZE = 64 * 1024
+
+
+def __getattr__(name: str):
+    # requests is imported where it is used, so importing this module stays
+    # cheap; ``ingest.requests`` still resolves to it on first access.
+    if name == "requests":
+        import requests
+
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# -------------------------------------------------------------
+# Retries
+# -------------------------------------------------------------
+class IncompleteDownload(IOError):
+    """
+    Raised when a response ends before the size the server announced.
+    """
+
+
+class ChecksumMismatch(ValueError):
+    """
+    Raised when a downloaded archive does not match the expected checksum.
+    """
+
+
+class RangeUnavailable(Exception):
+    """
+    Raised when a range request is answered with the whole file, or with
+    bytes of another version of it. Not an ``OSError``, which ``zipfile``
+    would turn into ``BadZipFile``.
+    """
+
+
+def strong_etag(etag: str | None) -> str | None:
+    """
+    Return etag if it is a strong validator, the only kind ``If-Range``
+    accepts; a server must ignore a weak one (``W/"..."``) and send the
+    whole file.
+    """
+    return etag if etag and not etag.startswith("W/") else None
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """
+    Return whether error is a transient network failure worth retrying.
+    """
+    import requests
+
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is not None and (status >= 500 or status == 429)
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            IncompleteDownload,
+        ),
+    )
+
+
+def _backoff(attempt: int) -> None:
+    """
+    Sleep before retry number ``attempt + 1``, doubling the delay each time.
+    """
+    time.sleep(min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def _with_retries(func, retries: int = MAX_RETRIES, on_retry=None):
+    """
+    Call func, retrying transient failures up to ``retries`` times with
+    exponential backoff. on_retry is called before each new attempt.
+    """
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= retries or not _is_retryable(e):
+                raise
+            _backoff(attempt)
+            attempt += 1
+            if on_retry is not None:
+                on_retry()
+
+
+# -------------------------------------------------------------
+# Member selection
+# -------------------------------------------------------------
+class MemberSelector:
+    """
+    Decide which archive members of a corpus are extracted.
+
+    ``ro-crate-metadata.json`` and ``ro-crate-preview.html`` are always
+    extracted. Other members follow, in order of precedence, the ``exclude``
+    patterns, the ``include`` patterns and then the ``extract`` policy:
+
+    - ``"all"``: every member.
+    - ``"text"``: only the files referenced by the given text properties
+      (e.g. ``ldac:mainText``) of entities in the crate graph.
+    - ``"metadata"``: no other member.
+
+    Parameters
+    ----------
+    extract : {"all", "text", "metadata"}, optional
+        Extraction policy. Default is ``"all"``.
+    text_props : tuple[str, ...], optional
+        Properties whose ``@id`` references select files under ``"text"``.
+    include : list[str] | None, optional
+        Glob patterns of members to extract regardless of the policy.
+    exclude : list[str] | None, optional
+        Glob patterns of members never to extract, e.g. ``"Audio/*"``.
+    """
+
+    def __init__(
+        self,
+        extract: str = "all",
+        text_props: tuple[str, ...] = (),
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        ):
+        if extract not in EXTRACT_POLICIES:
+            raise ValueError(f"extract must be one of {EXTRACT_POLICIES}, not {extract!r}")
+        self.extract = extract
+        self.text_props = tuple(text_props)
+        self.include = sorted(include or [])
+        self.exclude = sorted(exclude or [])
+        self.referenced: set[str] | None = None
+        self.graph: CrateGraph | None = None
+        self._deferred = False
+
+    @property
+    def key(self) -> str:
+        """
+        Stable description of the selection, recorded with cached copies.
+        """
+        spec = {"extract": self.extract, "include": self.include, "exclude": self.exclude}
+        if self.extract == "text":
+            spec["text_props"] = list(self.text_props)
+        return json.dumps(spec)
+
+    @property
+    def needs_metadata(self) -> bool:
+        return self.extract == "text" and self.referenced is None
+
+    def load_metadata(self, data: bytes) -> None:
+        """
+        Collect the files referenced by the text properties in the crate
+        graph, keeping the parsed graph in ``graph`` for later lookups.
+        """
+        self.graph = CrateGraph.from_bytes(data)
+        self.referenced = {path for item in self.graph for path in text_references(item, self.text_props)}
+
+    def __call__(self, name: str) -> bool:
+        if name in (METADATA_FILE, PREVIEW_FILE):
+            return True
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in self.exclude):
+            return False
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in self.include):
+            return True
+        if self.extract == "all":
+            return True
+        if self.extract == "metadata" or name.endswith("/"):
+            return False
+        if self.referenced is None:
+            # Metadata not seen yet: keep the member and decide in prune().
+            self._deferred = True
+            return True
+        return name in self.referenced
+
+    def prune(self, dest: Path) -> int:
+        """
+        Remove extracted files that were kept before the metadata arrived
+        but are not selected.
+
+        Returns
+        -------
+        int
+            Number of removed files.
+        """
+        if not self._deferred or self.referenced is None:
+            return 0
+        removed = 0
+        for path in sorted(dest.rglob("*"), reverse=True):
+            if path.is_file() and not self(path.relative_to(dest).as_posix()):
+                path.unlink()
+                removed += 1
+            elif path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+        return removed
+
+
+def _member_path(dest: Path, name: str) -> Path | None:
+    """
+    Map an archive member name to a path inside dest, dropping absolute and
+    parent-directory components the same way ``zipfile`` does.
+    """
+    parts = [
+        part
+        for part in PurePosixPath(name.replace("\\", "/")).parts
+        if part not in ("/", "", ".", "..")
+    ]
+    return dest.joinpath(*parts) if parts else None
+
+
+# -------------------------------------------------------------
+# Seekable view of a remote file backed by HTTP range requests
+# -------------------------------------------------------------
+class HTTPRangeReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a URL that supports range requests.
+
+    ``zipfile.ZipFile`` can open it directly: the central directory at the
+    end of the archive is fetched first, and afterwards only the bytes of
+    the members that are actually read are downloaded. Consecutive reads
+    double the request size up to ``MAX_RANGE_BLOCK_SIZE`` so large members
+    are fetched in few requests.
+
+    Parameters
+    ----------
+    url : str
+        URL of the remote file.
+    size : int
+        Total size of the remote file in bytes.
+    etag : str | None, optional
+        ETag of the file, so a file replaced mid-download is detected
+        instead of mixing bytes from two versions. A strong ETag is sent as
+        ``If-Range``; a weak one is compared with the ETag of each response.
+    retries : int, optional
+        How often a failed or truncated block request is retried, with
+        exponential backoff. Default is ``MAX_RETRIES``.
+    stats : LoadStats | None, optional
+        Statistics whose ``bytes_downloaded`` counts the fetched blocks.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int,
+        etag: str | None = None,
+        retries: int = MAX_RETRIES,
+        stats: LoadStats | None = None,
+        ):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.etag = etag
+        self.retries = retries
+        self.stats = stats
+        self.bytes_fetched = 0
+        import requests
+
+        self._session = requests.Session()
+        self._pos = 0
+        self._block = b""
+        self._block_start = 0
+        self._block_size = RANGE_BLOCK_SIZE
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError("Negative seek position")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        wanted = len(buffer)
+        if wanted == 0 or self._pos >= self.size:
+            return 0
+
+        offset = self._pos - self._block_start
+        if not 0 <= offset < len(self._block):
+            self._fetch(self._pos, wanted)
+            offset = 0
+
+        data = self._block[offset:offset + wanted]
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def _fetch(self, start: int, wanted: int) -> None:
+        if start == self._block_start + len(self._block):
+            self._block_size = min(self._block_size * 2, MAX_RANGE_BLOCK_SIZE)
+        else:
+            self._block_size = RANGE_BLOCK_SIZE
+
+        end = min(start + max(wanted, self._block_size), self.size) - 1
+        headers = {"Range": f"bytes={start}-{end}"}
+        if strong_etag(self.etag):
+            headers["If-Range"] = self.etag
+
+        def request() -> bytes:
+            with self._session.get(self.url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+                resp.raise_for_status()
+                etag = resp.headers.get("ETag")
+                # Weak comparison: the same version, however it is tagged
+                changed = self.etag and etag and etag.removeprefix("W/") != self.etag.removeprefix("W/")
+                if resp.status_code != 206 or changed:
+                    raise RangeUnavailable(
+                        f"{self.url} changed or stopped honouring range requests during download."
+                    )
+                block = resp.content
+            if len(block) != end - start + 1:
+                raise IncompleteDownload(
+                    f"Expected {end - start + 1} bytes from {self.url}, received {len(block)}."
+                )
+            return block
+
+        self._block = _with_retries(request, self.retries)
+        self._block_start = start
+        self.bytes_fetched += len(self._block)
+        if self.stats is not None:
+            self.stats.add("bytes_downloaded", len(self._block))
+
+    def close(self) -> None:
+        self._session.close()
+        super().close()
+
+
+def extract_zipfile(
+    zf: zipfile.ZipFile,
+    dest: Path,
+    selector: MemberSelector | None = None,
+    members: dict | None = None,
+    ) -> int:
+    """
+    Extract the members of an open archive accepted by selector, adding the
+    ``(crc32, size)`` of each extracted file to members when given.
+
+    The crate metadata is read first when the selector needs it, so only
+    the selected members are ever read from the archive.
+
+    Returns
+    -------
+    int
+        Number of extracted members.
+    """
+    if selector is not None and selector.needs_metadata and METADATA_FILE in zf.NameToInfo:
+        selector.load_metadata(zf.read(METADATA_FILE))
+
+    count = 0
+    for info in zf.infolist():
+        if selector is not None and not selector(info.filename):
+            continue
+        zf.extract(info, dest)
+        if members is not None and not info.is_dir():
+            members[info.filename] = (info.CRC, info.file_size)
+        count += 1
+    return count
+
+
+def zipinfo_digest(zf: zipfile.ZipFile) -> str:
+    """
+    Fingerprint an archive from its central directory (names, CRCs, sizes
+    and timestamps), without reading any member data.
+    """
+    listing = [
+        (info.filename, info.CRC, info.file_size, info.compress_size, list(info.date_time))
+        for info in zf.infolist()
+    ]
+    encoded = json.dumps(listing, separators=(",", ":")).encode("utf-8")
+    return f"zipinfo:{hashlib.sha256(encoded).hexdigest()}"
+
+
+def directory_digest(directory: bytes) -> str | None:
+    """
+    Return the ``zipinfo_digest`` of an archive from its central directory
+    and end record alone, or ``None`` if they cannot be parsed.
+    """
+    try:
+        with zipfile.ZipFile(io.BytesIO(directory)) as zf:
+            return zipinfo_digest(zf)
+    except (zipfile.BadZipFile, OSError, ValueError):
+        return None
+
+
+def combine_digests(*digests: str | None) -> str:
+    """
+    Join the digests of one archive into the ``digest`` of a source record.
+    """
+    return " ".join(d for d in digests if d)
+
+
+def same_archive(digest: str | None, other: str | None) -> bool:
+    """
+    Return whether two record digests describe the same archive.
+
+    A record holds one digest per scheme it could compute (``sha256:`` of
+    the bytes, ``zipinfo:`` of the central directory), depending on how the
+    archive was downloaded. Only schemes present in both are compared; with
+    none in common the archives count as different.
+    """
+    def schemes(value: str | None) -> dict:
+        return dict(d.partition(":")[::2] for d in (value or "").split())
+
+    first, second = schemes(digest), schemes(other)
+    common = first.keys() & second.keys()
+    return bool(common) and all(first[k] == second[k] for k in common)
+
+
+# -------------------------------------------------------------
+# Sequential parsing of a ZIP stream (local file headers)
+# -------------------------------------------------------------
+class _ChunkStream:
+    """
+    Byte reader over an iterator of chunks, with push-back of unused bytes.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = (chunk for chunk in chunks if chunk)
+        self._buffer = b""
+
+    def read_some(self, limit: int) -> bytes:
+        if not self._buffer:
+            self._buffer = next(self._chunks, b"")
+        if limit >= len(self._buffer):
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:limit], self._buffer[limit:]
+        return data
+
+    def read(self, size: int) -> bytes:
+        parts = []
+        while size:
+            data = self.read_some(size)
+            if not data:
+                break
+            parts.append(data)
+            size -= len(data)
+        return b"".join(parts)
+
+    def read_exact(self, size: int) -> bytes:
+        data = self.read(size)
+        if len(data) != size:
+            raise zipfile.BadZipFile("Unexpected end of ZIP stream.")
+        return data
+
+    def unread(self, data: bytes) -> None:
+        self._buffer = data + self._buffer
+
+    def read_rest(self) -> bytes:
+        rest = [self._buffer, *self._chunks]
+        self._buffer = b""
+        return b"".join(rest)
+
+
+def _zip64_sizes(extra: bytes, compress_size: int, file_size: int) -> tuple[int, int, bool]:
+    """
+    Apply a ZIP64 extra field to the local header sizes. The last value
+    tells whether the member is ZIP64 (and so uses 8-byte descriptor sizes).
+    """
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, length = struct.unpack_from("<HH", extra, pos)
+        if header_id == ZIP64_EXTRA_ID:
+            values = iter(struct.unpack_from(f"<{length // 8}Q", extra, pos + 4))
+            if file_size == 0xFFFFFFFF:
+                file_size = next(values, file_size)
+            if compress_size == 0xFFFFFFFF:
+                compress_size = next(values, compress_size)
+            return compress_size, file_size, True
+        pos += 4 + length
+    return compress_size, file_size, False
+
+
+def _iter_member_data(
+    stream: _ChunkStream,
+    name: str,
+    flags: int,
+    method: int,
+    crc: int,
+    compress_size: int,
+    zip64: bool,
+    ) -> Iterator[bytes]:
+    has_descriptor = bool(flags & FLAG_DATA_DESCRIPTOR)
+    actual_crc = 0
+
+    if method == zipfile.ZIP_STORED:
+        if has_descriptor:
+            raise zipfile.BadZipFile(f"Cannot stream stored member without sizes: {name}")
+        remaining = compress_size
+        while remaining:
+            data = stream.read_some(min(remaining, CHUNK_SIZE))
+            if not data:
+                raise zipfile.BadZipFile("Unexpected end of ZIP stream.")
+            remaining -= len(data)
+            actual_crc = zlib.crc32(data, actual_crc)
+            yield data
+
+    elif method == zipfile.ZIP_DEFLATED:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        remaining = None if has_descriptor else compress_size
+        while not decompressor.eof:
+            data = decompressor.unconsumed_tail
+            if not data:
+                data = stream.read_some(CHUNK_SIZE if remaining is None else min(remaining, CHUNK_SIZE))
+                if not data:
+                    raise zipfile.BadZipFile("Unexpected end of ZIP stream.")
+                if remaining is not None:
+                    remaining -= len(data)
+            out = decompressor.decompress(data, CHUNK_SIZE)
+            if out:
+                actual_crc = zlib.crc32(out, actual_crc)
+                yield out
+        if decompressor.unused_data:
+            stream.unread(decompressor.unused_data)
+
+    else:
+        raise zipfile.BadZipFile(f"Unsupported compression method {method} for {name}")
+
+    if has_descriptor:
+        head = stream.read_exact(4)
+        if head == DATA_DESCRIPTOR_SIG:
+            head = stream.read_exact(4)
+        crc = struct.unpack("<I", head)[0]
+        stream.read_exact(16 if zip64 else 8)
+
+    if actual_crc != crc:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+
+
+def iter_stream_members(
+    chunks: Iterable[bytes],
+    directory: bytearray | None = None,
+    ) -> Iterator[tuple[str, Iterator[bytes]]]:
+    """
+    Parse a ZIP archive sequentially from an iterator of byte chunks.
+
+    Yields ``(name, data)`` pairs in archive order as soon as each local file
+    header arrives, where ``data`` iterates over the decompressed member
+    bytes. Data a caller leaves unread is skipped before the next member is
+    parsed. CRCs are verified as each member ends. When directory is given,
+    the rest of the stream after the last member (the central directory and
+    end record) is appended to it.
+
+    Raises
+    ------
+    zipfile.BadZipFile
+        If the stream is truncated, corrupt, encrypted, or uses a layout that
+        cannot be read sequentially.
+    """
+    stream = _ChunkStream(chunks)
+    while True:
+        signature = stream.read(4)
+        if not signature or signature in ARCHIVE_END_SIGS:
+            if directory is not None and signature:
+                directory += signature + stream.read_rest()
+            return
+        if signature != LOCAL_HEADER_SIG:
+            raise zipfile.BadZipFile("Bad magic number for file header")
+
+        (_, flags, method, _, _, crc, compress_size, file_size, name_len, extra_len) = struct.unpack(
+            "<HHHHHIIIHH", stream.read_exact(26)
+        )
+        raw_name = stream.read_exact(name_len)
+        extra = stream.read_exact(extra_len)
+        name = raw_name.decode("utf-8" if flags & FLAG_UTF8 else "cp437")
+        if flags & FLAG_ENCRYPTED:
+            raise zipfile.BadZipFile(f"Encrypted member {name!r} is not supported")
+
+        compress_size, file_size, zip64 = _zip64_sizes(extra, compress_size, file_size)
+
+        data = _iter_member_data(stream, name, flags, method, crc, compress_size, zip64)
+        yield name, data
+        for _ in data:
+            pass
+
+
+def extract_stream(
+    chunks: Iterable[bytes],
+    dest: Path,
+    selector: MemberSelector | None = None,
+    members: dict | None = None,
+    directory: bytearray | None = None,
+    ) -> int:
+    """
+    Extract a ZIP archive from a stream of byte chunks into dest while it
+    arrives, writing only members accepted by selector. The ``(crc32,
+    size)`` of each extracted file is added to members when given, and the
+    central directory to directory (see ``iter_stream_members``).
+
+    Members that arrive before the crate metadata cannot be judged by a
+    ``"text"`` selector; they are written and pruned once the stream ends.
+
+    Returns
+    -------
+    int
+        Number of extracted members.
+    """
+    count = 0
+    for name, data in iter_stream_members(chunks, directory):
+        if selector is not None and not selector(name):
+            continue
+        target = _member_path(dest, name)
+        if target is None:
+            continue
+        if name.endswith("/"):
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            crc = size = 0
+            with open(target, "wb") as f:
+                for block in data:
+                    f.write(block)
+                    crc = zlib.crc32(block, crc)
+                    size += len(block)
+            if members is not None:
+                members[name] = (crc, size)
+            if selector is not None and name == METADATA_FILE and selector.needs_metadata:
+                selector.load_metadata(target.read_bytes())
+        count += 1
+
+    if selector is not None:
+        count -= selector.prune(dest)
+        if members is not None:
+            for name in [n for n in members if not (dest / n).is_file()]:
+                del members[name]
+    return count
+
+
+# -------------------------------------------------------------
+# Download entry point
+# -------------------------------------------------------------
+def conditional_headers(cached: dict | None) -> dict:
+    """
+    Build conditional request headers from a cached source record.
+    """
+    headers = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _clear_directory(path: Path) -> None:
+    for child in path.iterdir():
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+
+
+def _probe(url: str, headers: dict, retries: int) -> requests.Response:
+    """
+    Open a streamed GET, retrying connection failures and server errors.
+    """
+    import requests
+
+    def request():
+        resp = requests.get(url, stream=True, timeout=REQUEST_TIMEOUT, headers=headers)
+        if resp.status_code >= 400:
+            try:
+                resp.raise_for_status()
+            finally:
+                resp.close()
+        return resp
+
+    return _with_retries(request, retries)
+
+
+# -------------------------------------------------------------
+# Resumable download to a .part file
+# -------------------------------------------------------------
+def _part_state_path(part: Path) -> Path:
+    return part.with_name(part.name + ".json")
+
+
+def remove_partial_download(part: Path) -> None:
+    """
+    Delete a ``.part`` file and its recorded validator.
+    """
+    Path(part).unlink(missing_ok=True)
+    _part_state_path(Path(part)).unlink(missing_ok=True)
+
+
+def _parse_checksum(checksum: str) -> tuple[str, str]:
+    algorithm, sep, expected = checksum.partition(":")
+    if not sep or algorithm.lower() not in hashlib.algorithms_available:
+        raise ValueError(f"Checksum must look like 'sha256:<hex digest>', got {checksum!r}.")
+    return algorithm.lower(), expected.lower()
+
+
+def _file_digests(path: Path, algorithms: set[str]) -> dict[str, str]:
+    hashes = {name: hashlib.new(name) for name in algorithms}
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            for h in hashes.values():
+                h.update(block)
+    return {name: h.hexdigest() for name, h in hashes.items()}
+
+
+def _has_end_record(path: Path) -> bool:
+    """
+    Return whether the file at path ends with a ZIP end of central
+    directory record, i.e. whether an archive of unknown size arrived whole.
+    """
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        f.seek(max(0, size - END_RECORD_SIZE - MAX_COMMENT_SIZE))
+        tail = f.read()
+    pos = tail.rfind(END_RECORD_SIG)
+    while pos >= 0:
+        if pos + END_RECORD_SIZE <= len(tail):
+            comment_size = struct.unpack_from("<H", tail, pos + 20)[0]
+            if pos + END_RECORD_SIZE + comment_size == len(tail):
+                return True
+        pos = tail.rfind(END_RECORD_SIG, 0, pos)
+    return False
+
+
+def download_archive(
+    url: str,
+    part: Path,
+    cached: dict | None = None,
+    checksum: str | None = None,
+    retries: int = MAX_RETRIES,
+    stats: LoadStats | None = None,
+    ) -> dict | None:
+    """
+    Download url to a ``.part`` file, continuing a previous partial download.
+
+    The validators of the response (``ETag``/``Last-Modified``) and the total
+    size are recorded next to the part file. A later attempt, in this or a
+    later session, asks only for the missing bytes with a ``Range`` request
+    guarded by ``If-Range``, so a file that changed on the server is fetched
+    from the start instead of being spliced. Transient failures are retried
+    with exponential backoff. The finished file is checked against the
+    announced size and, when given, the expected checksum. When the server
+    announces no size, the file must end with a ZIP end of central
+    directory record instead.
+
+    Parameters
+    ----------
+    url : str
+        URL of the archive.
+    part : pathlib.Path
+        Path of the ``.part`` file.
+    cached : dict | None, optional
+        Source record of a cached copy, used for a conditional request when
+        the download starts from scratch.
+    checksum : str | None, optional
+        Expected ``"<algorithm>:<hex digest>"`` of the archive.
+    retries : int, optional
+        Number of retries of transient failures. Default is ``MAX_RETRIES``.
+    stats : LoadStats | None, optional
+        Statistics whose ``bytes_downloaded`` counts the received bytes.
+
+    Returns
+    -------
+    dict | None
+        Source record with the archive's ``sha256:`` digest, or ``None`` if
+        the server answered that the cached copy is current.
+
+    Raises
+    ------
+    ChecksumMismatch
+        If the completed file does not match checksum. The part file is
+        removed so the next attempt starts over.
+    """
+    part = Path(part)
+    state_path = _part_state_path(part)
+    expected = _parse_checksum(checksum) if checksum else None
+
+    def load_state() -> dict | None:
+        if not part.exists() or not state_path.exists():
+            return None
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return state if state.get("url") == url else None
+
+    def complete(state: dict | None, offset: int) -> bool:
+        if not state or not offset:
+            return False
+        if state.get("size") is not None:
+            return offset == state["size"]
+        return _has_end_record(part)
+
+    def attempt() -> dict | None:
+        import requests
+
+        state = load_state()
+        offset = part.stat().st_size if state else 0
+        validator = state and (strong_etag(state.get("etag")) or state.get("last_modified"))
+        if complete(state, offset):
+            return state
+
+        if offset and validator:
+            headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+        else:
+            headers = conditional_headers(cached)
+
+        try:
+            resp = _probe(url, headers, 0)
+        except requests.HTTPError as e:
+            if "If-Range" not in headers or e.response is None or e.response.status_code != 416:
+                raise
+            # The validator matched and nothing is left past offset: the part
+            # file is whole if it ends like an archive; otherwise start over
+            if _has_end_record(part):
+                return state
+            remove_partial_download(part)
+            raise IncompleteDownload(f"{url} is shorter than the partial download.") from e
+
+        with resp:
+            if resp.status_code == 304:
+                return None
+
+            if resp.status_code == 206:
+                mode = "ab"
+                total = resp.headers["Content-Range"].rpartition("/")[2]
+                total = int(total) if total != "*" else None
+            else:
+                mode = "wb"
+                length = resp.headers.get("Content-Length")
+                total = int(length) if length is not None else None
+                state = {
+                    "url": url,
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "size": total,
+                }
+                part.parent.mkdir(parents=True, exist_ok=True)
+                state_path.write_text(json.dumps(state), encoding="utf-8")
+
+            with open(part, mode) as f:
+                for chunk in resp.iter_content(chunk_size=PART_CHUNK_SIZE):
+                    f.write(chunk)
+                    if stats is not None:
+                        stats.add("bytes_downloaded", len(chunk))
+
+        received = part.stat().st_size
+        if total is not None and received != total:
+            raise IncompleteDownload(f"Expected {total} bytes from {url}, received {received}.")
+        if total is None and not _has_end_record(part):
+            raise IncompleteDownload(f"The download of {url} ended before the end of the archive.")
+        return state
+
+    state = _with_retries(attempt, retries)
+    if state is None:
+        return None
+
+    algorithms = {"sha256"} | ({expected[0]} if expected else set())
+    digests = _file_digests(part, algorithms)
+    if expected and digests[expected[0]] != expected[1]:
+        remove_partial_download(part)
+        raise ChecksumMismatch(
+            f"{url} has {expected[0]} {digests[expected[0]]}, expected {expected[1]}."
+        )
+
+    return {
+        "url": url,
+        "etag": state.get("etag"),
+        "last_modified": state.get("last_modified"),
+        "digest": f"sha256:{digests['sha256']}",
+    }
+
+
+def _extract_response(
+    resp: requests.Response,
+    dest: Path,
+    selector: MemberSelector | None,
+    stats: LoadStats | None = None,
+    members: dict | None = None,
+    ) -> str:
+    """
+    Extract a complete (non-range) response body into dest and return the
+    digests of the archive: sha256 of the body and, from its central
+    directory, ``zipinfo_digest``.
+    """
+    expected = resp.headers.get("Content-Length")
+    digest = hashlib.sha256()
+    received = 0
+
+    def chunks():
+        nonlocal received
+        for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+            digest.update(chunk)
+            received += len(chunk)
+            if stats is not None:
+                stats.add("bytes_downloaded", len(chunk))
+            yield chunk
+
+    body = chunks()
+    directory = bytearray()
+    extract_stream(body, dest, selector, members, directory)
+    # The parser stops after the central directory; the digest and size
+    # cover the whole body
+    for _ in body:
+        pass
+    if expected is not None and received != int(expected):
+        raise IncompleteDownload(f"Expected {expected} bytes from {resp.url}, received {received}.")
+    if expected is None and not directory:
+        # Without a length, a body cut between two members looks complete
+        raise IncompleteDownload(f"The download of {resp.url} ended before the end of the archive.")
+    return combine_digests(f"sha256:{digest.hexdigest()}", directory_digest(directory))
+
+
+def _restart_extraction(dest: Path, members: dict | None) -> None:
+    _clear_directory(dest)
+    if members is not None:
+        members.clear()
+
+
+def _stream_archive(
+    url: str,
+    dest: Path,
+    selector: MemberSelector | None,
+    retries: int,
+    stats: LoadStats | None,
+    members: dict | None,
+    resp: requests.Response | None = None,
+    ) -> dict:
+    """
+    Download the archive at url in one request and extract it into dest as
+    it arrives, starting from resp when it already carries the whole body.
+    A body that breaks off cannot be resumed, so later attempts request it
+    again.
+    """
+    responses = [resp] if resp is not None else []
+    record = {"url": url, "etag": None, "last_modified": None}
+
+    def extract(response: requests.Response) -> str:
+        record["etag"] = response.headers.get("ETag")
+        record["last_modified"] = response.headers.get("Last-Modified")
+        return _extract_response(response, dest, selector, stats, members)
+
+    def attempt() -> str:
+        if responses:
+            return extract(responses.pop())
+        with _probe(url, {}, 0) as again:
+            return extract(again)
+
+    record["digest"] = _with_retries(attempt, retries, on_retry=lambda: _restart_extraction(dest, members))
+    return record
+
+
+def fetch_archive(
+    url: str,
+    dest: Path,
+    cached: dict | None = None,
+    selector: MemberSelector | None = None,
+    resumable: bool = False,
+    checksum: str | None = None,
+    retries: int = MAX_RETRIES,
+    stats: LoadStats | None = None,
+    members: dict | None = None,
+    ) -> dict | None:
+    """
+    Download the corpus ZIP at url and extract it into dest without writing
+    the archive itself to disk.
+
+    When the server honours range requests, the archive is opened through
+    ``HTTPRangeReader``: the central directory is read first and only
+    selected members are downloaded, one at a time. Otherwise the response
+    body is parsed sequentially and members are extracted as they arrive.
+
+    Transient failures (dropped connections, timeouts, truncated bodies, 5xx
+    responses) are retried with exponential backoff: range requests retry
+    just the failed block, a sequential download starts over. When a range
+    request is answered with the whole file, or the file changed between
+    requests, the archive is downloaded sequentially instead.
+
+    With ``resumable`` or ``checksum`` the archive is first downloaded to a
+    ``.zip.part`` file next to dest instead (see ``download_archive``), so
+    an interrupted download continues where it stopped, even in a later
+    session, and its size and checksum are verified before extraction.
+
+    Parameters
+    ----------
+    url : str
+        URL of the corpus ZIP.
+    dest : pathlib.Path
+        Empty directory to extract into.
+    cached : dict | None, optional
+        Source record of a cached copy. Its validators make the request
+        conditional, and when the archive fingerprint matches its ``digest``
+        (see ``same_archive``) nothing is extracted.
+    selector : MemberSelector | None, optional
+        Which members to extract. Default is every member.
+    resumable : bool, optional
+        Download through a resumable ``.zip.part`` file. Default is ``False``.
+    checksum : str | None, optional
+        Expected ``"<algorithm>:<hex digest>"`` of the archive, e.g.
+        ``"sha256:..."``. Implies ``resumable``.
+    retries : int, optional
+        Number of retries of transient failures. Default is ``MAX_RETRIES``.
+    stats : LoadStats | None, optional
+        Statistics whose ``bytes_downloaded`` counts the received bytes.
+    members : dict | None, optional
+        Filled with ``{name: (crc32, size)}`` of the extracted files, so
+        later versions can be compared without reading the files (see
+        ``incremental.changed_files``).
+
+    Returns
+    -------
+    dict | None
+        Source record (``url``, ``etag``, ``last_modified``, ``digest``), or
+        ``None`` if the server answered that the cached copy is current. The
+        ``digest`` always holds the ``zipinfo:`` fingerprint, so records of
+        the same archive match whichever way it was downloaded, and also
+        the ``sha256:`` of the archive unless it was read by range requests.
+    """
+    if resumable or checksum:
+        part = dest.with_name(dest.name + PART_SUFFIX)
+        record = download_archive(
+            url, part, cached=cached, checksum=checksum, retries=retries, stats=stats
+        )
+        if record is None:
+            return None
+        with zipfile.ZipFile(part) as zf:
+            record["digest"] = combine_digests(record["digest"], zipinfo_digest(zf))
+            if cached is None or not same_archive(cached.get("digest"), record["digest"]):
+                extract_zipfile(zf, dest, selector, members)
+        remove_partial_download(part)
+        return record
+
+    # Asking for the first byte only tells in one request whether the copy is
+    # current (304), whether ranges work (206 with the total size), or
+    # otherwise delivers the whole archive (200) to parse as it arrives.
+    headers = {**conditional_headers(cached), "Range": "bytes=0-0"}
+    with _probe(url, headers, retries) as resp:
+        if cached is not None and resp.status_code == 304:
+            return None
+
+        record = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+
+        if resp.status_code != 206:
+            # The probe already carries the body
+            return _stream_archive(url, dest, selector, retries, stats, members, resp)
+
+        size = int(resp.headers["Content-Range"].rpartition("/")[2])
+
+    try:
+        with HTTPRangeReader(url, size, etag=record["etag"], retries=retries, stats=stats) as reader:
+            with zipfile.ZipFile(reader) as zf:
+                record["digest"] = zipinfo_digest(zf)
+                if cached is None or not same_archive(cached.get("digest"), record["digest"]):
+                    extract_zipfile(zf, dest, selector, members)
+    except RangeUnavailable:
+        # The archive changed, or ranges stopped working: read it in full
+        _restart_extraction(dest, members)
+        return _stream_archive(url, dest, selector, retries, stats, members)
+    return record
+
+
+def read_remote_member(url: str, name: str) -> bytes:
+    """
+    Return a single member of the remote ZIP at url without extracting the
+    rest of the archive.
+
+    With range requests only the central directory and the member are
+    downloaded. Otherwise the archive is read sequentially and the download
+    stops as soon as the member has arrived, which for a crate is usually
+    the first entry.
+
+    Raises
+    ------
+    KeyError
+        If the archive has no member called name.
+    """
+    import requests
+
+    def stream_member(resp: requests.Response) -> bytes:
+        chunks = resp.iter_content(chunk_size=CHUNK_SIZE)
+        for member, data in iter_stream_members(chunks):
+            if member == name:
+                return b"".join(data)
+        raise KeyError(f"There is no item named {name!r} in {url}.")
+
+    with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT, headers={"Range": "bytes=0-0"}) as resp:
+        resp.raise_for_status()
+        if resp.status_code != 206:
+            return stream_member(resp)
+
+        size = int(resp.headers["Content-Range"].rpartition("/")[2])
+        etag = resp.headers.get("ETag")
+
+    try:
+        with HTTPRangeReader(url, size, etag=etag) as reader:
+            with zipfile.ZipFile(reader) as zf:
+                return zf.read(name)
+    except RangeUnavailable:
+        with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT) as resp:
+            resp.raise_for_status()
+            return stream_member(resp)
+
+
+def replace_directory(source: Path, target: Path) -> None:
+    """
+    Move source to target, replacing any existing target.
+
+    The old target is first renamed out of the way and deleted only once
+    source is in place, so target is missing for just the moment between
+    two renames rather than while a whole tree is deleted.
+    """
+    retired = None
+    if target.exists():
+        retired = target.with_name(f".{target.name}.{os.getpid()}.old")
+        if retired.exists():
+            shutil.rmtree(retired)
+        target.rename(retired)
+    source.rename(target)
+    if retired is not None:
+        shutil.rmtree(retired, ignore_errors=True)
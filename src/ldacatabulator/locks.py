@@ -0,0 +1,132 @@
+# ========== Python Standard Library ==========
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Constants
+# -------------------------
+LOCK_DIR = ".locks"
+LOCK_POLL_SECONDS = 0.1
+
+# One thread lock per lock file: POSIX record locks, which network file
+# systems use for flock, do not exclude threads of the same process.
+_thread_locks: dict[Path, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def corpus_lock_path(db_root: Path, key: str) -> Path:
+    """
+    Return the lock file that guards the cached copy of a corpus, given its
+    URL (or database name) as key. Lock files live in ``<db_root>/.locks``.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+    return Path(db_root) / LOCK_DIR / f"{digest}.lock"
+
+
+def database_lock_path(database: Path) -> Path:
+    """
+    Return the lock file that guards a corpus database and the folder it is
+    built from. Corpora are keyed by where they are stored rather than by
+    URL, since corpora from different URLs may be stored under one name.
+    """
+    database = Path(database)
+    return corpus_lock_path(database.parent, f"database:{database.name}")
+
+
+# -------------------------------------------------------------
+# Exclusive lock shared by every process using the same cache,
+# so one of them downloads and builds a corpus while the others
+# wait and then reuse the result.
+# -------------------------------------------------------------
+class FileLock:
+    """
+    Exclusive advisory lock on a file, held across processes and threads.
+
+    The lock is taken with ``flock`` (``msvcrt.locking`` on Windows) on a
+    file that is created if needed and never removed. It is released when
+    the holder exits the ``with`` block or its process dies, so a crashed
+    builder never leaves a corpus locked.
+
+    Parameters
+    ----------
+    path : path-like
+        Lock file.
+    timeout : float | None, optional
+        Seconds to wait before raising ``TimeoutError``. Default is
+        ``None`` (wait as long as it takes).
+    """
+
+    def __init__(self, path: Path, timeout: float | None = None):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._fd = None
+        with _thread_locks_guard:
+            self._thread_lock = _thread_locks.setdefault(self.path.resolve(), threading.Lock())
+
+    def _try_lock(self) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def acquire(self) -> None:
+        """
+        Wait for the lock and take it.
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        if not self._thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise TimeoutError(f"Timed out waiting for {self.path}")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+            waiting = False
+            while not self._try_lock():
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.path}")
+                if not waiting:
+                    logger.info("Waiting for another process to release %s", self.path)
+                    waiting = True
+                time.sleep(LOCK_POLL_SECONDS)
+        except BaseException:
+            self._close()
+            self._thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Release the lock.
+        """
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        self._close()
+        self._thread_lock.release()
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -0,0 +1,369 @@
+# ========== Python Standard Library ==========
+import json
+import os
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+from urllib.parse import unquote
+
+# -------------------------
+# Constants
+# -------------------------
+READ_SIZE = 64 * 1024
+MAX_READ_SIZE = 16 * 1024 * 1024
+DESCRIPTOR_ID = "ro-crate-metadata.json"
+GRAPH_CACHE_SUFFIX = ".graph.json"
+GRAPH_CACHE_VERSION = 2
+_WHITESPACE = " \t\n\r"
+
+
+# -------------------------------------------------------------
+# Incremental reading of ro-crate-metadata.json: the nodes of
+# the @graph are decoded one at a time, so a caller looking
+# for a few entities can stop without parsing the rest.
+# -------------------------------------------------------------
+class _JSONStream:
+    """
+    Text buffer over a file object from which JSON values are decoded as
+    the data arrives.
+    """
+
+    def __init__(self, fp: IO[str]):
+        self._fp = fp
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._read_size = READ_SIZE
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._fp.read(self._read_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Return the next non-whitespace character without consuming it, or
+        ``""`` at the end of the input.
+        """
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in crate metadata, found {found!r}.")
+        self._pos += 1
+
+    def value(self):
+        """
+        Decode the next JSON value, reading more input until it is complete.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                # Large values need fewer, bigger reads
+                self._read_size = min(self._read_size * 2, MAX_READ_SIZE)
+                continue
+            # A number at the end of the buffer may continue in the next read
+            if end == len(self._buf) and not isinstance(value, (dict, list, str)) and self._fill():
+                continue
+            self._pos = end
+            self._read_size = READ_SIZE
+            return value
+
+
+def iter_graph(fp: IO[str]) -> Iterator[dict]:
+    """
+    Yield the nodes of the ``@graph`` of a JSON-LD document one at a time.
+
+    Only the top-level object and the graph array are walked; each node is
+    decoded on its own as it is reached, so memory use is bounded by the
+    largest node and iteration can stop early. Other top-level values (such
+    as ``@context``) are decoded and discarded.
+
+    Parameters
+    ----------
+    fp : text file object
+        The open ``ro-crate-metadata.json``.
+
+    Raises
+    ------
+    ValueError
+        If the document is not a JSON object.
+    """
+    stream = _JSONStream(fp)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key == "@graph" and stream.peek() == "[":
+            stream.expect("[")
+            if stream.peek() != "]":
+                while True:
+                    node = stream.value()
+                    if isinstance(node, dict):
+                        yield node
+                    if stream.peek() != ",":
+                        break
+                    stream.expect(",")
+            stream.expect("]")
+        else:
+            stream.value()
+        if stream.peek() != ",":
+            return
+        stream.expect(",")
+
+
+def reference_id(value) -> str | None:
+    """
+    Return the ``@id`` a property refers to: the first of a list, the
+    ``@id`` of a reference object or a plain string.
+    """
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        return value.get("@id")
+    if isinstance(value, str):
+        return value
+    return None
+
+
+def text_references(node: dict, props: Iterable[str]) -> list[str]:
+    """
+    Return the paths, relative to the crate folder, of the files node refers
+    to through props (e.g. ``ldac:mainText``).
+    """
+    paths = []
+    for prop in props:
+        values = node.get(prop)
+        for value in values if isinstance(values, list) else [values]:
+            ref = value.get("@id") if isinstance(value, dict) else value
+            if isinstance(ref, str):
+                paths.append(unquote(ref).removeprefix("./"))
+    return paths
+
+
+def find_corpus_nodes(nodes: Iterable[dict], corpus_id: str) -> tuple[dict | None, str | None]:
+    """
+    Find the root dataset of a corpus and the name of its publisher in a
+    graph.
+
+    The root dataset is the node whose ``@id`` is corpus_id or, when there is
+    none, the node the metadata descriptor is ``about``. Iteration stops as
+    soon as the corpus node and its publisher have both been seen.
+
+    Returns
+    -------
+    tuple
+        ``(root, publisher_name)``; either is ``None`` when not found.
+    """
+    names = {}
+    root = about = descriptor_target = None
+    for node in nodes:
+        node_id = node.get("@id")
+        if node_id == DESCRIPTOR_ID:
+            descriptor_target = reference_id(node.get("about"))
+        if node_id == corpus_id:
+            root = node
+        elif descriptor_target is not None and node_id == descriptor_target:
+            about = node
+        if "name" in node:
+            names[node_id] = node["name"]
+
+        if root is not None:
+            publisher = reference_id(root.get("publisher"))
+            if publisher is None or publisher in names:
+                return root, names.get(publisher)
+
+    root = root or about
+    if root is None:
+        return None, None
+    return root, names.get(reference_id(root.get("publisher")))
+
+
+# -------------------------------------------------------------
+# The crate graph parsed once and indexed, shared by every
+# metadata lookup of a corpus.
+# -------------------------------------------------------------
+class CrateGraph:
+    """
+    Parsed ``@graph`` of an RO-Crate, indexed by ``@id`` and ``@type``.
+
+    Lookups by id are dictionary accesses and lookups by type return the
+    nodes in graph order, so callers never scan the graph. The indexed graph
+    can be persisted as compact JSON next to the corpus database (see
+    ``load``) so a later session skips re-reading and indexing the crate
+    metadata. JSON rather than pickle, since the cache may be shared
+    between users and loading it must not run code.
+
+    Parameters
+    ----------
+    nodes : iterable of dict
+        The graph nodes.
+    """
+
+    def __init__(self, nodes: Iterable[dict] = ()):
+        self.nodes: dict[str, dict] = {}
+        self.types: dict[str, list[str]] = {}
+        for node in nodes:
+            if not isinstance(node, dict) or "@id" not in node:
+                continue
+            node_id = node["@id"]
+            self.nodes[node_id] = node
+            for node_type in self.node_types(node):
+                self.types.setdefault(node_type, []).append(node_id)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.nodes.values())
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
+    # -----------------------------------------------
+    # Construction and persistence
+    # -----------------------------------------------
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CrateGraph":
+        """
+        Build the graph from the content of ro-crate-metadata.json.
+        """
+        return cls(json.loads(data).get("@graph", []))
+
+    @classmethod
+    def from_file(cls, path: Path) -> "CrateGraph":
+        """
+        Build the graph from an ro-crate-metadata.json file.
+        """
+        with open(path, encoding="utf-8-sig") as f:
+            return cls(json.load(f).get("@graph", []))
+
+    @staticmethod
+    def source_key(path: Path) -> list:
+        """
+        Return what identifies a version of a metadata file: its modification
+        time and size, which survive moving the corpus folder.
+        """
+        stat = os.stat(path)
+        return [GRAPH_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    @classmethod
+    def load(cls, path: Path, cache_path: Path | None = None) -> "CrateGraph":
+        """
+        Return the graph of the metadata file at path, through a JSON cache
+        at cache_path when given.
+
+        The cache records the ``source_key`` of the metadata file it was
+        built from and is only used while it matches; otherwise the
+        metadata is parsed and the cache rewritten.
+        """
+        if cache_path is None:
+            return cls.from_file(path)
+
+        key = cls.source_key(path)
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["key"] == key:
+                return cls._from_index(cached["nodes"], cached["types"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        graph = cls.from_file(path)
+        graph.save(cache_path, key)
+        return graph
+
+    @classmethod
+    def _from_index(cls, nodes: dict, types: dict) -> "CrateGraph":
+        if not isinstance(nodes, dict) or not isinstance(types, dict):
+            raise TypeError("Malformed graph cache.")
+        graph = cls()
+        graph.nodes, graph.types = nodes, types
+        return graph
+
+    def save(self, cache_path: Path, key: list) -> None:
+        """
+        Write the graph to cache_path together with the key of its source.
+        """
+        cache_path = Path(cache_path)
+        tmp = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "nodes": self.nodes, "types": self.types}, f, separators=(",", ":"))
+            os.replace(tmp, cache_path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+    # -----------------------------------------------
+    # Lookups
+    # -----------------------------------------------
+    @staticmethod
+    def node_types(node: dict) -> list[str]:
+        """
+        Return the ``@type`` values of a node as a list.
+        """
+        types = node.get("@type", [])
+        return [types] if isinstance(types, str) else list(types)
+
+    def get(self, node_id: str | None) -> dict | None:
+        """
+        Return the node with the given ``@id``, or ``None``.
+        """
+        return self.nodes.get(node_id) if node_id is not None else None
+
+    def of_type(self, node_type: str) -> list[dict]:
+        """
+        Return the nodes having node_type among their types, in graph order.
+        """
+        return [self.nodes[node_id] for node_id in self.types.get(node_type, [])]
+
+    def resolve(self, value) -> dict | None:
+        """
+        Return the node a property value refers to (see ``reference_id``).
+        """
+        return self.get(reference_id(value))
+
+    @property
+    def root(self) -> dict | None:
+        """
+        The root dataset, as named by the metadata descriptor.
+        """
+        descriptor = self.get(DESCRIPTOR_ID)
+        return self.resolve(descriptor.get("about")) if descriptor else None
+
+    def corpus_node(self, corpus_id: str) -> dict | None:
+        """
+        Return the node of corpus_id, or the root dataset if there is none.
+        """
+        return self.get(corpus_id) or self.root
+
+    def corpus_name(self, corpus_id: str) -> str | None:
+        """
+        Return the display name of a corpus: the name of its node or else of
+        the first named Dataset.
+        """
+        node = self.get(corpus_id)
+        if node and node.get("name"):
+            return str(node["name"])
+        dataset = next((n for n in self.of_type("Dataset") if n.get("name")), None)
+        return str(dataset["name"]) if dataset else None
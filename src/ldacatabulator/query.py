@@ -0,0 +1,141 @@
+# ========== Python Standard Library ==========
+import sqlite3
+from typing import Mapping
+
+# -------------------------
+# Constants
+# -------------------------
+# SQLite limits the number of result columns (2000 by default), so column
+# statistics of wide tables are gathered in batches.
+STATS_BATCH_SIZE = 500
+
+
+# -------------------------------------------------------------
+# SQL helpers used to push column selection, filters and the
+# null-column pruning of the accessors down into SQLite.
+# -------------------------------------------------------------
+def quote_identifier(name: str) -> str:
+    """
+    Quote a table or column name for use in SQL.
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def table_columns(conn: sqlite3.Connection, table_name: str, schema: str = "main") -> list[str]:
+    """
+    Return the column names of table_name, in table order. schema names an
+    attached database.
+    """
+    rows = conn.execute(f"PRAGMA {quote_identifier(schema)}.table_info({quote_identifier(table_name)})").fetchall()
+    return [row[1] for row in rows]
+
+
+def check_columns(requested, schema: list[str], table_name: str) -> None:
+    """
+    Raise ``ValueError`` if any requested column is not in schema.
+    """
+    unknown = [c for c in requested if c not in schema]
+    if unknown:
+        raise ValueError(f"Unknown column(s) {unknown} in table '{table_name}'.")
+
+
+def where_clause(
+    where: Mapping | tuple[str, list] | None,
+    schema: list[str],
+    table_name: str,
+    ) -> tuple[str, list]:
+    """
+    Compile a filter into a SQL ``WHERE`` clause and its parameters.
+
+    Parameters
+    ----------
+    where : Mapping | tuple[str, list] | None
+        Either a mapping of column name to value (``None`` matches NULL, a
+        list, tuple or set matches any of its values), combined with
+        ``AND``, or a ``(sql, params)`` tuple: a SQL expression with ``?``
+        placeholders and the values bound to them. The SQL part is used as
+        is and must never be built from untrusted input.
+    schema : list[str]
+        Column names of the table, used to validate mapping keys.
+    table_name : str
+        Table name, for error messages.
+
+    Returns
+    -------
+    tuple[str, list]
+        The clause (empty when there is no filter, otherwise starting with
+        ``" WHERE "``) and its query parameters.
+    """
+    if not where:
+        return "", []
+    if isinstance(where, str):
+        raise TypeError(
+            "A SQL filter must be given as a (sql, params) tuple, with values bound to '?' placeholders."
+        )
+    if isinstance(where, tuple):
+        sql, params = where
+        return f" WHERE ({sql})", list(params)
+
+    check_columns(where, schema, table_name)
+    parts, params = [], []
+    for column, value in where.items():
+        column = quote_identifier(column)
+        if value is None:
+            parts.append(f"{column} IS NULL")
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            values = list(value)
+            parts.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        else:
+            parts.append(f"{column} = ?")
+            params.append(value)
+    return " WHERE " + " AND ".join(parts), params
+
+
+def non_null_counts(
+    conn: sqlite3.Connection,
+    table_name: str,
+    columns: list[str],
+    where_sql: str = "",
+    params: list | None = None,
+    ) -> tuple[int, dict]:
+    """
+    Count the rows of table_name and the non-null values of each column,
+    restricted to the rows matched by where_sql.
+
+    Returns
+    -------
+    tuple[int, dict]
+        ``(row_count, {column: non_null_count})``.
+    """
+    table = quote_identifier(table_name)
+    params = params or []
+    row_count, counts = 0, {}
+    for start in range(0, max(len(columns), 1), STATS_BATCH_SIZE):
+        batch = columns[start:start + STATS_BATCH_SIZE]
+        select = ", ".join(["COUNT(*)"] + [f"COUNT({quote_identifier(c)})" for c in batch])
+        row_count, *values = conn.execute(f"SELECT {select} FROM {table}{where_sql}", params).fetchone()
+        counts.update(zip(batch, values))
+    return row_count, counts
+
+
+def select_query(
+    table_name: str,
+    columns: list[str],
+    where_sql: str = "",
+    limit: int | None = None,
+    aliases: Mapping[str, str] | None = None,
+    ) -> str:
+    """
+    Build the ``SELECT`` statement for the given columns, filter and limit.
+
+    aliases maps extra output column names to the column (or ``rowid``)
+    they are read from.
+    """
+    selected = [quote_identifier(c) for c in columns]
+    selected += [f"{quote_identifier(source)} AS {quote_identifier(alias)}" for alias, source in (aliases or {}).items()]
+    cols = ", ".join(selected) or "*"
+    query = f"SELECT {cols} FROM {quote_identifier(table_name)}{where_sql}"
+    if limit is not None:
+        query += f" LIMIT {int(limit)}"
+    return query
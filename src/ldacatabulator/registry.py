@@ -0,0 +1,283 @@
+# ========== Python Standard Library ==========
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+# ========== Project-Specific Imports ==========
+from .bookkeeping import read_source_record
+
+# -------------------------
+# Constants
+# -------------------------
+REGISTRY_FILE = ".registry.sqlite"
+SCHEMA_VERSION = 2
+METADATA_FILE = "ro-crate-metadata.json"
+
+
+# -------------------------------------------------------------
+# On-disk index of the corpora held in ldacaCollections/ and
+# databases/, so a URL can be resolved to its cached folder and
+# database without reading any crate metadata.
+# -------------------------------------------------------------
+class CorpusRegistry:
+    """
+    Persistent index of cached corpora.
+
+    Each entry maps a corpus URL (and the corpus identifier derived from it)
+    to its extracted folder, its SQLite database, the validators recorded for
+    the ZIP, the member selection it was extracted with, the time it was
+    built and the time it was last loaded (``last_access``, which decides
+    what ``storage.cache_prune`` evicts first). The index lives in
+    ``databases/.registry.sqlite`` and is updated in a single transaction
+    whenever a corpus is registered.
+
+    Entries are checked against the file system on lookup: an entry whose
+    folder, database or metadata file was removed or modified outside this
+    package is dropped. When the collection directory itself changed since
+    the last update (folders added, removed or renamed), the index is rebuilt
+    from the source records stored in each corpus database.
+
+    Parameters
+    ----------
+    extract_root : pathlib.Path
+        Directory holding the extracted corpora.
+    db_root : pathlib.Path
+        Directory holding the corpus databases and the registry file.
+    """
+
+    COLUMNS = (
+        "url",
+        "corpus_id",
+        "folder",
+        "database",
+        "etag",
+        "last_modified",
+        "digest",
+        "selection",
+        "built_at",
+        "metadata_mtime_ns",
+        "last_access",
+    )
+
+    def __init__(self, extract_root: Path, db_root: Path):
+        self.extract_root = Path(extract_root)
+        self.db_root = Path(db_root)
+        self.path = self.db_root / REGISTRY_FILE
+
+    # -----------------------------------------------
+    # Helper methods
+    # -----------------------------------------------
+    @staticmethod
+    def corpus_id_from_url(url: str) -> str:
+        """
+        Return the decoded corpus identifier of a corpus ZIP URL.
+        """
+        return unquote(Path(urlparse(url).path).name).removesuffix(".zip")
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        with conn:
+            # The index is derived data: on a schema change, start over and
+            # let the next lookup rebuild it.
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS corpora")
+                conn.execute("DROP TABLE IF EXISTS state")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS corpora ("
+                "url TEXT PRIMARY KEY, corpus_id TEXT, folder TEXT, database TEXT, "
+                "etag TEXT, last_modified TEXT, digest TEXT, selection TEXT, built_at TEXT, "
+                "metadata_mtime_ns INTEGER, last_access TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS corpora_corpus_id ON corpora (corpus_id)")
+            conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)")
+        return conn
+
+    def _root_mtime_ns(self) -> int | None:
+        try:
+            return self.extract_root.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _metadata_mtime_ns(extract_to: Path) -> int | None:
+        try:
+            return (extract_to / METADATA_FILE).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    def _row_values(
+        self,
+        url: str,
+        extract_to: Path,
+        database: Path,
+        record: dict,
+        last_access: str | None = None,
+        ) -> list:
+        return [
+            url,
+            self.corpus_id_from_url(url),
+            extract_to.name,
+            database.name,
+            record.get("etag"),
+            record.get("last_modified"),
+            record.get("digest"),
+            record.get("selection"),
+            record.get("built_at"),
+            self._metadata_mtime_ns(extract_to),
+            last_access or self._now(),
+        ]
+
+    def _write_rows(self, conn: sqlite3.Connection, rows: list[list]) -> None:
+        placeholders = ", ".join("?" * len(self.COLUMNS))
+        conn.executemany(f"INSERT OR REPLACE INTO corpora VALUES ({placeholders})", rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO state VALUES ('extract_root_mtime_ns', ?)",
+            (str(self._root_mtime_ns()),),
+        )
+
+    def _entry(self, row: tuple) -> dict:
+        entry = dict(zip(self.COLUMNS, row))
+        entry["extract_to"] = self.extract_root / entry["folder"]
+        entry["database"] = self.db_root / entry["database"]
+        return entry
+
+    def _is_current(self, entry: dict) -> bool:
+        return (
+            entry["extract_to"].is_dir()
+            and entry["database"].exists()
+            and self._metadata_mtime_ns(entry["extract_to"]) == entry["metadata_mtime_ns"]
+        )
+
+    def _root_changed(self, conn: sqlite3.Connection) -> bool:
+        row = conn.execute(
+            "SELECT value FROM state WHERE key = 'extract_root_mtime_ns'"
+        ).fetchone()
+        return row is None or row[0] != str(self._root_mtime_ns())
+
+    # -----------------------------------------------
+    # Public API
+    # -----------------------------------------------
+    def lookup(self, url: str) -> dict | None:
+        """
+        Return the registry entry for url, or ``None`` if it is not cached.
+
+        The returned dict holds the registry columns plus ``extract_to`` and
+        ``database`` as absolute paths.
+        """
+        conn = self._connect()
+        try:
+            query = f"SELECT {', '.join(self.COLUMNS)} FROM corpora WHERE url = ?"
+            row = conn.execute(query, (url,)).fetchone()
+            if row is None and self._root_changed(conn):
+                conn.close()
+                self.rebuild()
+                conn = self._connect()
+                row = conn.execute(query, (url,)).fetchone()
+            if row is None:
+                return None
+
+            entry = self._entry(row)
+            if not self._is_current(entry):
+                with conn:
+                    conn.execute("DELETE FROM corpora WHERE url = ?", (url,))
+                return None
+            return entry
+        finally:
+            conn.close()
+
+    def register(self, url: str, extract_to: Path, database: Path, record: dict) -> None:
+        """
+        Add or replace the entry for url after a successful build.
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "DELETE FROM corpora WHERE folder = ? AND url != ?",
+                    (Path(extract_to).name, url),
+                )
+                self._write_rows(conn, [self._row_values(url, Path(extract_to), Path(database), record)])
+        finally:
+            conn.close()
+
+    def touch(self, url: str) -> None:
+        """
+        Record that the corpus of url was just loaded.
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("UPDATE corpora SET last_access = ? WHERE url = ?", (self._now(), url))
+        finally:
+            conn.close()
+
+    def remove(self, url: str) -> None:
+        """
+        Drop the entry for url, leaving its files untouched.
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM corpora WHERE url = ?", (url,))
+        finally:
+            conn.close()
+
+    def entries(self) -> list[dict]:
+        """
+        Return all registry entries, re-indexing the cache first when
+        folders were added or removed outside the tool.
+        """
+        conn = self._connect()
+        try:
+            if self._root_changed(conn):
+                conn.close()
+                self.rebuild()
+                conn = self._connect()
+            rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM corpora ORDER BY folder").fetchall()
+        finally:
+            conn.close()
+        return [self._entry(row) for row in rows]
+
+    def rebuild(self) -> None:
+        """
+        Recreate the index from the source records stored in each corpus
+        database under ``db_root``.
+
+        Folders without a matching ``<folder>.db`` source record were not
+        built by this package (or their build did not finish) and are left
+        out; they are rebuilt on their next load. Last access times of
+        corpora already indexed are kept; the others start from their build
+        time.
+        """
+        conn = self._connect()
+        try:
+            accessed = dict(conn.execute("SELECT url, last_access FROM corpora"))
+        finally:
+            conn.close()
+
+        rows = []
+        if self.extract_root.exists():
+            for child in self.extract_root.iterdir():
+                if not child.is_dir() or not (child / METADATA_FILE).exists():
+                    continue
+                database = self.db_root / f"{child.name}.db"
+                record = read_source_record(database)
+                if record is None or not record.get("url"):
+                    continue
+                last_access = accessed.get(record["url"]) or record.get("built_at")
+                rows.append(self._row_values(record["url"], child, database, record, last_access))
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM corpora")
+                self._write_rows(conn, rows)
+        finally:
+            conn.close()
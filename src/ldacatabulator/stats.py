@@ -0,0 +1,167 @@
+# ========== Python Standard Library ==========
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+# ========== Third-Party Dependencies ==========
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Constants
+# -------------------------
+# Counters reported to the progress callback as they grow
+COUNTERS = ("bytes_downloaded", "bytes_extracted", "members_extracted")
+
+
+def directory_usage(path: Path) -> tuple[int, int]:
+    """
+    Return the number of files under path and their total size in bytes.
+    """
+    files = size = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                size += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+            files += 1
+    return files, size
+
+
+# -------------------------------------------------------------
+# Timings and counters collected while a corpus is loaded, so
+# the slow stage of a given corpus can be found and reported.
+# -------------------------------------------------------------
+@dataclass
+class LoadStats:
+    """
+    Instrumentation of one corpus load.
+
+    Stage timings are wall-clock seconds, accumulated when a stage runs
+    more than once. The stages are ``"fetch"`` (download and extraction,
+    which overlap while the archive streams), ``"install"`` (moving the
+    extracted folder into place under its corpus name), ``"tabulate"``
+    (``crate_to_db``) and ``"entity_table"`` (flattening entity tables).
+
+    Every stage and counter update is also passed to ``callback`` as
+    ``callback(event, info)``, with the events ``"stage_start"``,
+    ``"stage_end"``, ``"progress"`` (a counter changed), ``"cache"`` and
+    ``"table"``. An exception raised by the callback aborts the load.
+    Stage timings are logged at ``INFO`` level, everything else at
+    ``DEBUG``. Updates are thread-safe, so threads sharing a corpus can
+    report to the same instance; the callback may be called from any of
+    them.
+
+    Parameters
+    ----------
+    label : str, optional
+        Name of the corpus in log messages, usually its URL.
+    callback : callable | None, optional
+        Progress hook called with ``(event, info)``.
+
+    Attributes
+    ----------
+    stages : dict[str, float]
+        Seconds spent per stage, in the order the stages first ran.
+    bytes_downloaded : int
+        Bytes received from the server.
+    bytes_extracted : int
+        Size of the extracted files.
+    members_extracted : int
+        Number of extracted files.
+    tables : dict[str, dict]
+        Per entity table, the ``rows`` and ``columns`` of the last frame
+        returned, how long it took in ``seconds`` and its ``source``
+        (``"sqlite"``, ``"arrow"`` or ``"cache"``).
+    cache : dict[str, int]
+        Hit and miss counts such as ``corpus_hits`` (a cached copy was
+        reused), ``frame_misses`` or ``arrow_hits``.
+    """
+
+    label: str = ""
+    callback: Callable[[str, dict], None] | None = field(default=None, repr=False, compare=False)
+    stages: dict = field(default_factory=dict)
+    bytes_downloaded: int = 0
+    bytes_extracted: int = 0
+    members_extracted: int = 0
+    tables: dict = field(default_factory=dict)
+    cache: dict = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def _emit(self, event: str, info: dict) -> None:
+        if self.callback is not None:
+            self.callback(event, info)
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time the body of the ``with`` block as stage name.
+        """
+        self._emit("stage_start", {"stage": name})
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + seconds
+            logger.info("%s: %s took %.3f s", self.label, name, seconds)
+            self._emit("stage_end", {"stage": name, "seconds": seconds})
+
+    def add(self, counter: str, amount: int) -> None:
+        """
+        Increase one of ``COUNTERS`` by amount.
+        """
+        if counter not in COUNTERS:
+            raise ValueError(f"Unknown counter {counter!r}.")
+        with self._lock:
+            value = getattr(self, counter) + amount
+            setattr(self, counter, value)
+        self._emit("progress", {counter: value})
+
+    def hit(self, kind: str, hit: bool = True) -> None:
+        """
+        Count a hit (or, with ``hit=False``, a miss) of a cache kind such
+        as ``"corpus"``, ``"frame"`` or ``"arrow"``.
+        """
+        key = f"{kind}_{'hits' if hit else 'misses'}"
+        with self._lock:
+            self.cache[key] = self.cache.get(key, 0) + 1
+        logger.debug("%s: %s cache %s", self.label, kind, "hit" if hit else "miss")
+        self._emit("cache", {"kind": kind, "hit": hit})
+
+    def record_table(self, name: str, df: pd.DataFrame, seconds: float, source: str) -> None:
+        """
+        Record the shape of the frame returned for entity table name.
+        """
+        info = {"rows": len(df), "columns": df.shape[1], "seconds": seconds, "source": source}
+        with self._lock:
+            self.tables[name] = info
+        logger.debug("%s: %s has %d rows, %d columns (%s, %.3f s)",
+                     self.label, name, info["rows"], info["columns"], source, seconds)
+        self._emit("table", {"table": name, **info})
+
+    def as_dict(self) -> dict:
+        """
+        Return the statistics as plain JSON-serialisable data.
+        """
+        with self._lock:
+            return {
+                "label": self.label,
+                "stages": dict(self.stages),
+                "bytes_downloaded": self.bytes_downloaded,
+                "bytes_extracted": self.bytes_extracted,
+                "members_extracted": self.members_extracted,
+                "tables": {name: dict(info) for name, info in self.tables.items()},
+                "cache": dict(self.cache),
+            }
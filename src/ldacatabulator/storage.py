@@ -0,0 +1,263 @@
+# ========== Python Standard Library ==========
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+# ========== Third-Party Dependencies ==========
+if TYPE_CHECKING:
+    import pandas as pd
+
+# ========== Project-Specific Imports ==========
+from .arrow_store import ARROW_SUFFIX
+from .connections import remove_database
+from .incremental import MEMBERS_SUFFIX
+from .locks import FileLock, corpus_lock_path, database_lock_path
+from .metadata import GRAPH_CACHE_SUFFIX
+from .registry import CorpusRegistry
+from .stats import directory_usage
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Constants
+# -------------------------
+CACHE_DIR_ENV = "LDACA_CACHE_DIR"
+CACHE_QUOTA_ENV = "LDACA_CACHE_QUOTA"
+EXTRACT_DIR = "ldacaCollections"
+DATABASE_DIR = "databases"
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+INFO_COLUMNS = [
+    "url",
+    "corpus_id",
+    "folder",
+    "database",
+    "folder_bytes",
+    "database_bytes",
+    "total_bytes",
+    "built_at",
+    "last_access",
+]
+
+
+# -------------------------------------------------------------
+# Where corpora are cached and how much space they may take.
+# The folders and databases of every project using the same
+# cache root are shared (see ``locks`` for the coordination).
+# -------------------------------------------------------------
+def cache_root(cache_dir: str | Path | None = None) -> Path:
+    """
+    Return the cache root: cache_dir, else the ``LDACA_CACHE_DIR``
+    environment variable, else the current working directory.
+    """
+    root = cache_dir or os.environ.get(CACHE_DIR_ENV) or Path.cwd()
+    return Path(root).expanduser().absolute()
+
+
+def storage_roots(cache_dir: str | Path | None = None) -> tuple[Path, Path]:
+    """
+    Return the ``(extract_root, db_root)`` directories under the cache root
+    (``ldacaCollections/`` and ``databases/``), creating them.
+    """
+    root = cache_root(cache_dir)
+    extract_root, db_root = root / EXTRACT_DIR, root / DATABASE_DIR
+    extract_root.mkdir(parents=True, exist_ok=True)
+    db_root.mkdir(parents=True, exist_ok=True)
+    return extract_root, db_root
+
+
+def parse_size(value: int | str | None) -> int | None:
+    """
+    Parse a size in bytes given as a number or a string such as ``"500M"``,
+    ``"20G"`` or ``"1.5TB"`` (binary units).
+    """
+    if value is None or isinstance(value, int):
+        return value
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*", str(value), re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"Invalid size {value!r}; use bytes or a number with K, M, G or T.")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def cache_quota(quota: int | str | None = None) -> int | None:
+    """
+    Return the cache quota in bytes: quota, else the ``LDACA_CACHE_QUOTA``
+    environment variable, else ``None`` (no limit).
+    """
+    return parse_size(quota if quota is not None else os.environ.get(CACHE_QUOTA_ENV) or None)
+
+
+def _path_size(path: Path) -> int:
+    if path.is_dir():
+        return directory_usage(path)[1]
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _database_files(database: Path) -> list[Path]:
+    """
+    Return the database of a corpus and the files derived from it.
+    """
+    return [
+        database,
+        *(database.with_name(database.name + suffix) for suffix in ("-wal", "-shm", "-journal")),
+        database.with_suffix(ARROW_SUFFIX),
+        database.with_suffix(GRAPH_CACHE_SUFFIX),
+        database.with_suffix(MEMBERS_SUFFIX),
+    ]
+
+
+def _corpus_sizes(entry: dict) -> tuple[int, int]:
+    folder = _path_size(entry["extract_to"])
+    database = sum(_path_size(path) for path in _database_files(entry["database"]))
+    return folder, database
+
+
+def _entries(cache_dir: str | Path | None) -> tuple[CorpusRegistry, list[dict]]:
+    registry = CorpusRegistry(*storage_roots(cache_dir))
+    return registry, [e for e in registry.entries() if e["extract_to"].exists() or e["database"].exists()]
+
+
+def cache_info(cache_dir: str | Path | None = None) -> pd.DataFrame:
+    """
+    Report the corpora held in the cache.
+
+    Parameters
+    ----------
+    cache_dir : str | path-like | None, optional
+        Cache root. Default is ``LDACA_CACHE_DIR`` or the working directory.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per cached corpus, most recently loaded first: its ``url``,
+        ``corpus_id``, ``folder`` and ``database`` paths, the size in bytes
+        of the extracted folder (``folder_bytes``), of the database with its
+        Arrow, graph and member caches (``database_bytes``) and both
+        (``total_bytes``), and when it was built and last loaded.
+    """
+    import pandas as pd
+
+    _, entries = _entries(cache_dir)
+    rows = []
+    for entry in entries:
+        folder_bytes, database_bytes = _corpus_sizes(entry)
+        rows.append({
+            "url": entry["url"],
+            "corpus_id": entry["corpus_id"],
+            "folder": entry["extract_to"],
+            "database": entry["database"],
+            "folder_bytes": folder_bytes,
+            "database_bytes": database_bytes,
+            "total_bytes": folder_bytes + database_bytes,
+            "built_at": pd.to_datetime(entry["built_at"], utc=True),
+            "last_access": pd.to_datetime(entry["last_access"], utc=True),
+        })
+    df = pd.DataFrame(rows, columns=INFO_COLUMNS)
+    return df.sort_values("last_access", ascending=False, na_position="last", ignore_index=True)
+
+
+def remove_corpus(entry: dict, registry: CorpusRegistry) -> None:
+    """
+    Delete the folder, database and caches of a registry entry and drop it
+    from the registry.
+    """
+    registry.remove(entry["url"])
+    folder = entry["extract_to"]
+    if folder.exists():
+        # Renamed first, so the folder disappears at once
+        retired = folder.with_name(f".{folder.name}.{os.getpid()}.old")
+        shutil.rmtree(retired, ignore_errors=True)
+        folder.rename(retired)
+        shutil.rmtree(retired, ignore_errors=True)
+    database = entry["database"]
+    remove_database(database)
+    shutil.rmtree(database.with_suffix(ARROW_SUFFIX), ignore_errors=True)
+    database.with_suffix(GRAPH_CACHE_SUFFIX).unlink(missing_ok=True)
+    database.with_suffix(MEMBERS_SUFFIX).unlink(missing_ok=True)
+
+
+def cache_prune(
+    max_bytes: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    keep: Iterable[str] = (),
+    ) -> list[str]:
+    """
+    Evict the least recently loaded corpora until the cache fits in
+    max_bytes.
+
+    A corpus that another process is downloading, building or adding a
+    table to (its URL or database lock is held) is skipped. One that is only being read elsewhere is removed: open
+    databases stay readable, but its files are gone.
+
+    Parameters
+    ----------
+    max_bytes : int | str | None, optional
+        Size to shrink the cache to, in bytes or as e.g. ``"20G"``. Default
+        is ``LDACA_CACHE_QUOTA``; without either, nothing is evicted.
+        ``0`` empties the cache.
+    cache_dir : str | path-like | None, optional
+        Cache root. Default is ``LDACA_CACHE_DIR`` or the working directory.
+    keep : iterable of str, optional
+        URLs of corpora never to evict, e.g. the ones in use.
+
+    Returns
+    -------
+    list[str]
+        URLs of the evicted corpora, least recently loaded first.
+    """
+    quota = cache_quota(max_bytes)
+    if quota is None:
+        return []
+
+    registry, entries = _entries(cache_dir)
+    sizes = {entry["url"]: sum(_corpus_sizes(entry)) for entry in entries}
+    total = sum(sizes.values())
+    keep = set(keep)
+    # Oldest first; corpora never loaded since the index was rebuilt go first
+    entries.sort(key=lambda e: e["last_access"] or "")
+
+    evicted = []
+    for entry in entries:
+        if total <= quota:
+            break
+        if entry["url"] in keep:
+            continue
+        try:
+            with (
+                FileLock(corpus_lock_path(registry.db_root, entry["url"]), timeout=0),
+                FileLock(database_lock_path(entry["database"]), timeout=0),
+            ):
+                remove_corpus(entry, registry)
+        except TimeoutError:
+            logger.info("Not evicting %s: it is being loaded.", entry["url"])
+            continue
+        total -= sizes[entry["url"]]
+        evicted.append(entry["url"])
+        logger.info("Evicted %s (%d bytes) from the cache.", entry["url"], sizes[entry["url"]])
+    return evicted
+
+
+def enforce_quota(
+    quota: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    keep: Iterable[str] = (),
+    ) -> None:
+    """
+    Evict the least recently loaded corpora not in keep until the cache
+    fits in quota (see ``cache_quota``), if one is set. Called after loads,
+    so a failure to remove files is logged rather than raised.
+    """
+    max_bytes = cache_quota(quota)
+    if max_bytes is None:
+        return
+    try:
+        cache_prune(max_bytes, cache_dir, keep)
+    except OSError:
+        logger.warning("Could not shrink the cache to %d bytes.", max_bytes, exc_info=True)
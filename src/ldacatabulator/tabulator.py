@@ -1,12 +1,21 @@
 # ========== Python Standard Library ==========
+from __future__ import annotations
+
+import importlib
 import json
+import logging
+import os
 import re
 import shutil
 import sqlite3
-import zipfile
+import threading
+import time
+import weakref
+from concurrent.futures import Executor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Callable, List
 from urllib.parse import (
     unquote,
     urlparse
@@ -14,12 +23,63 @@ from urllib.parse import (
 
 
 # ========== Third-Party Dependencies ==========
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+# pandas, rocrate_tabular and asyncio are imported on first use, so that
+# importing this module (e.g. in a worker process) stays fast
+if TYPE_CHECKING:
+    import asyncio
+
+    import pandas as pd
+    from rocrate_tabular.tabulator import ROCrateTabulator
 
 # ========== Project-Specific Imports ==========
-from rocrate_tabular.tabulator import ROCrateTabulator
+from .arrow_store import ArrowStore, require_pyarrow
+from .bookkeeping import (
+    base_is_stale,
+    clear_table_records,
+    config_hash,
+    read_column_stats,
+    read_source_record,
+    read_table_records,
+    write_column_stats,
+    write_source_record,
+    write_table_record,
+)
+from .cache import FrameCache
+from .connections import ReadConnections, enable_wal, publish_database, remove_database
+from .incremental import (
+    MEMBERS_SUFFIX,
+    UpdatePlan,
+    apply_update,
+    file_members,
+    plan_update,
+    read_members,
+    text_files,
+    write_members,
+)
+from .ingest import (
+    METADATA_FILE,
+    PREVIEW_FILE,
+    MemberSelector,
+    fetch_archive,
+    read_remote_member,
+    replace_directory,
+    same_archive,
+)
+from .locks import FileLock, corpus_lock_path, database_lock_path
+from .metadata import GRAPH_CACHE_SUFFIX, CrateGraph, find_corpus_nodes, iter_graph
+from .query import (
+    check_columns,
+    non_null_counts,
+    quote_identifier,
+    select_query,
+    table_columns,
+    where_clause,
+)
+from .registry import CorpusRegistry
+from .stats import LoadStats, directory_usage
+from .storage import cache_quota, enforce_quota, storage_roots
+
+logger = logging.getLogger(__name__)
 
 # -------------------------
 # Constants
@@ -27,6 +87,50 @@ from rocrate_tabular.tabulator import ROCrateTabulator
 GENERAL_CONFIG = "./configs/general/general-config.json"
 CORPUS_CONFIG_DIR = "./configs/corpora/"
 TEXT_PROP = "ldac:mainText"
+# Key of the lock held while corpora are given folder and database names
+STORAGE_NAMES_LOCK = ".names"
+INDEXABLE_TEXT_PROP = "ldac:indexableText"
+MAX_NULL_PROP = 0.99
+ENTITY_ID_COLUMN = "entity_id"
+TEXT_REF_COLUMN = "text_ref"
+ASYNC_DOWNLOAD_LIMIT = 4
+
+# One download semaphore per event loop, shared by every ``aload`` call
+_download_semaphores = weakref.WeakKeyDictionary()
+# Guards the creation of the per-instance locks (see ``LDaCATabulator._lock``)
+_LOCKS_GUARD = threading.Lock()
+# Names of lazily imported modules and classes this module exposes
+_LAZY_IMPORTS = {
+    "pd": ("pandas", None),
+    "ROCrateTabulator": ("rocrate_tabular.tabulator", "ROCrateTabulator"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_IMPORTS[name]
+    module = importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+
+def _new_tabulator() -> ROCrateTabulator:
+    """
+    Return a fresh ``ROCrateTabulator``, importing rocrate_tabular on first use.
+    """
+    from rocrate_tabular.tabulator import ROCrateTabulator
+
+    return ROCrateTabulator()
+
+
+def _download_semaphore() -> asyncio.Semaphore:
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    semaphore = _download_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _download_semaphores[loop] = asyncio.Semaphore(ASYNC_DOWNLOAD_LIMIT)
+    return semaphore
 
 # -------------------------------------------------------------
 # Class responsible for loading, unpacking, and processing
@@ -46,6 +150,69 @@ class LDaCATabulator:
     ----------
     url : str
         URL of the zipped RO-Crate corpus.
+    refresh : bool, optional
+        Ignore any cached copy and download, extract and tabulate the corpus
+        again. Default is ``False``.
+    offline : bool, optional
+        Never contact the server; use the cached copy of the corpus or raise
+        ``FileNotFoundError`` if there is none. Default is ``False``.
+    extract : {"all", "text", "metadata"}, optional
+        Which archive members to extract. ``"text"`` keeps only the crate
+        metadata and the files referenced by the text properties, which is
+        all tabulation needs; ``"metadata"`` keeps only the crate metadata.
+        Default is ``"all"``.
+    include : list[str] | None, optional
+        Glob patterns of archive members that are always extracted.
+    exclude : list[str] | None, optional
+        Glob patterns of archive members that are not extracted, such as
+        ``["Audio/*"]``.
+    resumable : bool, optional
+        Download the ZIP to a ``.zip.part`` file that later attempts resume
+        with range requests, instead of extracting it while it streams.
+        Default is ``False``.
+    checksum : str | None, optional
+        Expected ``"<algorithm>:<hex digest>"`` of the ZIP, such as
+        ``"sha256:..."``. The download is verified before extraction.
+        Implies ``resumable``.
+    cache_bytes : int | None, optional
+        Memory budget in bytes for keeping the DataFrames returned by the
+        ``get_*`` accessors, so repeated calls skip the database. The least
+        recently used frames are evicted first and callers always receive a
+        copy. Default is ``None`` (no caching).
+    arrow : bool, optional
+        Keep a copy of each cleaned entity table as an Arrow IPC file next to
+        the database (in ``<database>.arrow/``) and, on later loads,
+        memory-map it into an Arrow-backed DataFrame instead of reading
+        SQLite. Requires ``pyarrow``. Default is ``False``.
+    lazy : bool, optional
+        Defer all work until it is needed. Construction only records the
+        URL; ``get_corpus_info()`` then reads just the crate metadata, and
+        the corpus is extracted and tabulated on the first table access.
+        Default is ``False``.
+    progress : callable | None, optional
+        Hook called as ``progress(event, info)`` when a load stage starts or
+        ends, as bytes arrive and when a table is read (see ``LoadStats``).
+    max_null_prop : float, optional
+        Columns with a larger proportion of NULLs are left out by the
+        ``get_*`` accessors unless ``full_df=True``. Default is 0.99.
+    incremental : bool, optional
+        When a new version of a cached corpus is downloaded, update the
+        entity tables already materialised in its database in place instead
+        of tabulating the whole crate again: only the rows of entities that
+        changed, or whose expanded properties or text files changed, are
+        rebuilt. Falls back to a full build when more than half of the
+        entities changed or the update fails. Default is ``False``.
+    cache_dir : str | path-like | None, optional
+        Directory holding the ``ldacaCollections/`` and ``databases/``
+        caches. Projects pointing at the same directory share their corpora.
+        Default is the ``LDACA_CACHE_DIR`` environment variable, or the
+        working directory.
+    cache_quota : int | str | None, optional
+        Disk budget of the cache, in bytes or as e.g. ``"20G"``. After a
+        corpus is downloaded and built, the least recently loaded other
+        corpora are evicted until the cache fits (see ``cache_prune``).
+        Default is the ``LDACA_CACHE_QUOTA`` environment variable, or no
+        limit.
 
     Attributes
     ----------
@@ -54,27 +221,171 @@ class LDaCATabulator:
     tb : ROCrateTabulator
         The underlying tabulator instance used to inspect the crate.
     database : path-like
-        Path to the extracted SQLite database.
+        Path to the extracted SQLite database, or ``None`` while a lazy
+        corpus has not been extracted.
     extract_to : path-like
-        Directory where the corpus archive was extracted.
+        Directory where the corpus archive was extracted, or ``None`` while
+        a lazy corpus has not been extracted.
+    stats : LoadStats
+        Stage timings, download and extraction sizes, entity table shapes
+        and cache hits of this corpus. ``stats.as_dict()`` gives them as
+        JSON-serialisable data.
+
+    Notes
+    -----
+    One instance can serve the accessors from many threads. Each thread
+    reads through its own connection, and tables are materialised one at a
+    time: concurrent requests for a table that is being built wait for that
+    build instead of starting another.
     """
 
     url: str
     text_prop: str = TEXT_PROP
-    tb: ROCrateTabulator = field(default_factory=ROCrateTabulator)
+    tb: ROCrateTabulator = field(default_factory=_new_tabulator)
+    refresh: bool = False
+    offline: bool = False
+    extract: str = "all"
+    include: List[str] | None = None
+    exclude: List[str] | None = None
+    resumable: bool = False
+    checksum: str | None = None
+    cache_bytes: int | None = None
+    arrow: bool = False
+    lazy: bool = False
+    progress: Callable[[str, dict], None] | None = None
+    max_null_prop: float = MAX_NULL_PROP
+    incremental: bool = False
+    cache_dir: str | Path | None = None
+    cache_quota: int | str | None = None
+    database: Path | None = field(default=None, init=False, repr=False)
+    extract_to: Path | None = field(default=None, init=False, repr=False)
+    _graph: CrateGraph | None = field(default=None, init=False, repr=False)
+    _pending_record: dict | None = field(default=None, init=False, repr=False)
+    _pending_update: UpdatePlan | None = field(default=None, init=False, repr=False)
+    _needs_build: bool = field(default=False, init=False, repr=False)
+    _frame_cache: FrameCache | None = field(default=None, init=False, repr=False)
+    _stats: LoadStats | None = field(default=None, init=False, repr=False)
+    _corpus_info: dict | None = field(default=None, init=False, repr=False)
+    _connections: ReadConnections | None = field(default=None, init=False, repr=False)
+    _locks: dict | None = field(default=None, init=False, repr=False)
+    _tabulators: dict | None = field(default=None, init=False, repr=False)
+    # Set for corpora of a collection, which enforces the quota once for all of them
+    _defer_quota: bool = field(default=False, init=False, repr=False)
 
     
     def __post_init__(self):
+        if self.refresh and self.offline:
+            raise ValueError("refresh and offline cannot both be True.")
+        if not 0 <= self.max_null_prop <= 1:
+            raise ValueError("max_null_prop must be between 0 and 1")
+        # Raises on a malformed quota before anything is downloaded
+        cache_quota(self.cache_quota)
         
-        self.database, self.extract_to = self._unzip_corpus(
-        self.url,
-        tb=self.tb
-        )
+        if self.arrow:
+            require_pyarrow()
+
+        if self.cache_bytes:
+            self._frame_cache = FrameCache(self.cache_bytes)
+
+        if not self.lazy:
+            self.database, self.extract_to = self._unzip_corpus(
+            self.url,
+            tb=self.tb,
+            overwrite=self.refresh,
+            offline=self.offline,
+            extract=self.extract,
+            include=self.include,
+            exclude=self.exclude,
+            resumable=self.resumable,
+            checksum=self.checksum,
+            )
         
         self.tb.config = self.load_config(GENERAL_CONFIG)
         
         self.tb.text_prop = self.text_prop
+
+    @property
+    def stats(self) -> LoadStats:
+        """
+        Instrumentation of this corpus load (see ``LoadStats``).
+        """
+        if self._stats is None:
+            with _LOCKS_GUARD:
+                if self._stats is None:
+                    self._stats = LoadStats(label=self.url, callback=self.progress)
+        return self._stats
         
+    @classmethod
+    async def aload(
+        cls,
+        url: str,
+        semaphore: asyncio.Semaphore | None = None,
+        build_executor: Executor | None = None,
+        prune: bool = True,
+        **options,
+        ) -> "LDaCATabulator":
+        """
+        Load a corpus without blocking the running event loop.
+
+        The download and extraction run on the loop's default executor while
+        holding ``semaphore``, which bounds how many corpora are fetched at
+        once (by default a per-loop semaphore of ``ASYNC_DOWNLOAD_LIMIT``).
+        Tabulation then runs on ``build_executor``; with a
+        ``ProcessPoolExecutor`` it gets its own process and
+        ``ROCrateTabulator``. Sync and async loads share the same
+        ``ldacaCollections/`` and ``databases/`` caches.
+
+        Parameters
+        ----------
+        url : str
+            URL of the zipped RO-Crate corpus.
+        semaphore : asyncio.Semaphore | None, optional
+            Limit on concurrent downloads.
+        build_executor : concurrent.futures.Executor | None, optional
+            Executor for building the database. Default is the loop's default
+            executor.
+        prune : bool, optional
+            Evict other corpora once this one is loaded if the cache exceeds
+            its quota. Collections pass ``False`` and prune once for all of
+            their corpora. Default is ``True``.
+        **options
+            Other ``LDaCATabulator`` arguments. With ``lazy=True`` nothing is
+            loaded.
+
+        Returns
+        -------
+        LDaCATabulator
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        tab = await loop.run_in_executor(None, lambda: cls(url, **{**options, "lazy": True}))
+        tab._defer_quota = not prune
+        if options.get("lazy"):
+            return tab
+
+        async with semaphore or _download_semaphore():
+            await loop.run_in_executor(None, tab._ensure_extracted)
+
+        if tab._needs_build:
+            if build_executor is None:
+                await loop.run_in_executor(None, tab._ensure_database)
+            else:
+                with tab.stats.stage("tabulate"):
+                    await loop.run_in_executor(
+                        build_executor,
+                        build_corpus_database,
+                        str(tab.extract_to),
+                        str(tab.database),
+                        tab._pending_record,
+                        tab._pending_update,
+                    )
+                tab._needs_build = False
+                tab._pending_record = None
+                tab._pending_update = None
+                tab._enforce_quota()
+        return tab
+
     # -----------------------------------------------
     # Helper methods
     # -----------------------------------------------
@@ -86,41 +397,26 @@ class LDaCATabulator:
         return safe_name or "rocrate"
 
     @staticmethod
-    def _get_corpus_name_from_metadata(extract_to: Path, zip_url: str) -> str | None:
+    def _get_corpus_name_from_metadata(
+        extract_to: Path,
+        zip_url: str,
+        graph: CrateGraph | None = None,
+        ) -> str | None:
         """
         Read the corpus display name from ro-crate-metadata.json, if available.
-        """
-        metadata_path = extract_to / "ro-crate-metadata.json"
-        if not metadata_path.exists():
-            return None
 
-        data = json.loads(metadata_path.read_text(encoding="utf-8"))
-        graph = data.get("@graph", [])
+        An already parsed graph of the same crate can be passed to avoid
+        reading the file again.
+        """
+        if graph is None:
+            metadata_path = extract_to / METADATA_FILE
+            if not metadata_path.exists():
+                return None
+            graph = CrateGraph.from_file(metadata_path)
 
         parsed = urlparse(zip_url)
         corpus_id = unquote(Path(parsed.path).name).removesuffix(".zip")
-
-        corpus_node = next((item for item in graph if item.get("@id") == corpus_id), None)
-        if corpus_node and corpus_node.get("name"):
-            return str(corpus_node["name"])
-
-        dataset_node = next(
-            (
-                item
-                for item in graph
-                if (
-                    ("Dataset" in item.get("@type", []))
-                    if isinstance(item.get("@type"), list)
-                    else item.get("@type") == "Dataset"
-                )
-                and item.get("name")
-            ),
-            None,
-        )
-        if dataset_node:
-            return str(dataset_node["name"])
-
-        return None
+        return graph.corpus_name(corpus_id)
 
     @staticmethod
     def _unique_storage_names(
@@ -153,43 +449,334 @@ class LDaCATabulator:
         return folder_name, db_name
 
     @staticmethod
-    def _metadata_matches_zip_url(metadata_path: Path, zip_url: str) -> bool:
+    def _read_cached_source(extract_to: Path, database: Path, zip_url: str) -> dict | None:
         """
-        Return True when metadata appears to describe the corpus from zip_url.
+        Return the source record of a previous build of zip_url, if it is complete.
         """
-        if not metadata_path.exists():
-            return False
-
-        try:
-            data = json.loads(metadata_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            return False
+        if not (extract_to / "ro-crate-metadata.json").exists():
+            return None
 
-        graph = data.get("@graph", [])
-        parsed = urlparse(zip_url)
-        corpus_id = unquote(Path(parsed.path).name).removesuffix(".zip")
-        if not corpus_id:
-            return False
+        record = read_source_record(database)
+        if record is None or record.get("url") != zip_url:
+            return None
+        return record
 
-        candidates = {corpus_id, f"./{corpus_id}"}
-        return any(item.get("@id") in candidates for item in graph if isinstance(item, dict))
+    @staticmethod
+    def _claim_storage(database: Path, zip_url: str) -> None:
+        """
+        Mark database as being (re)built from zip_url: its source record
+        holds only the URL, so it is not reused until the build completes,
+        but other corpora see that its name is taken.
+        """
+        write_source_record(database, {"url": zip_url})
 
     @staticmethod
-    def _find_existing_extract_for_url(extract_root: Path, zip_url: str) -> Path | None:
+    def _allocate_storage(
+        extract_to: Path,
+        database: Path,
+        zip_url: str,
+        previous: tuple[Path, Path] | None = None,
+        ) -> tuple[Path, Path]:
         """
-        Find an already-extracted corpus folder matching zip_url.
+        Return the folder and database to install zip_url into, claimed for
+        it (see ``_claim_storage``).
+
+        extract_to and database are used unless their database was built
+        from another URL: corpora with the same name then get a numbered
+        folder, preferably the one of their previous version. Names are
+        allocated one process at a time.
         """
-        if not extract_root.exists():
-            return None
+        extract_root, db_root = extract_to.parent, database.parent
+        with FileLock(corpus_lock_path(db_root, STORAGE_NAMES_LOCK)):
+            owner = (read_source_record(database) or {}).get("url")
+            if owner is not None and owner != zip_url:
+                taken = extract_to.name
+                numbered = re.compile(rf"{re.escape(extract_to.name)}_\d+")
+                if previous is not None and numbered.fullmatch(previous[0].name):
+                    extract_to, database = previous
+                else:
+                    folder, db_name = LDaCATabulator._unique_storage_names(
+                        extract_root, db_root, extract_to.name
+                    )
+                    extract_to, database = extract_root / folder, db_root / db_name
+                logger.info("%s is taken by %s; storing %s as %s.", taken, owner, zip_url, extract_to.name)
+            LDaCATabulator._claim_storage(database, zip_url)
+        return extract_to, database
+
+    def _storage_roots(self) -> tuple[Path, Path]:
+        """
+        Return the ``(extract_root, db_root)`` directories under the cache
+        root, creating them.
+        """
+        return storage_roots(self.cache_dir)
 
-        for child in extract_root.iterdir():
-            if not child.is_dir():
-                continue
-            metadata_path = child / "ro-crate-metadata.json"
-            if LDaCATabulator._metadata_matches_zip_url(metadata_path, zip_url):
-                return child
+    def _enforce_quota(self, url: str | None = None) -> None:
+        """
+        Evict the least recently loaded corpora other than url (by default
+        this corpus) until the cache fits in its quota, if one is set. Left
+        to the collection for its corpora (see ``LDaCACollection.load``).
+        """
+        if not self._defer_quota:
+            enforce_quota(self.cache_quota, self.cache_dir, keep={url or self.url})
+
+    def _fetch_corpus(
+        self,
+        zip_url: str,
+        folder_name: str | None = None,
+        db_name: str | None = None,
+        overwrite: bool = True,
+        offline: bool = False,
+        extract: str = "all",
+        include: List[str] | None = None,
+        exclude: List[str] | None = None,
+        resumable: bool = False,
+        checksum: str | None = None,
+        ):
+        """
+        Download and extract stage of ``_unzip_corpus``.
+
+        Returns
+        -------
+        tuple
+            ``(database_path, extract_path, record, needs_build)``. When
+            ``needs_build`` is ``False`` the cached database can be used as
+            is; otherwise ``_build_database`` must tabulate the folder and
+            store ``record`` (``None`` for a folder reused without download).
+        """
+
+        user_provided_folder = folder_name is not None
+        user_provided_db = db_name is not None
+
+        # Resolve initial target names
+        default_folder_name, default_db_name = self._names_from_zip_url(zip_url)
+        if folder_name is None:
+            folder_name = default_folder_name
+        if db_name is None:
+            db_name = default_db_name
+
+        extract_root, db_root = self._storage_roots()
+
+        extract_to = extract_root / folder_name
+        database = db_root / db_name
+
+        registry = CorpusRegistry(extract_root, db_root)
+
+        # Resolve to the already-known corpus folder (metadata-based name) when present.
+        # This keeps repeated loads on the same path instead of creating suffixed folders.
+        entry = None
+        if not user_provided_folder and not user_provided_db:
+            entry = registry.lookup(zip_url)
+            if entry is not None:
+                extract_to = entry["extract_to"]
+                folder_name = extract_to.name
+                database = entry["database"]
+            elif extract_to.exists():
+                overwrite = True
+
+        # A previous build can only be reused when it recorded its source
+        # and was extracted with the same member selection.
+        selector = MemberSelector(
+            extract,
+            text_props=(self.text_prop, INDEXABLE_TEXT_PROP),
+            include=include,
+            exclude=exclude,
+        )
+        selection = selector.key
+        cached = None
+        if not overwrite:
+            if user_provided_folder or user_provided_db:
+                cached = self._read_cached_source(extract_to, database, zip_url)
+            else:
+                cached = entry
+            if cached is not None and cached.get("selection") != selection:
+                cached = None
+            if cached is None and not user_provided_folder and not user_provided_db:
+                overwrite = True
+
+        if offline:
+            if cached is None:
+                raise FileNotFoundError(f"No cached copy of '{zip_url}' is available offline.")
+            self.stats.hit("corpus")
+            registry.touch(zip_url)
+            return database, extract_to, None, False
+
+        metadata_path = extract_to / "ro-crate-metadata.json"
+        needs_download = overwrite or cached is not None or (not metadata_path.exists())
+
+        record = None
+        # Download/extract if metadata is missing, the cache must be validated, OR overwrite=True
+        if needs_download:
+            # Members are streamed into a staging folder, so a cached copy
+            # stays usable until the new one is complete.
+            staging = extract_root / f".{folder_name}.partial"
+            if staging.exists():
+                shutil.rmtree(staging)
+            staging.mkdir(parents=True)
+            members = {}
+            try:
+                with self.stats.stage("fetch"):
+                    record = fetch_archive(
+                        zip_url,
+                        staging,
+                        cached,
+                        selector,
+                        resumable=resumable,
+                        checksum=checksum,
+                        stats=self.stats,
+                        members=members,
+                    )
+            except BaseException:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+
+            reused = record is None or (cached is not None and same_archive(record["digest"], cached.get("digest")))
+            self.stats.hit("corpus", reused)
+            if reused:
+                shutil.rmtree(staging)
+                if record is not None:
+                    record = write_source_record(
+                        database,
+                        {**record, "selection": selection, "built_at": cached.get("built_at")},
+                    )
+                    registry.register(zip_url, extract_to, database, record)
+                else:
+                    registry.touch(zip_url)
+                return database, extract_to, None, False
+            record["selection"] = selection
+            count, size = directory_usage(staging)
+            self.stats.add("members_extracted", count)
+            self.stats.add("bytes_extracted", size)
+
+            # The graph is parsed once here and shared by later lookups
+            graph = selector.graph
+            if graph is None and (staging / METADATA_FILE).exists():
+                graph = CrateGraph.from_file(staging / METADATA_FILE)
+
+            with self.stats.stage("install"):
+                previous = (extract_to, database) if cached is not None else None
+                update = None
+                if self.incremental and previous is not None and graph is not None:
+                    update = self._plan_update(extract_to, database, members, graph)
+
+                if user_provided_folder or user_provided_db:
+                    self._claim_storage(database, zip_url)
+                else:
+                    # Prefer the crate corpus name, unless another URL has it
+                    if graph is not None:
+                        corpus_name = self._get_corpus_name_from_metadata(staging, zip_url, graph)
+                        if corpus_name:
+                            desired_folder = self._make_clean_name(corpus_name)
+                            extract_to = extract_root / desired_folder
+                            database = db_root / f"{desired_folder}.db"
+                    extract_to, database = self._allocate_storage(
+                        extract_to, database, zip_url, previous
+                    )
+
+                # A renamed corpus is built in full under its new name
+                if update is not None and database != previous[1]:
+                    update = None
+                self._pending_update = update
+
+                with self._database_lock(database):
+                    replace_directory(staging, extract_to)
+                    write_members(self._members_path(database), members)
+                    if graph is not None:
+                        graph.save(
+                            self._graph_cache_path(database),
+                            CrateGraph.source_key(extract_to / METADATA_FILE),
+                        )
+                        self._graph = graph
+
+                # A republished corpus may have been renamed; drop the old copy.
+                if previous is not None and previous[0] != extract_to:
+                    with self._database_lock(previous[1]):
+                        shutil.rmtree(previous[0], ignore_errors=True)
+                        remove_database(previous[1])
+                        self._graph_cache_path(previous[1]).unlink(missing_ok=True)
+                        self._members_path(previous[1]).unlink(missing_ok=True)
+
+        return database, extract_to, record, True
 
-        return None
+    @staticmethod
+    def _build_database(
+        tb: ROCrateTabulator,
+        extract_to: Path,
+        database: Path,
+        record: dict | None,
+        update: UpdatePlan | None = None,
+        ):
+        """
+        Tabulate an extracted corpus and record the source it was built from.
+        The database is switched to WAL mode, so later reads do not wait for
+        tables being materialised.
+
+        The crate is tabulated into a temporary file next to database, which
+        replaces it with an atomic rename once complete: other processes see
+        either the previous database or the finished one. With an update
+        plan, the database of the previous version is updated in place
+        instead (see ``incremental.apply_update``), unless that fails.
+
+        Callers hold the database file lock (see ``_database_lock``).
+        """
+        if update is not None:
+            try:
+                graph = CrateGraph.load(
+                    extract_to / METADATA_FILE, LDaCATabulator._graph_cache_path(database)
+                )
+                patched = apply_update(update, graph, extract_to, database, _new_tabulator)
+                logger.info("Updated %s in place: %s", database.name, ", ".join(patched) or "no tables")
+            except Exception:
+                logger.warning("Incremental update of %s failed; rebuilding it.", database.name, exc_info=True)
+                update = None
+        if update is None:
+            tmp = database.with_name(f".{database.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            remove_database(tmp)
+            try:
+                tb.crate_to_db(str(extract_to), str(tmp))
+                # tb's connection is to the temporary path; reopened on use
+                db = getattr(tb, "db", None)
+                if db is not None:
+                    db.close()
+                    tb.db = None
+                clear_table_records(tmp)
+                if record is not None:
+                    record = write_source_record(tmp, record)
+                publish_database(tmp, database)
+            except BaseException:
+                remove_database(tmp)
+                raise
+        elif record is not None:
+            record = write_source_record(database, record)
+        enable_wal(database)
+        ArrowStore.for_database(database).clear()
+        if record is not None:
+            CorpusRegistry(extract_to.parent, database.parent).register(
+                record["url"], extract_to, database, record
+            )
+
+    @staticmethod
+    def _build_if_needed(
+        tb: ROCrateTabulator,
+        extract_to: Path,
+        database: Path,
+        record: dict | None,
+        update: UpdatePlan | None = None,
+        ) -> bool:
+        """
+        Run ``_build_database`` holding the database file lock, unless another
+        process built the database from the same download meanwhile.
+        Returns ``False`` when the build was left out.
+        """
+        with LDaCATabulator._database_lock(database):
+            if record is not None:
+                built = read_source_record(database) or {}
+                if (
+                    all(built.get(k) == record.get(k) for k in ("url", "selection"))
+                    and same_archive(built.get("digest"), record.get("digest"))
+                ):
+                    return False
+            LDaCATabulator._build_database(tb, extract_to, database, record, update)
+        return True
 
     def _unzip_corpus(
         self,
@@ -198,6 +785,12 @@ class LDaCATabulator:
         folder_name: str | None = None,
         db_name: str | None = None,
         overwrite: bool = True,
+        offline: bool = False,
+        extract: str = "all",
+        include: List[str] | None = None,
+        exclude: List[str] | None = None,
+        resumable: bool = False,
+        checksum: str | None = None,
         ):
         """
         Download, extract, and tabulate an RO-Crate corpus into a database.
@@ -206,6 +799,19 @@ class LDaCATabulator:
         contents into a local folder, and converts the extracted RO-Crate dataset
         into a database.
 
+        By default the archive is never written to disk: members are
+        extracted straight from the HTTP response (see
+        ``ingest.fetch_archive``) into a staging folder that replaces the
+        target folder once complete. Transient network failures are retried
+        with exponential backoff.
+
+        Every build records the URL and the server validators (ETag,
+        Last-Modified) together with a SHA-256 digest of the ZIP in the
+        database and in the ``CorpusRegistry`` index. A later call for the same URL sends a conditional request
+        with those validators and reuses the existing folder and database,
+        without extracting or tabulating, when the server reports no change
+        or the downloaded archive has the same digest.
+
         Parameters
         ----------
         zip_url : str
@@ -221,10 +827,34 @@ class LDaCATabulator:
             Name of the output SQLite database file. Defaults to
             the inferred folder name with `.db` suffix if not provided.
         overwrite : bool, optional
-            If `True` and the target extraction folder already exists, it will be
-            deleted and recreated before extraction. If `False` and the folder
-            already exists, no download or extraction occurs and the existing
-            folder is used. Default is `False`.
+            If `True`, any cached copy is ignored: the target folder and
+            database are deleted and rebuilt from a fresh download. If `False`,
+            a cached copy is reused while its validators still hold.
+            Default is `True`.
+        offline : bool, optional
+            If `True`, the server is never contacted and the cached copy is
+            returned as is. Raises ``FileNotFoundError`` when there is none.
+            Default is `False`.
+        extract : {"all", "text", "metadata"}, optional
+            Which archive members to extract (see ``ingest.MemberSelector``).
+            ``"text"`` keeps the crate metadata plus the files referenced by
+            ``text_prop`` or ``ldac:indexableText``. Default is `"all"`.
+        include : list[str] | None, optional
+            Glob patterns of archive members to extract regardless of
+            ``extract``.
+        exclude : list[str] | None, optional
+            Glob patterns of archive members not to extract, e.g.
+            ``["Audio/*", "*.png"]``.
+        resumable : bool, optional
+            Download the archive to a ``.zip.part`` file first, so an
+            interrupted download continues from where it stopped on the next
+            attempt. Default is `False`.
+        checksum : str | None, optional
+            Expected ``"<algorithm>:<hex digest>"`` of the archive, verified
+            before extraction. Implies ``resumable``.
+
+        A cached copy extracted with a different member selection is not
+        reused.
 
         Returns
         -------
@@ -235,96 +865,33 @@ class LDaCATabulator:
 
         Notes
         -----
-        - If `overwrite=False` and the folder already exists, the ZIP file is
-        not downloaded or re-extracted; the existing content is used.
-        - `crate_to_db()` is always called, meaning the database will be built or
-        updated regardless of extraction behavior.
+        - If `overwrite=False` and explicitly named folder already exists
+        without a recorded source, the ZIP file is not downloaded or
+        re-extracted; the existing content is tabulated again.
+        - `crate_to_db()` is only called when the corpus was (re)extracted or
+        has no reusable database.
         """
-
-        user_provided_folder = folder_name is not None
-        user_provided_db = db_name is not None
-
-        # Resolve initial target names
-        default_folder_name, default_db_name = self._names_from_zip_url(zip_url)
-        if folder_name is None:
-            folder_name = default_folder_name
-        if db_name is None:
-            db_name = default_db_name
-
-        cwd = Path.cwd()
-        extract_root = cwd / "ldacaCollections"
-        db_root = cwd / "databases"
-        extract_root.mkdir(parents=True, exist_ok=True)
-        db_root.mkdir(parents=True, exist_ok=True)
-
-        extract_to = extract_root / folder_name
-        database = db_root / db_name
-
-        # Resolve to the already-known corpus folder (metadata-based name) when present.
-        # This keeps repeated loads on the same path instead of creating suffixed folders.
-        if not user_provided_folder and not user_provided_db:
-            cached_extract = self._find_existing_extract_for_url(extract_root, zip_url)
-            if cached_extract is not None:
-                extract_to = cached_extract
-                folder_name = cached_extract.name
-                database = db_root / f"{cached_extract.name}.db"
-                # Current policy: fresh rebuild for repeated corpus requests.
-                overwrite = True
-            elif not overwrite and extract_to.exists():
-                overwrite = True
-
-        zip_file = extract_root / f"{folder_name}.zip"
-
-        if overwrite:
-            database.unlink(missing_ok=True)
-
-        metadata_path = extract_to / "ro-crate-metadata.json"
-        needs_download = overwrite or (not metadata_path.exists())
-
-        # Destination
-        if extract_to.exists() and overwrite:
-            shutil.rmtree(extract_to)
-
-        # Download/extract if metadata is missing OR overwrite=True
-        if needs_download:
-            extract_to.mkdir(parents=True, exist_ok=True)
-            with requests.get(zip_url, stream=True, timeout=20) as resp:
-                resp.raise_for_status()
-                with open(zip_file, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                        if chunk:
-                            f.write(chunk)
-
-            with zipfile.ZipFile(zip_file, "r") as zf:
-                zf.extractall(extract_to)
-
-            zip_file.unlink(missing_ok=True)
-
-            # If names were not explicitly provided, prefer crate corpus name.
-            if not user_provided_folder and not user_provided_db:
-                corpus_name = self._get_corpus_name_from_metadata(extract_to, zip_url)
-                if corpus_name:
-                    desired_folder = self._make_clean_name(corpus_name)
-                    if desired_folder and desired_folder != extract_to.name:
-                        desired_extract_to = extract_root / desired_folder
-                        desired_db = f"{desired_folder}.db"
-                        if desired_extract_to.exists():
-                            if overwrite:
-                                shutil.rmtree(desired_extract_to)
-                            else:
-                                desired_folder, desired_db = self._unique_storage_names(
-                                    extract_root,
-                                    db_root,
-                                    desired_folder
-                                )
-                                desired_extract_to = extract_root / desired_folder
-
-                        shutil.move(str(extract_to), str(desired_extract_to))
-                        extract_to = desired_extract_to
-                        database = db_root / desired_db
-
-        # Build and connect DB
-        tb.crate_to_db(str(extract_to), str(database))
+        # Other processes loading the same URL wait here, then reuse the result
+        lock = nullcontext() if offline else self._corpus_lock(zip_url, self._storage_roots()[1])
+        with lock:
+            database, extract_to, record, needs_build = self._fetch_corpus(
+                zip_url,
+                folder_name=folder_name,
+                db_name=db_name,
+                overwrite=overwrite,
+                offline=offline,
+                extract=extract,
+                include=include,
+                exclude=exclude,
+                resumable=resumable,
+                checksum=checksum,
+            )
+            if needs_build:
+                with self.stats.stage("tabulate"), self._database_lock(database):
+                    self._build_database(tb, extract_to, database, record, self._pending_update)
+                self._pending_update = None
+        if needs_build:
+            self._enforce_quota(zip_url)
         return database, extract_to
     
     
@@ -382,22 +949,305 @@ class LDaCATabulator:
         cols_to_drop = [c for c in df.columns if "_id" in c]
         return df.drop(columns=cols_to_drop, errors="ignore")
 
-    
+    # -----------------------------------------------
+    # Lazy loading stages
+    # -----------------------------------------------
+    def _plan_update(
+        self,
+        extract_to: Path,
+        database: Path,
+        members: dict,
+        graph: CrateGraph,
+        ) -> UpdatePlan | None:
+        """
+        Compare the cached version of a corpus with the new one, given its
+        graph and extracted members, and return how to update its database
+        in place, or ``None`` when it must be built in full.
+        """
+        metadata_path = extract_to / METADATA_FILE
+        if not database.exists() or not metadata_path.exists():
+            return None
+        try:
+            old_graph = CrateGraph.load(metadata_path, self._graph_cache_path(database))
+        except (OSError, ValueError):
+            return None
+        old_members = read_members(self._members_path(database))
+        if old_members is None:
+            # Extracted before members were recorded: read its text files once
+            paths = text_files(graph, (self.text_prop, INDEXABLE_TEXT_PROP))
+            old_members = file_members(extract_to, paths)
+        return plan_update(
+            old_graph,
+            graph,
+            old_members,
+            members,
+            self._table_configs(),
+            self.text_prop,
+            (self.text_prop, INDEXABLE_TEXT_PROP),
+        )
+
+    def _table_configs(self) -> list[dict]:
+        """
+        Return the configurations the entity tables of this corpus may have
+        been materialised with: the current one, the general one and the
+        corpus-specific one when there is a config file for it.
+        """
+        configs = [self.tb.config] if getattr(self.tb, "config", None) else []
+        paths = [GENERAL_CONFIG]
+        match = re.search(r'~(\d+)\.', self.url)
+        if match:
+            paths.append(f"{CORPUS_CONFIG_DIR}{match.group(1)}.json")
+        for path in paths:
+            if Path(path).is_file():
+                config = self.load_config(path)
+                if config not in configs:
+                    configs.append(config)
+        return configs
+
+    @staticmethod
+    def _graph_cache_path(database: Path) -> Path:
+        """
+        Return where the parsed crate graph of a corpus database is kept.
+        """
+        return Path(database).with_suffix(GRAPH_CACHE_SUFFIX)
+
+    @staticmethod
+    def _members_path(database: Path) -> Path:
+        """
+        Return where the CRC-32 and size of the extracted files of a corpus
+        database are kept (see ``incremental.write_members``).
+        """
+        return Path(database).with_suffix(MEMBERS_SUFFIX)
+
+    def _ensure_graph(self) -> CrateGraph:
+        """
+        Return the parsed crate graph, reading as little as possible.
+
+        The graph is parsed at most once per instance. It is taken from the
+        JSON graph cache kept next to the database while that matches the local
+        ro-crate-metadata.json, otherwise from the extracted or cached
+        metadata file, and otherwise read from the remote archive on its own.
+        """
+        if self._graph is not None:
+            return self._graph
+
+        local = self._local_metadata()
+        if local is not None:
+            self._graph = CrateGraph.load(*local)
+        elif self.offline:
+            self._ensure_extracted()
+            self._graph = CrateGraph.load(
+                Path(self.extract_to) / METADATA_FILE, self._graph_cache_path(self.database)
+            )
+        else:
+            self._graph = CrateGraph.from_bytes(read_remote_member(self.url, METADATA_FILE))
+        return self._graph
+
+    def _local_metadata(self) -> tuple[Path, Path] | None:
+        """
+        Return the paths of an extracted or cached ro-crate-metadata.json and
+        of its graph cache, or ``None`` if there is no local copy.
+        """
+        metadata_path = database = None
+        if self.extract_to is not None:
+            metadata_path = Path(self.extract_to) / METADATA_FILE
+            database = self.database
+        elif not self.refresh:
+            cached = CorpusRegistry(*self._storage_roots()).lookup(self.url)
+            if cached is not None:
+                metadata_path = cached["extract_to"] / METADATA_FILE
+                database = cached["database"]
+
+        if metadata_path is None or not metadata_path.exists():
+            return None
+        return metadata_path, self._graph_cache_path(database) if database is not None else None
+
+    def _ensure_extracted(self):
+        """
+        Download and extract the corpus unless that already happened.
+        """
+        if self.database is not None:
+            return
+        with self._lock("build"):
+            if self.database is not None:
+                return
+            lock = nullcontext() if self.offline else self._corpus_lock(self.url, self._storage_roots()[1])
+            with lock:
+                database, extract_to, self._pending_record, self._needs_build = self._fetch_corpus(
+                    self.url,
+                    overwrite=self.refresh,
+                    offline=self.offline,
+                    extract=self.extract,
+                    include=self.include,
+                    exclude=self.exclude,
+                    resumable=self.resumable,
+                    checksum=self.checksum,
+                )
+            # Set last: other threads take a database as ready to use
+            self.extract_to, self.database = extract_to, database
+
+    def _ensure_database(self):
+        """
+        Extract the corpus and build its database unless that already happened.
+        """
+        self._ensure_extracted()
+        if not self._needs_build:
+            return
+        with self._lock("build"):
+            if not self._needs_build:
+                return
+            with self.stats.stage("tabulate"):
+                self._build_if_needed(
+                    self.tb,
+                    self.extract_to,
+                    self.database,
+                    self._pending_record,
+                    self._pending_update,
+                )
+            self._pending_record = None
+            self._pending_update = None
+            self._needs_build = False
+        self._enforce_quota()
+
+    @staticmethod
+    def _corpus_lock(url: str, db_root: Path) -> FileLock:
+        """
+        Return the file lock held while the corpus at url is downloaded into
+        the cache of db_root. Every process sharing the cache uses the same
+        lock file, so a URL is fetched by one of them at a time.
+        """
+        return FileLock(corpus_lock_path(db_root, url))
+
+    @staticmethod
+    def _database_lock(database: Path) -> FileLock:
+        """
+        Return the file lock held while a corpus database, or the folder it
+        is built from, is replaced, built or given a new table.
+        """
+        return FileLock(database_lock_path(database))
+
+    def _lock(self, name) -> threading.RLock:
+        """
+        Return the lock called name of this instance, created on first use:
+        ``"build"`` serialises downloads, builds and everything that uses a
+        tabulator, ``("table", <name>)`` one table's materialisation.
+        """
+        with _LOCKS_GUARD:
+            if self._locks is None:
+                self._locks = {}
+            return self._locks.setdefault(name, threading.RLock())
+
+    def _tabulator_for(self, config: dict) -> ROCrateTabulator:
+        """
+        Return the tabulator that materialises tables with config: ``tb``
+        for its own configuration, otherwise one kept per configuration, so
+        ``tb.config`` is never changed while other threads use it. Call with
+        the ``"build"`` lock held.
+        """
+        if config is self.tb.config or config == self.tb.config:
+            return self.tb
+        if self._tabulators is None:
+            self._tabulators = {}
+        key = json.dumps(config, sort_keys=True, default=str)
+        tb = self._tabulators.get(key)
+        if tb is None:
+            tb = _new_tabulator()
+            tb.config = config
+            tb.text_prop = self.tb.text_prop
+            self._tabulators[key] = tb
+        return tb
+
+    def _attach_tabulator(self, tb: ROCrateTabulator | None = None):
+        """
+        Open the existing database in tb (by default ``self.tb``) when the
+        corpus was reused from the cache and therefore never passed through
+        ``crate_to_db``.
+        """
+        tb = self.tb if tb is None else tb
+        if getattr(tb, "db", None) is None:
+            tb.crate_to_db(str(self.extract_to), str(self.database), rebuild=False)
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """
+        Return this thread's read-only connection to the database (see
+        ``connections.ReadConnections``).
+        """
+        with self._lock("connections"):
+            if self._connections is None or self._connections.database != Path(self.database):
+                if self._connections is not None:
+                    self._connections.close()
+                self._connections = ReadConnections(self.database)
+            connections = self._connections
+        return connections.get()
+
+    def close(self):
+        """
+        Close the database connections held by this corpus: the read
+        connections of every thread and those of its tabulators. The corpus
+        stays usable; a later access opens new connections.
+        """
+        if self._connections is not None:
+            self._connections.close()
+        with self._lock("build"):
+            for tb in [self.tb, *(self._tabulators or {}).values()]:
+                db = getattr(tb, "db", None)
+                if db is not None:
+                    db.close()
+                    tb.db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _load_entity_table(
         self,
         table_name: str,
-        columns: List[str] | None = None
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        max_null_prop: float | None = None,
+        text_column: str | None = None,
+        config: dict | None = None,
         ):
         """
         Load an entity table from the extracted SQLite database.
 
         This method checks whether the table exists in the RO-Crate, loads it
-        from the database.
+        from the database. Tables already materialised with the current
+        configuration (as recorded in the ``_ldaca_tables`` bookkeeping table
+        of the database) are read directly without being flattened again.
+
+        Column selection, filters and the row limit are part of the SQL
+        query, and unwanted columns are pruned from the table schema (and
+        null counts) before reading, so they are never materialised. Without
+        a filter, the null counts recorded when the table was materialised
+        are used instead of counting again.
 
         Parameters
         ----------
         table_name : str
             Name of the entity table to load.
+        columns : list[str] | None, optional
+            Columns to read, returned as requested. By default every column
+            except ID-like ones (containing ``"_id"``) is read.
+        where : dict | tuple[str, list] | None, optional
+            Row filter: a mapping of column to value (a list matches any of
+            its values, ``None`` matches NULL) or a ``(sql, params)`` tuple
+            whose SQL, used as is, must be trusted (see
+            ``query.where_clause``).
+        limit : int | None, optional
+            Maximum number of rows to read.
+        max_null_prop : float | None, optional
+            When given and ``columns`` is not, skip columns whose proportion
+            of NULLs among the filtered rows exceeds it.
+        text_column : str | None, optional
+            Column to replace by a ``text_ref`` handle column (see
+            ``load_texts``).
+        config : dict | None, optional
+            Configuration to materialise the table with. Default is
+            ``tb.config``.
 
         Returns
         -------
@@ -405,54 +1255,335 @@ class LDaCATabulator:
             The loaded and cleaned table, or ``None`` if the table is not
             present in the corpus.
         """
-        #TODO get_speaker() is giving an error when not in the corpus
-        # The reason is logging. 
-        try:
-            self.tb.entity_table(table_name)
-        except Exception:
-            print("No %s table in this corpus.", table_name)
+        if not self._ensure_entity_table(table_name, config):
             return None
-        
-        with sqlite3.connect(self.database) as conn:
-            if columns:
-                cols = ", ".join(f'"{c}"' for c in columns)
-            else:
-                cols = "*"
 
-            query = f"SELECT {cols} FROM {table_name}"
-            #return pd.read_sql(query, conn)
-            df = pd.read_sql(query, conn)
+        import pandas as pd
+
+        column_stats = None
+        if max_null_prop is not None and not columns and not where:
+            column_stats = self._column_stats(table_name)
+
+        conn = self._read_connection()
+        query, params, selected = self._entity_query(
+            conn, table_name, columns, where, limit, max_null_prop, text_column, column_stats
+        )
+        df = pd.read_sql(query, conn, params=params)
         
-        return self.drop_id_columns(df)
+        if not selected:
+            df = df.drop(columns="rowid")
+        return df
+
+    def _ensure_entity_table(self, table_name: str, config: dict | None = None) -> bool:
+        """
+        Materialise table_name in the database unless it already is, with
+        config (by default ``tb.config``). Returns ``False`` if the corpus
+        has no such table.
+
+        Concurrent calls for the same table wait for a single build, and
+        builds of different tables run one after the other, also across
+        processes sharing the database.
+        """
+        config = self.tb.config if config is None else config
+        self._ensure_database()
+        table_hash = config_hash(config, table_name, self.tb.text_prop)
+        if self._table_records().get(table_name) == table_hash:
+            return True
+        with self._lock(("table", table_name)):
+            # Built by a concurrent call while this one waited
+            if self._table_records().get(table_name) == table_hash:
+                return True
+            with self._lock("build"), self._database_lock(self.database):
+                # ... or by another process
+                if self._table_records().get(table_name) == table_hash:
+                    return True
+                if base_is_stale(self.database):
+                    # An incremental update could not patch the base tables;
+                    # the crate is tabulated in full before another is flattened.
+                    record = read_source_record(self.database)
+                    with self.stats.stage("tabulate"):
+                        self._build_database(self.tb, self.extract_to, self.database, record)
+                    for tb in (self._tabulators or {}).values():
+                        tb.db = None
+                    if self._connections is not None:
+                        self._connections.invalidate()
+                tb = self._tabulator_for(config)
+                self._attach_tabulator(tb)
+                try:
+                    with self.stats.stage("entity_table"):
+                        tb.entity_table(table_name)
+                except Exception:
+                    logger.warning("No %s table in this corpus.", table_name)
+                    return False
+                self._column_stats(table_name, refresh=True)
+                write_table_record(self.database, table_name, table_hash)
+        return True
+
+    def _table_records(self) -> dict:
+        """
+        Return the materialised tables of the database (see
+        ``bookkeeping.read_table_records``), read through this thread's
+        connection.
+        """
+        if not Path(self.database).exists():
+            return {}
+        return read_table_records(self.database, self._read_connection())
+
+    def _column_stats(self, table_name: str, refresh: bool = False) -> tuple[int, dict] | None:
+        """
+        Return ``(row_count, {column: non_null_count})`` of a materialised
+        entity table, or ``None`` if it does not exist.
+
+        The counts are gathered in one aggregate query when the table is
+        materialised and stored in the ``_ldaca_column_stats`` bookkeeping
+        table. They are gathered again with ``refresh`` or when the stored
+        ones do not match the table's columns (e.g. in databases built
+        before statistics were kept).
+        """
+        conn = self._read_connection()
+        stats = None if refresh else read_column_stats(self.database, table_name, conn)
+        schema = table_columns(conn, table_name)
+        if not schema:
+            return None
+        if stats is None or list(stats[1]) != schema:
+            stats = non_null_counts(conn, table_name, schema)
+            write_column_stats(self.database, table_name, *stats)
+        return stats
+
+    def describe_table(self, table_name: str):
+        """
+        Summarise the columns of an entity table from its stored null
+        statistics, without reading the table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the entity table, e.g. ``"RepositoryObject"``.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            One row per column, indexed by column name, with the
+            ``non_null`` and ``nulls`` counts, the ``null_prop`` and whether
+            the ``get_*`` accessors keep the column by default (``kept``:
+            not ID-like and at most ``max_null_prop`` NULLs). ``None`` if
+            the corpus has no such table.
+        """
+        if not self._ensure_entity_table(table_name):
+            return None
+        stats = self._column_stats(table_name)
+        if stats is None:
+            return None
+
+        import pandas as pd
+
+        row_count, counts = stats
+        rows = []
+        for column, non_null in counts.items():
+            null_prop = 1 - non_null / row_count if row_count else 0.0
+            rows.append({
+                "column": column,
+                "non_null": non_null,
+                "nulls": row_count - non_null,
+                "null_prop": null_prop,
+                "kept": "_id" not in column and null_prop <= self.max_null_prop,
+            })
+        columns = ["column", "non_null", "nulls", "null_prop", "kept"]
+        return pd.DataFrame(rows, columns=columns).set_index("column")
+
+    @staticmethod
+    def _entity_query(
+        conn: sqlite3.Connection,
+        table_name: str,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        max_null_prop: float | None = None,
+        text_column: str | None = None,
+        column_stats: tuple[int, dict] | None = None,
+        ) -> tuple[str, list, list]:
+        """
+        Build the query that reads an entity table, deciding from the schema
+        and null counts which columns to select. column_stats, the stored
+        counts of the whole table (see ``_column_stats``), are used instead
+        of counting when there is no filter.
+
+        When text_column is given, that column is left out and a
+        ``text_ref`` column holding each row's entity id is added instead,
+        to be resolved later with ``load_texts``.
+
+        Returns
+        -------
+        tuple
+            ``(query, params, output_columns)``. When every column was
+            pruned the query selects only ``rowid``, so the row count is kept.
+        """
+        schema = table_columns(conn, table_name)
+        where_sql, params = where_clause(where, schema, table_name)
+
+        if columns:
+            check_columns(columns, schema, table_name)
+            selected = list(columns)
+        else:
+            selected = [c for c in schema if "_id" not in c]
+            if max_null_prop is not None:
+                if not 0 <= max_null_prop <= 1:
+                    raise ValueError("max_null_prop must be between 0 and 1")
+                if column_stats is not None and not where_sql and all(c in column_stats[1] for c in selected):
+                    row_count, counts = column_stats
+                else:
+                    row_count, counts = non_null_counts(conn, table_name, selected, where_sql, params)
+                if row_count:
+                    selected = [
+                        c for c in selected
+                        if 1 - counts[c] / row_count <= max_null_prop
+                    ]
+
+        aliases = {}
+        if text_column is not None:
+            selected = [c for c in selected if c != text_column]
+            ref_source = ENTITY_ID_COLUMN if ENTITY_ID_COLUMN in schema else "rowid"
+            aliases[TEXT_REF_COLUMN] = ref_source
+
+        if not selected and not aliases:
+            aliases["rowid"] = "rowid"
+        query = select_query(table_name, selected, where_sql, limit, aliases)
+        return query, params, selected + [a for a in aliases if a != "rowid"]
 
     @staticmethod
     def drop_high_null_columns(
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        max_null_prop: float = MAX_NULL_PROP,
         ) -> pd.DataFrame: 
         
         """
-        Drop columns whose proportion of missing values exceeds a threshold of 0.99.
+        Drop columns whose proportion of missing values exceeds max_null_prop.
+
+        Nulls are counted one column at a time, so no boolean copy of the
+        whole frame is made. The accessors do this in SQLite instead (see
+        ``describe_table``).
 
         Parameters
         ----------
         df : pd.DataFrame
             Input DataFrame.
+        max_null_prop : float, optional
+            Largest proportion of missing values a kept column may have.
+            Default is 0.99.
 
         Returns
         -------
         pd.DataFrame
             DataFrame with high-null columns removed.
         """
-        MAX_NULL_PROP = 0.99
-        if not 0 <= MAX_NULL_PROP <= 1:
+        if not 0 <= max_null_prop <= 1:
             raise ValueError("max_null_prop must be between 0 and 1")
+        if not len(df):
+            return df
 
-        null_prop = df.isna().mean()
-        keep_mask = null_prop <= MAX_NULL_PROP
+        keep_mask = [
+            1 - df.iloc[:, i].count() / len(df) <= max_null_prop
+            for i in range(df.shape[1])
+        ]
+        return df.loc[:, keep_mask]
 
-        df_filtered = df.loc[:, keep_mask]
+    def _get_table(
+        self,
+        table_name: str,
+        full_df: bool = False,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        text_column: str | None = None,
+        config: dict | None = None,
+        ):
+        """
+        Load an entity table for the ``get_*`` accessors, leaving out ID-like
+        columns and, unless ``full_df``, columns with more than
+        ``max_null_prop`` NULLs. config is the configuration the table is
+        materialised with, by default ``tb.config``.
+
+        Results are served from the in-memory frame cache when one is
+        configured, keyed by table, query, ``full_df`` flag and config hash.
+        With ``arrow=True``, whole tables are also read from (or written to)
+        the Arrow IPC store next to the database.
+
+        The shape of the returned frame, the time taken and where it came
+        from are recorded in ``stats.tables``.
+        """
+        start = time.perf_counter()
+        config = self.tb.config if config is None else config
+        key = None
+        if self._frame_cache is not None:
+            key = (
+                table_name,
+                full_df,
+                tuple(columns) if columns else None,
+                json.dumps(where, sort_keys=True, default=str),
+                limit,
+                text_column,
+                None if full_df else self.max_null_prop,
+                config_hash(config, table_name, self.tb.text_prop),
+            )
+            df = self._frame_cache.get(key)
+            self.stats.hit("frame", df is not None)
+            if df is not None:
+                self.stats.record_table(table_name, df, time.perf_counter() - start, "cache")
+                return df
+
+        store = None
+        if self.arrow and columns is None and where is None and limit is None:
+            self._ensure_database()
+            store = ArrowStore.for_database(self.database)
+            arrow_args = (
+                self._make_clean_name(table_name),
+                self._arrow_variant(full_df) + ("-lazytext" if text_column else ""),
+                config_hash(config, table_name, self.tb.text_prop)[:16],
+            )
+            df = store.read(*arrow_args)
+            self.stats.hit("arrow", df is not None)
+            if df is not None:
+                self.stats.record_table(table_name, df, time.perf_counter() - start, "arrow")
+                return self._frame_cache.put(key, df) if key is not None else df
+
+        df = self._load_entity_table(
+            table_name,
+            columns=columns,
+            where=where,
+            limit=limit,
+            max_null_prop=None if full_df else self.max_null_prop,
+            text_column=text_column,
+            config=config,
+        )
+        if df is None:
+            return None
+
+        # Read back, so the first call returns the same Arrow-backed dtypes
+        # as later ones
+        if store is not None and store.write(*arrow_args, df):
+            df = store.read(*arrow_args)
+
+        self.stats.record_table(table_name, df, time.perf_counter() - start, "sqlite")
+        if key is not None:
+            df = self._frame_cache.put(key, df)
+        return df
 
-        return df_filtered
+    def _arrow_variant(self, full_df: bool) -> str:
+        """
+        Name the Arrow copy of a table by the null threshold it was cleaned with.
+        """
+        if full_df:
+            return "full"
+        if self.max_null_prop == MAX_NULL_PROP:
+            return "clean"
+        return f"clean{self.max_null_prop:g}"
+
+    def clear_cache(self):
+        """
+        Drop every DataFrame kept by the in-memory frame cache.
+        """
+        if self._frame_cache is not None:
+            self._frame_cache.clear()
 
     
     # ------------------------------------------------------------
@@ -461,29 +1592,200 @@ class LDaCATabulator:
 
     
     # get_text() method
-    def get_text(self, full_df: bool = False):
+    def get_text(
+        self,
+        full_df: bool = False,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        lazy_text: bool = False,
+        ):
         
         """
         Load the RepositoryObject table (a table that contain text) and return it in a cleaned form.
 
+        Parameters
+        ----------
+        full_df : bool, optional
+            Keep columns with more than ``max_null_prop`` NULLs. Default is
+            ``False``.
+        columns : list[str] | None, optional
+            Columns to load, returned as requested. By default all columns
+            except ID-like ones are loaded.
+        where : dict | tuple[str, list] | None, optional
+            Row filter applied in the database: a mapping of column to value
+            (a list matches any of its values, ``None`` matches NULL) or a
+            ``(sql, params)`` tuple such as ``("year >= ?", [1900])``. Only
+            the values are bound; the SQL must not come from user input.
+        limit : int | None, optional
+            Maximum number of rows to load.
+        lazy_text : bool, optional
+            Leave out the document bodies (the ``text_prop`` column) and add
+            a ``text_ref`` column instead, which ``load_texts`` resolves to
+            the texts. Default is ``False``.
+
         Returns
         -------
         pandas.DataFrame
         The cleaned RepositoryObject table.
         """
         
-        df = self._load_entity_table("RepositoryObject")
-        
-        if not full_df:
-            df = self.drop_high_null_columns(df)
-            
-        return self.drop_id_columns(df)
+        return self._get_table(
+            "RepositoryObject",
+            full_df,
+            columns=columns,
+            where=where,
+            limit=limit,
+            text_column=self.text_prop if lazy_text else None,
+        )
+
+    def load_texts(self, refs, batch_size: int = 500) -> pd.Series:
+        """
+        Load document bodies for the ``text_ref`` values of a lazy text table.
+
+        Texts are read from the database in batches of ``batch_size``. When
+        the table has no text column, they are read from the extracted files
+        the crate metadata points to.
+
+        Parameters
+        ----------
+        refs : iterable
+            ``text_ref`` values, e.g. ``df["text_ref"]`` of
+            ``get_text(lazy_text=True)``.
+        batch_size : int, optional
+            Number of texts fetched per query. Default is 500.
+
+        Returns
+        -------
+        pandas.Series
+            The texts, indexed by ``text_ref`` in the order given; missing
+            texts are ``None``.
+        """
+        refs = list(refs)
+        texts = {}
+        if self._ensure_entity_table("RepositoryObject"):
+            conn = self._read_connection()
+            schema = table_columns(conn, "RepositoryObject")
+            if self.text_prop in schema:
+                ref_source = ENTITY_ID_COLUMN if ENTITY_ID_COLUMN in schema else "rowid"
+                unique = list(dict.fromkeys(refs))
+                for start in range(0, len(unique), batch_size):
+                    batch = unique[start:start + batch_size]
+                    query = select_query(
+                        "RepositoryObject",
+                        [self.text_prop],
+                        f" WHERE {quote_identifier(ref_source)} IN ({', '.join('?' * len(batch))})",
+                        aliases={TEXT_REF_COLUMN: ref_source},
+                    )
+                    texts.update((ref, text) for text, ref in conn.execute(query, batch))
+            else:
+                texts = self._read_text_files(refs)
+        else:
+            texts = self._read_text_files(refs)
+
+        import pandas as pd
+
+        return pd.Series([texts.get(ref) for ref in refs], index=refs, name=self.text_prop, dtype=object)
+
+    def _read_text_files(self, refs) -> dict:
+        """
+        Read the files that text_prop points to for the given entity ids.
+        """
+        self._ensure_extracted()
+        wanted = set(refs)
+        texts = {}
+        graph = self._ensure_graph()
+        for node_id in wanted:
+            node = graph.get(node_id)
+            if node is None:
+                continue
+            targets = node.get(self.text_prop)
+            targets = targets if isinstance(targets, list) else [targets]
+            parts = []
+            for target in targets:
+                file_id = target.get("@id") if isinstance(target, dict) else target
+                path = Path(self.extract_to) / unquote(str(file_id)) if file_id else None
+                if path is not None and path.is_file():
+                    parts.append(path.read_text(encoding="utf-8", errors="replace"))
+            texts[node["@id"]] = "\n".join(parts) if parts else None
+        return texts
+
+    # iter_text() method
+    def iter_text(
+        self,
+        batch_size: int = 1000,
+        full_df: bool = False,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        records: bool = False,
+        lazy_text: bool = False,
+        ):
+        """
+        Iterate over the RepositoryObject table in batches.
+
+        Rows are fetched from a database cursor ``batch_size`` at a time, so
+        memory use does not grow with the size of the corpus. Which columns
+        to keep is decided once, before the first batch, from the table
+        schema and the null counts of the whole (filtered) table.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of rows per batch. Default is 1000.
+        full_df, columns, where, lazy_text
+            See ``get_text``.
+        records : bool, optional
+            Yield each batch as a list of dicts instead of a DataFrame.
+            Default is ``False``.
+
+        Yields
+        ------
+        pandas.DataFrame or list[dict]
+            The next batch of cleaned rows. Nothing is yielded if the corpus
+            has no RepositoryObject table.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if not self._ensure_entity_table("RepositoryObject"):
+            return
+
+        import pandas as pd
+
+        column_stats = None
+        if not full_df and not columns and not where:
+            column_stats = self._column_stats("RepositoryObject")
+
+        conn = self._read_connection()
+        query, params, selected = self._entity_query(
+            conn,
+            "RepositoryObject",
+            columns,
+            where,
+            max_null_prop=None if full_df else self.max_null_prop,
+            text_column=self.text_prop if lazy_text else None,
+            column_stats=column_stats,
+        )
+        for chunk in pd.read_sql(query, conn, params=params, chunksize=batch_size):
+            if not selected:
+                chunk = chunk.drop(columns="rowid")
+            yield chunk.to_dict("records") if records else chunk
 
     # get_people() method
-    def get_people(self, full_df: bool = False):
+    def get_people(
+        self,
+        full_df: bool = False,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        ):
         """
         Load and return the Person table from the corpus in a cleaned form.
 
+        Parameters
+        ----------
+        full_df, columns, where, limit
+            See ``get_text``.
+
         Returns
         -------
         pandas.DataFrame or None
@@ -491,48 +1793,55 @@ class LDaCATabulator:
         a Person entity.
         """
         
-        df = self._load_entity_table("Person")
-        
-        if not full_df:
-            df = self.drop_high_null_columns(df)       
-
-        return df
+        return self._get_table("Person", full_df, columns=columns, where=where, limit=limit)
     
     # get_organization() method
-    def get_organization(self, full_df: bool = False):
+    def get_organization(
+        self,
+        full_df: bool = False,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        ):
         """
         Load and return the Organization table from the corpus in a cleaned form.
 
+        Parameters
+        ----------
+        full_df, columns, where, limit
+            See ``get_text``.
+
         Returns
         -------
         pandas.DataFrame or None
         The cleaned Organization table, or ``None`` if the corpus does not
         contain an Organization entity.
         """
-        df = self._load_entity_table("Organization")
-        
-        if not full_df:
-            df = self.drop_high_null_columns(df)       
-
-        return df
+        return self._get_table("Organization", full_df, columns=columns, where=where, limit=limit)
     
     # get_speaker() method
-    def get_speaker(self, full_df: bool = False):
+    def get_speaker(
+        self,
+        full_df: bool = False,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        ):
         """
         Load and return the Speaker table from the corpus in a cleaned form.
 
+        Parameters
+        ----------
+        full_df, columns, where, limit
+            See ``get_text``.
+
         Returns
         -------
         pandas.DataFrame or None
         The cleaned Speaker table, or ``None`` if the corpus does not contain
         a Speaker entity.
         """
-        df = self._load_entity_table("Speaker")
-        
-        if not full_df:
-            df = self.drop_high_null_columns(df)      
-        
-        return df
+        return self._get_table("Speaker", full_df, columns=columns, where=where, limit=limit)
     
     # -------------------------------------------------------------
     # corpus_specific_tables
@@ -570,7 +1879,13 @@ class LDaCATabulator:
         )
 
       
-    def corpus_specific_tables(self, table: str):
+    def corpus_specific_tables(
+        self,
+        table: str,
+        columns: List[str] | None = None,
+        where: dict | tuple[str, list] | None = None,
+        limit: int | None = None,
+        ):
         """
         Load and return a cleaned corpus-specific table.
 
@@ -578,14 +1893,17 @@ class LDaCATabulator:
         1. Extracts the numeric corpus identifier from the corpus URL.
         2. Loads the corresponding per-corpus configuration file located at
            ``configs/corpora/``.
-        3. Updates ``self.tb.config`` with that configuration.
-        4. Loads the requested table using ``_load_entity_table``.
-        5. Removes ID-like columns using ``drop_id_columns``.
+        3. Loads the requested table with that configuration using
+           ``_load_entity_table``. ``self.tb.config`` is left unchanged, so
+           other threads keep reading the general tables.
+        4. Removes ID-like columns using ``drop_id_columns``.
 
         Parameters
         ----------
         table : str
             Name of the corpus-specific table to load.
+        columns, where, limit
+            See ``get_text``.
 
         Returns
         -------
@@ -595,16 +1913,74 @@ class LDaCATabulator:
         
         match = re.search(r'~(\d+)\.', self.url).group(1)
     
-        self.tb.config = self.load_config(f"{CORPUS_CONFIG_DIR}{match}.json")
+        config = self.load_config(f"{CORPUS_CONFIG_DIR}{match}.json")
         
-        return self._load_entity_table(table)
+        return self._get_table(table, full_df=True, columns=columns, where=where, limit=limit, config=config)
     
+    def _corpus_info_fields(self) -> dict:
+        """
+        Return the name, description, publication date and publisher of the
+        corpus, reading as little of the crate metadata as possible.
+        """
+        if self._corpus_info is not None:
+            return self._corpus_info
+
+        # Extract corpus ID from URL
+        parsed_url = urlparse(self.url)
+        encoded_name = Path(parsed_url.path).name
+        encoded_name = encoded_name.removesuffix(".zip")
+        corpus_id = unquote(encoded_name)
+
+        html_path = Path(self.extract_to) / PREVIEW_FILE if self.extract_to is not None else None
+        local = self._local_metadata() if self._graph is None else None
+        if local is not None and (local[1] is None or not local[1].exists()):
+            # No parsed graph to reuse: stream the file and stop at the
+            # corpus and publisher nodes
+            with open(local[0], encoding="utf-8-sig") as f:
+                corpus_node, publisher = find_corpus_nodes(iter_graph(f), corpus_id)
+        elif self._graph is None and local is None and html_path is not None and html_path.exists():
+            # Crates extracted without their metadata file still carry the
+            # graph in the preview
+            corpus_node, publisher = find_corpus_nodes(self._read_preview_graph(html_path), corpus_id)
+        else:
+            # Indexed lookups in the shared graph (for a lazy corpus that
+            # was not extracted, read from the remote metadata member alone)
+            graph = self._ensure_graph()
+            corpus_node = graph.corpus_node(corpus_id)
+            publisher_node = graph.resolve(corpus_node.get("publisher")) if corpus_node else None
+            publisher = publisher_node.get("name") if publisher_node else None
+
+        if corpus_node is None:
+            raise ValueError(f"Could not find corpus metadata node for '{corpus_id}'.")
+
+        self._corpus_info = {
+            "name": corpus_node.get("name"),
+            "description": corpus_node.get("description"),
+            "date_published": corpus_node.get("datePublished"),
+            "publisher": publisher or "Unknown",
+        }
+        return self._corpus_info
+
+    @staticmethod
+    def _read_preview_graph(html_path: Path) -> list:
+        """
+        Return the JSON-LD graph embedded in ro-crate-preview.html.
+        """
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html_path.read_text(encoding="utf-8"), "html.parser")
+        script_tag = soup.find("script", type="application/ld+json")
+        if script_tag is None:
+            return []
+        return json.loads(script_tag.string).get("@graph", [])
+
     def get_corpus_info(self):
         """
         Extract metadata information about the corpus.
 
-        This method parses the local RO-Crate HTML metadata file and retrieves
-        basic corpus information including:
+        This method reads ro-crate-metadata.json (the extracted or cached
+        copy, or for a lazy corpus that was not extracted yet, only the
+        remote member) and retrieves basic corpus information including:
 
         - Corpus name
         - Description
@@ -612,71 +1988,51 @@ class LDaCATabulator:
         - Publisher name
 
         The corpus identifier is extracted from the download URL and used to
-        locate the corresponding node in the JSON-LD graph.
+        locate the corresponding node in the JSON-LD graph, falling back to
+        the root dataset of the crate. The crate graph shared by all
+        metadata lookups is used when it was already parsed or persisted;
+        otherwise the file is parsed incrementally and reading stops once
+        the corpus and publisher nodes were found. The result is kept on the
+        instance. ``ro-crate-preview.html`` is only parsed when the metadata
+        file is missing.
 
         Returns
         -------
         str
             A formatted Markdown string containing the corpus metadata.
         """
-        # Extract corpus ID from URL
-        parsed_url = urlparse(self.url)
-        encoded_name = Path(parsed_url.path).name
-        encoded_name = encoded_name.removesuffix(".zip")
-        corpus_id = unquote(encoded_name)
-
-        # Load HTML content for this extracted corpus
-        html_path = self.extract_to / "ro-crate-preview.html"
-        html_content = html_path.read_text(encoding="utf-8")
-
-        # Parse HTML and extract JSON-LD data
-        soup = BeautifulSoup(html_content, "html.parser")
-        script_tag = soup.find("script", type="application/ld+json")
-        json_data = json.loads(script_tag.string)
-
-        # Find matching corpus node
-        corpus_node = next(
-            (item for item in json_data.get("@graph", []) if item.get("@id") == corpus_id),
-            None,
-        )
-        if corpus_node is None:
-            raise ValueError(f"Could not find corpus metadata node for '{corpus_id}'.")
-
-        corpus_name = corpus_node.get("name")
-        corpus_description = corpus_node.get("description")
-        date_published = corpus_node.get("datePublished")
-
-        # publisher may be a list, dict, string id, or absent
-        publisher_field = corpus_node.get("publisher")
-        publisher_id = None
-        if isinstance(publisher_field, list) and publisher_field:
-            first = publisher_field[0]
-            publisher_id = first.get("@id") if isinstance(first, dict) else first
-        elif isinstance(publisher_field, dict):
-            publisher_id = publisher_field.get("@id")
-        elif isinstance(publisher_field, str):
-            publisher_id = publisher_field
-
-        publisher_node = next(
-            (item for item in json_data.get("@graph", []) if item.get("@id") == publisher_id),
-            None,
-        )
-        publisher = publisher_node.get("name") if isinstance(publisher_node, dict) else "Unknown"
+        info = self._corpus_info_fields()
 
         markdown_content = f"""## Name: 
-        {corpus_name}
+        {info["name"]}
         
         ## Description: 
-        {corpus_description}
+        {info["description"]}
         
         ## Date Published
-        {date_published}
+        {info["date_published"]}
         
         ## Publisher
-        {publisher}
+        {info["publisher"]}
         """
 
         return markdown_content
-    
-        
-        
+
+
+def build_corpus_database(
+    extract_to: str,
+    database: str,
+    record: dict | None,
+    update: UpdatePlan | None = None,
+    ) -> None:
+    """
+    Tabulate an extracted corpus with a fresh ``ROCrateTabulator``, or apply
+    an incremental update plan to its database, holding the file lock of
+    the database.
+
+    Used by worker processes, so it only takes picklable paths, the source
+    record and the plan.
+    """
+    LDaCATabulator._build_if_needed(
+        _new_tabulator(), Path(extract_to), Path(database), record, update
+    )
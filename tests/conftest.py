@@ -0,0 +1,144 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+import zipfile
+
+import pytest
+
+
+CRATES = Path(__file__).parent / "crates"
+
+
+def zip_crate(crate_dir: Path) -> bytes:
+    """Zip a test crate folder with its files at the archive root."""
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(crate_dir.rglob("*")):
+            if path.is_file():
+                zf.write(path, path.relative_to(crate_dir).as_posix())
+    return buf.getvalue()
+
+
+def assert_built_into(fake_tb, extract_to: Path, database: Path) -> None:
+    """
+    Check that crate_to_db tabulated extract_to once, into a temporary file
+    next to database that was then renamed to database.
+    """
+    fake_tb.crate_to_db.assert_called_once()
+    crate, built = fake_tb.crate_to_db.call_args.args
+    built = Path(built)
+    assert crate == str(extract_to)
+    assert built.parent == Path(database).parent
+    assert built.name.startswith(f".{Path(database).name}.")
+    assert not built.exists()
+    assert Path(database).exists()
+
+
+# --------------------------------------------------------------------
+# Local HTTP server with ETag and Range support
+# --------------------------------------------------------------------
+class _CorpusHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        body = server.files.get(self.path)
+        server.requests.append({
+            "path": self.path,
+            "range": self.headers.get("Range"),
+            "if_none_match": self.headers.get("If-None-Match"),
+            "if_range": self.headers.get("If-Range"),
+        })
+        if body is None:
+            self.send_error(404)
+            return
+
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if server.weak_etags:
+            etag = f"W/{etag}"
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start, end, status = 0, len(body) - 1, 200
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        # A weak validator in If-Range never matches (RFC 9110)
+        if_range_matches = if_range is None or (if_range == etag and not etag.startswith("W/"))
+        if server.ranges and range_header and if_range_matches and server.max_ranges != 0:
+            first, _, last = range_header.removeprefix("bytes=").partition("-")
+            start, end, status = int(first), min(int(last or end), end), 206
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if server.max_ranges is not None:
+                server.max_ranges -= 1
+
+        payload = body[start:end + 1]
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        if server.content_length:
+            self.send_header("Content-Length", str(len(payload)))
+        if server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        self.end_headers()
+
+        if server.drops and len(payload) > server.drop_after:
+            # Simulate a dropped connection: announce the full length, send
+            # only part of it and hang up.
+            server.drops -= 1
+            payload = payload[:server.drop_after]
+            self.close_connection = True
+        # Counted first: the client may finish reading before write returns
+        server.bytes_sent += len(payload)
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CorpusServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _CorpusHandler)
+        self.files = {}
+        self.ranges = True
+        # Range requests answered before ranges stop working (None: all)
+        self.max_ranges = None
+        self.weak_etags = False
+        # Without a length the body ends when the connection closes
+        self.content_length = True
+        self.requests = []
+        self.bytes_sent = 0
+        self.drops = 0
+        self.drop_after = 0
+
+    def serve_file(self, path: str, body: bytes) -> str:
+        self.files[path] = body
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+@pytest.fixture(autouse=True)
+def cache_environment(monkeypatch):
+    # The cache root and quota of the shell running the tests do not apply
+    monkeypatch.delenv("LDACA_CACHE_DIR", raising=False)
+    monkeypatch.delenv("LDACA_CACHE_QUOTA", raising=False)
+
+
+@pytest.fixture
+def corpus_server():
+    server = CorpusServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
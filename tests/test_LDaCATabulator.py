@@ -1,4 +1,6 @@
 from io import BytesIO
+import json
+import logging
 from pathlib import Path
 import sqlite3
 from unittest.mock import MagicMock, patch
@@ -7,7 +9,12 @@ import zipfile
 import pandas as pd
 import pytest
 
+from src.ldacatabulator.bookkeeping import read_column_stats
+from src.ldacatabulator.cache import FrameCache
+from src.ldacatabulator.metadata import CrateGraph
+from src.ldacatabulator.query import non_null_counts
 from src.ldacatabulator.tabulator import LDaCATabulator
+from tests.conftest import assert_built_into
 
 
 # --------------------------------------------------------------------
@@ -19,7 +26,9 @@ def _blank_instance():
     to avoid running get.request() function.
     
     """
-    return LDaCATabulator.__new__(LDaCATabulator)
+    tab = LDaCATabulator.__new__(LDaCATabulator)
+    tab.url = "https://example.com/corpus.zip"
+    return tab
 
 
 def _make_zip_bytes() -> bytes:
@@ -36,6 +45,17 @@ def _make_zip_bytes_with_metadata(metadata: str) -> bytes:
     return buf.getvalue()
 
 
+def _mock_zip_response(zip_bytes: bytes, status_code: int = 200, headers: dict | None = None):
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.__exit__.return_value = None
+    mock_response.raise_for_status = MagicMock()
+    mock_response.iter_content.return_value = [zip_bytes]
+    mock_response.status_code = status_code
+    mock_response.headers = headers or {}
+    return mock_response
+
+
 # --------------------------------------------------------------------
 # Test: _unzip_corpus
 # --------------------------------------------------------------------
@@ -43,17 +63,13 @@ def test_unzip_corpus(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     zip_bytes = _make_zip_bytes()
 
-    mock_response = MagicMock()
-    mock_response.__enter__.return_value = mock_response
-    mock_response.__exit__.return_value = None
-    mock_response.raise_for_status = MagicMock()
-    mock_response.iter_content.return_value = [zip_bytes]
+    mock_response = _mock_zip_response(zip_bytes)
 
     fake_tb = MagicMock()
 
     tab = _blank_instance()
 
-    with patch("src.ldacatabulator.tabulator.requests.get", return_value=mock_response):
+    with patch("src.ldacatabulator.ingest.requests.get", return_value=mock_response):
         db_path, extracted_path = LDaCATabulator._unzip_corpus(
             tab,
             zip_url="http://fake-url.com/zip",
@@ -67,9 +83,10 @@ def test_unzip_corpus(tmp_path, monkeypatch):
     assert extracted_path.exists()
     assert len(list(extracted_path.iterdir())) > 0
     assert db_path == Path.cwd() / "databases" / "testCorpus.db"
-    fake_tb.crate_to_db.assert_called_once_with(
-        str(Path.cwd() / "ldacaCollections" / "testCorpus"),
-        str(Path.cwd() / "databases" / "testCorpus.db"),
+    assert_built_into(
+        fake_tb,
+        Path.cwd() / "ldacaCollections" / "testCorpus",
+        Path.cwd() / "databases" / "testCorpus.db",
     )
 
 
@@ -88,16 +105,12 @@ def test_unzip_uses_metadata_name(tmp_path, monkeypatch):
     """
     zip_bytes = _make_zip_bytes_with_metadata(metadata)
 
-    mock_response = MagicMock()
-    mock_response.__enter__.return_value = mock_response
-    mock_response.__exit__.return_value = None
-    mock_response.raise_for_status = MagicMock()
-    mock_response.iter_content.return_value = [zip_bytes]
+    mock_response = _mock_zip_response(zip_bytes)
 
     fake_tb = MagicMock()
     tab = _blank_instance()
 
-    with patch("src.ldacatabulator.tabulator.requests.get", return_value=mock_response):
+    with patch("src.ldacatabulator.ingest.requests.get", return_value=mock_response):
         db_path, extracted_path = LDaCATabulator._unzip_corpus(
             tab,
             zip_url="http://fake-url.com/fake-corpus.zip",
@@ -106,9 +119,10 @@ def test_unzip_uses_metadata_name(tmp_path, monkeypatch):
 
     assert extracted_path == Path.cwd() / "ldacaCollections" / "Fancy_Corpus_Name"
     assert db_path == Path.cwd() / "databases" / "Fancy_Corpus_Name.db"
-    fake_tb.crate_to_db.assert_called_once_with(
-        str(Path.cwd() / "ldacaCollections" / "Fancy_Corpus_Name"),
-        str(Path.cwd() / "databases" / "Fancy_Corpus_Name.db"),
+    assert_built_into(
+        fake_tb,
+        Path.cwd() / "ldacaCollections" / "Fancy_Corpus_Name",
+        Path.cwd() / "databases" / "Fancy_Corpus_Name.db",
     )
 
 
@@ -131,16 +145,12 @@ def test_unzip_redownloads_when_cached_metadata_named_folder_exists(tmp_path, mo
     (cached / "old.txt").write_text("stale", encoding="utf-8")
 
     zip_bytes = _make_zip_bytes_with_metadata(metadata)
-    mock_response = MagicMock()
-    mock_response.__enter__.return_value = mock_response
-    mock_response.__exit__.return_value = None
-    mock_response.raise_for_status = MagicMock()
-    mock_response.iter_content.return_value = [zip_bytes]
+    mock_response = _mock_zip_response(zip_bytes)
 
     fake_tb = MagicMock()
     tab = _blank_instance()
 
-    with patch("src.ldacatabulator.tabulator.requests.get", return_value=mock_response) as mock_get:
+    with patch("src.ldacatabulator.ingest.requests.get", return_value=mock_response) as mock_get:
         db_path, extracted_path = LDaCATabulator._unzip_corpus(
             tab,
             zip_url="http://fake-url.com/fake-corpus.zip",
@@ -152,10 +162,7 @@ def test_unzip_redownloads_when_cached_metadata_named_folder_exists(tmp_path, mo
     assert extracted_path == cached
     assert not (cached / "old.txt").exists()
     assert db_path == tmp_path / "databases" / "Fancy_Corpus_Name.db"
-    fake_tb.crate_to_db.assert_called_once_with(
-        str(cached),
-        str(tmp_path / "databases" / "Fancy_Corpus_Name.db"),
-    )
+    assert_built_into(fake_tb, cached, tmp_path / "databases" / "Fancy_Corpus_Name.db")
 
 
 def test_unzip_refresh_reuses_same_metadata_folder_name(tmp_path, monkeypatch):
@@ -177,16 +184,12 @@ def test_unzip_refresh_reuses_same_metadata_folder_name(tmp_path, monkeypatch):
     (cached / "old.txt").write_text("stale", encoding="utf-8")
 
     zip_bytes = _make_zip_bytes_with_metadata(metadata)
-    mock_response = MagicMock()
-    mock_response.__enter__.return_value = mock_response
-    mock_response.__exit__.return_value = None
-    mock_response.raise_for_status = MagicMock()
-    mock_response.iter_content.return_value = [zip_bytes]
+    mock_response = _mock_zip_response(zip_bytes)
 
     fake_tb = MagicMock()
     tab = _blank_instance()
 
-    with patch("src.ldacatabulator.tabulator.requests.get", return_value=mock_response) as mock_get:
+    with patch("src.ldacatabulator.ingest.requests.get", return_value=mock_response) as mock_get:
         db_path, extracted_path = LDaCATabulator._unzip_corpus(
             tab,
             zip_url="http://fake-url.com/fake-corpus.zip",
@@ -199,10 +202,94 @@ def test_unzip_refresh_reuses_same_metadata_folder_name(tmp_path, monkeypatch):
     assert not (cached / "old.txt").exists()
     assert not (tmp_path / "ldacaCollections" / "Fancy_Corpus_Name_2").exists()
     assert db_path == tmp_path / "databases" / "Fancy_Corpus_Name.db"
-    fake_tb.crate_to_db.assert_called_once_with(
-        str(cached),
-        str(tmp_path / "databases" / "Fancy_Corpus_Name.db"),
-    )
+    assert_built_into(fake_tb, cached, tmp_path / "databases" / "Fancy_Corpus_Name.db")
+
+
+_NAMED_METADATA = """
+{
+  "@graph": [
+    {
+      "@id": "fake-corpus",
+      "@type": "Dataset",
+      "name": "Fancy Corpus Name"
+    }
+  ]
+}
+"""
+
+
+def test_unzip_reuses_cache_when_not_modified(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    zip_bytes = _make_zip_bytes_with_metadata(_NAMED_METADATA)
+    url = "http://fake-url.com/fake-corpus.zip"
+    fake_tb = MagicMock()
+    tab = _blank_instance()
+
+    first = _mock_zip_response(zip_bytes, headers={"ETag": '"v1"'})
+    with patch("src.ldacatabulator.ingest.requests.get", return_value=first):
+        LDaCATabulator._unzip_corpus(tab, zip_url=url, tb=fake_tb, overwrite=False)
+
+    not_modified = _mock_zip_response(b"", status_code=304)
+    with patch("src.ldacatabulator.ingest.requests.get", return_value=not_modified) as mock_get:
+        db_path, extracted_path = LDaCATabulator._unzip_corpus(
+            tab, zip_url=url, tb=fake_tb, overwrite=False
+        )
+
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    not_modified.iter_content.assert_not_called()
+    assert extracted_path == tmp_path / "ldacaCollections" / "Fancy_Corpus_Name"
+    assert db_path == tmp_path / "databases" / "Fancy_Corpus_Name.db"
+    fake_tb.crate_to_db.assert_called_once()
+
+
+def test_unzip_reuses_cache_when_digest_unchanged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    zip_bytes = _make_zip_bytes_with_metadata(_NAMED_METADATA)
+    url = "http://fake-url.com/fake-corpus.zip"
+    fake_tb = MagicMock()
+    tab = _blank_instance()
+
+    with patch(
+        "src.ldacatabulator.ingest.requests.get",
+        side_effect=[_mock_zip_response(zip_bytes), _mock_zip_response(zip_bytes)],
+    ) as mock_get:
+        LDaCATabulator._unzip_corpus(tab, zip_url=url, tb=fake_tb, overwrite=False)
+        marker = tmp_path / "ldacaCollections" / "Fancy_Corpus_Name" / "kept.txt"
+        marker.write_text("still here", encoding="utf-8")
+        LDaCATabulator._unzip_corpus(tab, zip_url=url, tb=fake_tb, overwrite=False)
+
+    assert mock_get.call_count == 2
+    assert marker.exists()
+    assert not (tmp_path / "ldacaCollections" / "Fancy_Corpus_Name.zip").exists()
+    fake_tb.crate_to_db.assert_called_once()
+
+
+def test_unzip_offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    zip_bytes = _make_zip_bytes_with_metadata(_NAMED_METADATA)
+    url = "http://fake-url.com/fake-corpus.zip"
+    fake_tb = MagicMock()
+    tab = _blank_instance()
+
+    with pytest.raises(FileNotFoundError):
+        LDaCATabulator._unzip_corpus(tab, zip_url=url, tb=fake_tb, overwrite=False, offline=True)
+
+    with patch("src.ldacatabulator.ingest.requests.get", return_value=_mock_zip_response(zip_bytes)):
+        LDaCATabulator._unzip_corpus(tab, zip_url=url, tb=fake_tb, overwrite=False)
+
+    with patch("src.ldacatabulator.ingest.requests.get") as mock_get:
+        db_path, _ = LDaCATabulator._unzip_corpus(
+            tab, zip_url=url, tb=fake_tb, overwrite=False, offline=True
+        )
+
+    mock_get.assert_not_called()
+    assert db_path == tmp_path / "databases" / "Fancy_Corpus_Name.db"
+    fake_tb.crate_to_db.assert_called_once()
+
+
+def test_refresh_and_offline_are_exclusive():
+    with pytest.raises(ValueError):
+        LDaCATabulator("https://example.com/fake.zip", tb=MagicMock(), refresh=True, offline=True)
 
 
 # --------------------------------------------------------------------
@@ -239,15 +326,54 @@ def test_load_entity_table(tmp_path):
     inst.tb.entity_table.assert_called_once_with("RepositoryObject")
 
 
-def test_load_entity_table_missing_table_returns_none(tmp_path):
+def test_load_entity_table_is_memoized_across_instances(tmp_path):
+    db_path = tmp_path / "test.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE Person (id TEXT, name TEXT)")
+        conn.execute("INSERT INTO Person VALUES ('1', 'Ann')")
+
+    first = _blank_instance()
+    first.database = db_path
+    first.tb = MagicMock(config={"tables": {"Person": {}}}, text_prop="ldac:mainText")
+    LDaCATabulator._load_entity_table(first, "Person")
+    LDaCATabulator._load_entity_table(first, "Person")
+
+    second = _blank_instance()
+    second.database = db_path
+    second.tb = MagicMock(config={"tables": {"Person": {}}}, text_prop="ldac:mainText")
+    df = LDaCATabulator._load_entity_table(second, "Person")
+
+    assert list(df["name"]) == ["Ann"]
+    first.tb.entity_table.assert_called_once_with("Person")
+    second.tb.entity_table.assert_not_called()
+
+
+def test_load_entity_table_rebuilds_when_config_changes(tmp_path):
+    db_path = tmp_path / "test.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE Person (id TEXT, name TEXT)")
+
+    inst = _blank_instance()
+    inst.database = db_path
+    inst.tb = MagicMock(config={"tables": {"Person": {}}}, text_prop="ldac:mainText")
+    LDaCATabulator._load_entity_table(inst, "Person")
+    inst.tb.config = {"tables": {"Person": {"expand_props": ["birthPlace"]}}}
+    LDaCATabulator._load_entity_table(inst, "Person")
+
+    assert inst.tb.entity_table.call_count == 2
+
+
+def test_load_entity_table_missing_table_returns_none(tmp_path, caplog):
     inst = _blank_instance()
     inst.database = tmp_path / "test.db"
     inst.tb = MagicMock()
     inst.tb.entity_table.side_effect = Exception("missing")
 
-    df = LDaCATabulator._load_entity_table(inst, "MissingTable")
+    with caplog.at_level(logging.WARNING):
+        df = LDaCATabulator._load_entity_table(inst, "MissingTable")
 
     assert df is None
+    assert "No MissingTable table in this corpus." in caplog.text
 
 
 # --------------------------------------------------------------------
@@ -281,10 +407,28 @@ def test_drop_high_null_columns():
     )
     out = LDaCATabulator.drop_high_null_columns(df)
     assert set(out.columns) == {"keep_edge_99pct", "keep_full"}
+
+    out = LDaCATabulator.drop_high_null_columns(df, max_null_prop=0.5)
+    assert list(out.columns) == ["keep_full"]
+    with pytest.raises(ValueError):
+        LDaCATabulator.drop_high_null_columns(df, max_null_prop=2)
     
 
-def test_get_text():
+def _db_instance(tmp_path, table_name: str, df: pd.DataFrame):
+    """
+    Blank instance backed by a real database holding df as table_name.
+    """
+    db_path = tmp_path / "test.db"
+    with sqlite3.connect(db_path) as conn:
+        df.to_sql(table_name, conn, index=False)
+
     tab = _blank_instance()
+    tab.database = db_path
+    tab.tb = MagicMock(config={"tables": {}}, text_prop="ldac:mainText")
+    return tab
+
+
+def test_get_text(tmp_path):
     raw = pd.DataFrame(
         {
             "text": ["a"],
@@ -293,50 +437,231 @@ def test_get_text():
             "mostly_null": [None],
         }
     )
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
 
-    with patch.object(tab, "_load_entity_table", return_value=raw) as mock_load:
-        df = tab.get_text()
+    df = tab.get_text()
 
     assert isinstance(df, pd.DataFrame)
-    assert "name_id" not in df.columns
-    assert "mostly_null" not in df.columns
-    mock_load.assert_called_once_with("RepositoryObject")
+    assert list(df.columns) == ["text", "kept"]
+    tab.tb.entity_table.assert_called_once_with("RepositoryObject")
 
 
-def test_get_people():
-    tab = _blank_instance()
+def test_get_text_full_df_keeps_null_columns(tmp_path):
+    raw = pd.DataFrame({"text": ["a"], "name_id": ["x"], "mostly_null": [None]})
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+
+    df = tab.get_text(full_df=True)
+
+    assert list(df.columns) == ["text", "mostly_null"]
+
+
+def test_get_people(tmp_path):
     raw = pd.DataFrame({"name": ["person"], "mostly_null": [None]})
+    tab = _db_instance(tmp_path, "Person", raw)
 
-    with patch.object(tab, "_load_entity_table", return_value=raw) as mock_load:
-        df = tab.get_people()
+    df = tab.get_people()
 
     assert isinstance(df, pd.DataFrame)
     assert "mostly_null" not in df.columns
-    mock_load.assert_called_once_with("Person")
+    tab.tb.entity_table.assert_called_once_with("Person")
 
 
-def test_get_organization():
-    tab = _blank_instance()
+def test_get_organization(tmp_path):
     raw = pd.DataFrame({"name": ["org"], "mostly_null": [None]})
+    tab = _db_instance(tmp_path, "Organization", raw)
 
-    with patch.object(tab, "_load_entity_table", return_value=raw) as mock_load:
-        df = tab.get_organization()
+    df = tab.get_organization()
 
     assert isinstance(df, pd.DataFrame)
     assert "mostly_null" not in df.columns
-    mock_load.assert_called_once_with("Organization")
+    tab.tb.entity_table.assert_called_once_with("Organization")
 
 
-def test_get_speaker():
-    tab = _blank_instance()
+def test_get_speaker(tmp_path):
     raw = pd.DataFrame({"name": ["speaker"], "mostly_null": [None]})
+    tab = _db_instance(tmp_path, "Speaker", raw)
 
-    with patch.object(tab, "_load_entity_table", return_value=raw) as mock_load:
-        df = tab.get_speaker()
+    df = tab.get_speaker()
 
     assert isinstance(df, pd.DataFrame)
     assert "mostly_null" not in df.columns
-    mock_load.assert_called_once_with("Speaker")
+    tab.tb.entity_table.assert_called_once_with("Speaker")
+
+
+def test_get_text_pushes_columns_where_and_limit_down(tmp_path):
+    raw = pd.DataFrame(
+        {
+            "text": ["a", "b", "c", "d"],
+            "genre": ["news", "fiction", "news", "news"],
+            "name_id": ["w", "x", "y", "z"],
+        }
+    )
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+
+    df = tab.get_text(columns=["text", "name_id"], where={"genre": "news"}, limit=2)
+    filtered = tab.get_text(where={"genre": ["fiction", "poetry"]})
+    expression = tab.get_text(where=("genre = ? OR text = ?", ["fiction", "d"]))
+
+    assert df.to_dict("list") == {"text": ["a", "c"], "name_id": ["w", "y"]}
+    assert filtered["text"].tolist() == ["b"]
+    assert expression["text"].tolist() == ["b", "d"]
+
+
+def test_get_text_rejects_unknown_columns(tmp_path):
+    tab = _db_instance(tmp_path, "RepositoryObject", pd.DataFrame({"text": ["a"]}))
+
+    with pytest.raises(ValueError):
+        tab.get_text(columns=["missing"])
+    with pytest.raises(ValueError):
+        tab.get_text(where={"missing; DROP TABLE RepositoryObject": 1})
+    # Raw SQL strings are not accepted; values must be bound
+    with pytest.raises(TypeError):
+        tab.get_text(where="1=1; DROP TABLE RepositoryObject")
+
+
+def test_null_pruning_happens_before_the_read(tmp_path):
+    raw = pd.DataFrame({"keep_edge_99pct": [None] * 99 + [1], "drop_100pct": [None] * 100})
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+
+    with patch("src.ldacatabulator.tabulator.pd.read_sql", wraps=pd.read_sql) as read_sql:
+        df = tab.get_text()
+
+    assert list(df.columns) == ["keep_edge_99pct"]
+    assert "drop_100pct" not in read_sql.call_args.args[0]
+
+
+def test_null_counts_are_stored_with_the_table_build(tmp_path):
+    raw = pd.DataFrame({"text": ["a", "b"], "name_id": ["x", "y"], "mostly_null": [None, None]})
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+
+    first = tab.get_text()
+    stored = read_column_stats(tab.database, "RepositoryObject")
+    with patch("src.ldacatabulator.tabulator.non_null_counts", wraps=non_null_counts) as counts:
+        second = tab.get_text()
+        batches = list(tab.iter_text())
+        filtered = tab.get_text(where={"text": "a"})
+
+    assert stored == (2, {"text": 2, "name_id": 2, "mostly_null": 0})
+    assert list(first.columns) == list(second.columns) == list(batches[0].columns) == ["text"]
+    # Only a filtered read counts again, over the matching rows
+    counts.assert_called_once()
+    assert counts.call_args.args[3] == ' WHERE "text" = ?'
+
+
+def test_max_null_prop_is_configurable(tmp_path):
+    raw = pd.DataFrame({"text": ["a", "b"], "half_null": ["x", None]})
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+
+    assert list(tab.get_text().columns) == ["text", "half_null"]
+    tab.max_null_prop = 0.25
+    assert list(tab.get_text().columns) == ["text"]
+    with pytest.raises(ValueError, match="max_null_prop"):
+        LDaCATabulator("https://example.com/corpus.zip", max_null_prop=1.5)
+
+
+def test_describe_table(tmp_path):
+    raw = pd.DataFrame(
+        {"text": ["a", "b", "c", "d"], "name_id": ["w", "x", "y", "z"], "sparse": [None, None, None, 1]}
+    )
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+    tab.max_null_prop = 0.5
+
+    info = tab.describe_table("RepositoryObject")
+
+    assert list(info.index) == ["text", "name_id", "sparse"]
+    assert info["non_null"].tolist() == [4, 4, 1]
+    assert info["nulls"].tolist() == [0, 0, 3]
+    assert info.loc["sparse", "null_prop"] == 0.75
+    assert info["kept"].tolist() == [True, False, False]
+    assert tab.tb.entity_table.call_count == 1
+
+
+def test_describe_table_missing_table_returns_none(tmp_path):
+    tab = _blank_instance()
+    tab.database = tmp_path / "test.db"
+    tab.tb = MagicMock(config={"tables": {}}, text_prop="ldac:mainText")
+    tab.tb.entity_table.side_effect = Exception("missing")
+
+    assert tab.describe_table("Person") is None
+
+
+def test_iter_text_yields_bounded_batches(tmp_path):
+    raw = pd.DataFrame(
+        {
+            "text": [f"doc {i}" for i in range(10)],
+            "name_id": list(range(10)),
+            "mostly_null": [None] * 10,
+        }
+    )
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+
+    batches = list(tab.iter_text(batch_size=4))
+    records = list(tab.iter_text(batch_size=4, where={"text": ["doc 1", "doc 2"]}, records=True))
+
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert all(list(b.columns) == ["text"] for b in batches)
+    assert pd.concat(batches, ignore_index=True).equals(tab.get_text())
+    assert records == [[{"text": "doc 1"}, {"text": "doc 2"}]]
+
+
+def test_iter_text_missing_table_yields_nothing(tmp_path):
+    tab = _blank_instance()
+    tab.database = tmp_path / "test.db"
+    tab.tb = MagicMock(config={"tables": {}}, text_prop="ldac:mainText")
+    tab.tb.entity_table.side_effect = Exception("missing")
+
+    assert list(tab.iter_text()) == []
+
+
+def test_get_text_lazy_text_returns_handles(tmp_path):
+    raw = pd.DataFrame(
+        {
+            "entity_id": ["#doc1", "#doc2", "#doc3"],
+            "name": ["one", "two", "three"],
+            "ldac:mainText": ["first body", "second body", "third body"],
+        }
+    )
+    tab = _db_instance(tmp_path, "RepositoryObject", raw)
+
+    df = tab.get_text(lazy_text=True)
+    texts = tab.load_texts(df["text_ref"][::-1], batch_size=2)
+
+    assert list(df.columns) == ["name", "text_ref"]
+    assert df["text_ref"].tolist() == ["#doc1", "#doc2", "#doc3"]
+    assert texts.tolist() == ["third body", "second body", "first body"]
+    assert texts.index.tolist() == ["#doc3", "#doc2", "#doc1"]
+
+
+def test_load_texts_reads_extracted_files(tmp_path):
+    (tmp_path / "Text").mkdir()
+    (tmp_path / "Text" / "doc 1.txt").write_text("from file", encoding="utf-8")
+    (tmp_path / "ro-crate-metadata.json").write_text(
+        '{"@graph": [{"@id": "#doc1", "ldac:mainText": {"@id": "Text/doc%201.txt"}}]}',
+        encoding="utf-8",
+    )
+    tab = _db_instance(tmp_path, "RepositoryObject", pd.DataFrame({"entity_id": ["#doc1"], "name": ["one"]}))
+    tab.extract_to = tmp_path
+
+    texts = tab.load_texts(["#doc1", "#missing"])
+
+    assert texts.tolist() == ["from file", None]
+
+
+def test_get_text_uses_frame_cache():
+    tab = _blank_instance()
+    tab.tb = MagicMock(config={"tables": {}}, text_prop="ldac:mainText")
+    tab._frame_cache = FrameCache(10**6)
+    df = pd.DataFrame({"text": ["a", "b"], "mostly_null": [None, None]})
+
+    with patch.object(LDaCATabulator, "_load_entity_table", return_value=df) as mock_load:
+        first = tab.get_text()
+        first.loc[0, "text"] = "changed"
+        second = tab.get_text()
+        full = tab.get_text(full_df=True)
+
+    assert second["text"].tolist() == ["a", "b"]
+    assert "mostly_null" in full.columns
+    assert mock_load.call_count == 2
 
 
 def test_post_init_sets_config_and_text_prop():
@@ -396,9 +721,11 @@ def test_corpus_specific_tables_loads():
         result = tab.corpus_specific_tables("MyTable")
 
     assert result.equals(expected_df)
-    assert tab.tb.config == cfg
+    assert tab.tb.config != cfg
     mock_cfg.assert_called_once_with("./configs/corpora/24769173.json")
-    mock_load_table.assert_called_once_with("MyTable")
+    mock_load_table.assert_called_once_with(
+        "MyTable", columns=None, where=None, limit=None, max_null_prop=None, text_column=None, config=cfg
+    )
 
 
 def test_get_corpus_info(tmp_path):
@@ -476,6 +803,48 @@ def test_get_corpus_info_with_dict_publisher(tmp_path):
     assert "LDaCA Publisher" in out
 
 
+def test_get_corpus_info_reads_metadata_without_preview(tmp_path):
+    metadata = {
+        "@graph": [
+            {"@id": "ro-crate-metadata.json", "about": {"@id": "./"}},
+            {"@id": "./", "name": "Root Corpus", "description": "From metadata",
+             "datePublished": "2024", "publisher": "pub-1"},
+            {"@id": "pub-1", "name": "Metadata Publisher"},
+        ]
+    }
+    (tmp_path / "ro-crate-metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    (tmp_path / "ro-crate-preview.html").write_text("<html></html>", encoding="utf-8")
+
+    tab = _blank_instance()
+    tab.url = "https://example.com/download/~123.zip"
+    tab.extract_to = tmp_path
+
+    with patch.object(LDaCATabulator, "_read_preview_graph", side_effect=AssertionError):
+        out = tab.get_corpus_info()
+    (tmp_path / "ro-crate-metadata.json").unlink()
+
+    assert "Root Corpus" in out
+    assert "Metadata Publisher" in out
+    assert tab.get_corpus_info() == out
+
+
+def test_metadata_graph_is_parsed_once_and_persisted(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url = corpus_server.serve_file("/lazy%20corpus.zip", _lazy_corpus_zip())
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        tab = LDaCATabulator(url, tb=MagicMock())
+        assert tab._graph is not None
+        assert tab._graph_cache_path(tab.database).exists()
+
+        reloaded = LDaCATabulator(url, tb=MagicMock(), lazy=True)
+        with patch.object(CrateGraph, "from_file", side_effect=AssertionError):
+            out = reloaded.get_corpus_info()
+
+    assert "Lazy Corpus" in out
+    assert reloaded._graph.get("pub-1")["name"] == "LDaCA Publisher"
+
+
 def test_names_from_url_differ():
     name1 = LDaCATabulator._names_from_zip_url("https://example.com/download/~123.zip")
     name2 = LDaCATabulator._names_from_zip_url("https://example.com/download/~456.zip")
@@ -483,3 +852,112 @@ def test_names_from_url_differ():
     assert name1 != name2
     assert name1[0] == "123"
     assert name1[1].endswith(".db")
+
+
+# --------------------------------------------------------------------
+# Test: lazy loading
+# --------------------------------------------------------------------
+_LAZY_METADATA = """
+{
+  "@graph": [
+    {"@id": "lazy corpus", "@type": "Dataset", "name": "Lazy Corpus",
+     "description": "Read without extraction", "datePublished": "2025-02-02",
+     "publisher": {"@id": "pub-1"}},
+    {"@id": "pub-1", "name": "LDaCA Publisher"}
+  ]
+}
+"""
+
+
+def _lazy_corpus_zip() -> bytes:
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w") as zf:
+        zf.writestr("ro-crate-metadata.json", _LAZY_METADATA)
+        zf.writestr("Audio/big.wav", b"\0" * (2 * 1024 * 1024))
+    return buf.getvalue()
+
+
+def test_lazy_construction_does_no_work(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url = corpus_server.serve_file("/lazy%20corpus.zip", _lazy_corpus_zip())
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        tab = LDaCATabulator(url, tb=MagicMock(), lazy=True)
+
+    assert corpus_server.requests == []
+    assert tab.database is None
+    assert tab.extract_to is None
+
+
+def test_lazy_corpus_info_reads_only_metadata(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = _lazy_corpus_zip()
+    url = corpus_server.serve_file("/lazy%20corpus.zip", data)
+    fake_tb = MagicMock()
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        tab = LDaCATabulator(url, tb=fake_tb, lazy=True)
+    out = tab.get_corpus_info()
+
+    assert "Lazy Corpus" in out
+    assert "LDaCA Publisher" in out
+    assert corpus_server.bytes_sent < len(data) // 2
+    assert tab.extract_to is None
+    fake_tb.crate_to_db.assert_not_called()
+
+
+def test_lazy_database_is_built_once_on_demand(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url = corpus_server.serve_file("/lazy%20corpus.zip", _lazy_corpus_zip())
+    fake_tb = MagicMock()
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        tab = LDaCATabulator(url, tb=fake_tb, lazy=True)
+    tab._ensure_database()
+    tab._ensure_database()
+
+    assert (tab.extract_to / "ro-crate-metadata.json").exists()
+    assert_built_into(fake_tb, tab.extract_to, tab.database)
+
+
+# --------------------------------------------------------------------
+# Test: load statistics
+# --------------------------------------------------------------------
+def test_stats_record_stages_sizes_and_tables(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = _lazy_corpus_zip()
+    url = corpus_server.serve_file("/lazy%20corpus.zip", data)
+    events = []
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        tab = LDaCATabulator(url, progress=lambda event, info: events.append(event))
+    with sqlite3.connect(tab.database) as conn:
+        pd.DataFrame({"name": ["a", "b"], "text": ["x", "y"]}).to_sql("RepositoryObject", conn, index=False)
+    tab.tb = MagicMock()
+    tab.get_text()
+
+    stats = tab.stats.as_dict()
+    assert list(stats["stages"]) == ["fetch", "install", "tabulate", "entity_table"]
+    assert stats["members_extracted"] == 2
+    assert stats["bytes_extracted"] == len(_LAZY_METADATA) + 2 * 1024 * 1024
+    # Every byte the server sent, except the one-byte probe
+    assert stats["bytes_downloaded"] == corpus_server.bytes_sent - 1
+    assert stats["cache"] == {"corpus_misses": 1}
+    assert stats["tables"]["RepositoryObject"]["rows"] == 2
+    assert stats["tables"]["RepositoryObject"]["columns"] == 2
+    assert stats["tables"]["RepositoryObject"]["source"] == "sqlite"
+    assert {"stage_start", "stage_end", "progress", "table"} <= set(events)
+    json.dumps(stats)
+
+
+def test_stats_count_reused_corpus(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url = corpus_server.serve_file("/lazy%20corpus.zip", _lazy_corpus_zip())
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        LDaCATabulator(url, tb=MagicMock())
+        tab = LDaCATabulator(url, tb=MagicMock())
+
+    assert tab.stats.cache == {"corpus_hits": 1}
+    assert "tabulate" not in tab.stats.stages
+    assert tab.stats.bytes_extracted == 0
@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock, patch
+import sqlite3
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.ldacatabulator.arrow_store import ArrowStore
+from src.ldacatabulator.tabulator import LDaCATabulator
+
+
+def test_round_trip_returns_arrow_backed_frame(tmp_path):
+    store = ArrowStore.for_database(tmp_path / "corpus.db")
+    df = pd.DataFrame({"text": ["a", None], "year": [1788, 1897]})
+
+    assert store.write("RepositoryObject", "clean", "k1", df)
+    out = store.read("RepositoryObject", "clean", "k1")
+
+    assert store.root == tmp_path / "corpus.arrow"
+    assert isinstance(out["year"].dtype, pd.ArrowDtype)
+    assert out["text"].tolist()[0] == "a"
+    assert out["year"].tolist() == [1788, 1897]
+
+
+def test_read_closes_the_memory_map(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    store = ArrowStore(tmp_path)
+    store.write("Person", "clean", "k1", pd.DataFrame({"x": range(1000)}))
+    sources, real_memory_map = [], pa.memory_map
+
+    def memory_map(*args):
+        sources.append(real_memory_map(*args))
+        return sources[-1]
+
+    with patch.object(pa, "memory_map", side_effect=memory_map):
+        out = store.read("Person", "clean", "k1")
+
+    assert len(sources) == 1 and sources[0].closed
+    # The data stays readable after the file is closed
+    assert out["x"].sum() == sum(range(1000))
+
+
+def test_write_replaces_older_versions(tmp_path):
+    store = ArrowStore(tmp_path)
+    df = pd.DataFrame({"x": [1]})
+    store.write("Person", "clean", "old", df)
+    store.write("Person", "full", "old", df)
+
+    store.write("Person", "clean", "new", df)
+
+    assert store.read("Person", "clean", "old") is None
+    assert store.read("Person", "clean", "new") is not None
+    assert store.read("Person", "full", "old") is not None
+
+
+def test_get_text_reloads_from_arrow(tmp_path):
+    db_path = tmp_path / "corpus.db"
+    with sqlite3.connect(db_path) as conn:
+        pd.DataFrame({"text": ["a", "b"], "n": [1.5, None], "name_id": ["x", "y"]}).to_sql(
+            "RepositoryObject", conn, index=False
+        )
+
+    def make():
+        tab = LDaCATabulator.__new__(LDaCATabulator)
+        tab.url = "https://example.com/corpus.zip"
+        tab.database = db_path
+        tab.arrow = True
+        tab.tb = MagicMock(config={"tables": {}}, text_prop="ldac:mainText")
+        return tab
+
+    first = make().get_text()
+    with patch("src.ldacatabulator.tabulator.pd.read_sql", side_effect=AssertionError("read SQLite")):
+        second = make().get_text()
+
+    assert first["text"].tolist() == second["text"].tolist() == ["a", "b"]
+    # The call that writes the store returns what later calls read from it
+    assert first.dtypes.to_dict() == second.dtypes.to_dict()
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in first.dtypes)
+    assert first["n"].isna().tolist() == second["n"].isna().tolist() == [False, True]
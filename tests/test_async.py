@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from unittest.mock import patch
+
+from src.ldacatabulator.collection import aload_many
+from src.ldacatabulator.storage import cache_info
+from src.ldacatabulator.tabulator import LDaCATabulator
+from tests.conftest import CRATES, zip_crate
+
+
+def test_aload_builds_without_blocking_the_loop(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url = corpus_server.serve_file("/~textfiles.zip", zip_crate(CRATES / "textfiles"))
+
+    async def main():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        tab = await LDaCATabulator.aload(url)
+        done.set()
+        await task
+        return tab, ticks
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        tab, ticks = asyncio.run(main())
+
+    assert ticks > 1
+    assert tab.database.exists()
+    assert not tab._needs_build
+
+    # A synchronous load reuses the copy the async load cached
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        again = LDaCATabulator(url, lazy=True)
+        again._ensure_database()
+    assert again.database == tab.database
+    assert corpus_server.requests[-1]["range"] == "bytes=0-0"
+
+
+def test_aload_many_with_process_builds(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    urls = [
+        corpus_server.serve_file("/~minimal.zip", zip_crate(CRATES / "minimal")),
+        f"http://127.0.0.1:{corpus_server.server_address[1]}/~missing.zip",
+        corpus_server.serve_file("/~utf8.zip", zip_crate(CRATES / "utf8")),
+    ]
+
+    async def main():
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return await aload_many(urls, max_concurrency=2, build_executor=pool)
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        collection = asyncio.run(main())
+
+    assert list(collection.corpora) == [urls[0], urls[2]]
+    assert list(collection.errors) == [urls[1]]
+    assert all(tab.database.exists() for tab in collection)
+
+
+def test_aload_many_keeps_a_collection_larger_than_the_quota(corpus_server, tmp_path):
+    cache = tmp_path / "cache"
+    urls = [
+        corpus_server.serve_file(f"/~{name}.zip", zip_crate(CRATES / name))
+        for name in ("wide", "minimal", "utf8")
+    ]
+
+    async def main():
+        old = await LDaCATabulator.aload(urls[0], cache_dir=cache)
+        old.close()
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+            collection = await aload_many(urls[1:], build_executor=pool, cache_dir=cache, cache_quota=1)
+        return old, collection
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        old, collection = asyncio.run(main())
+
+    assert list(collection.corpora) == urls[1:]
+    assert sorted(cache_info(cache)["url"]) == sorted(urls[1:])
+    assert not old.extract_to.exists()
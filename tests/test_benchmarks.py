@@ -0,0 +1,51 @@
+from io import BytesIO
+import json
+import zipfile
+
+from benchmarks.run import compare, crate_specs, run_suite
+from benchmarks.synthetic import corpus_id, synthetic_crate
+
+
+def test_synthetic_crate_shape():
+    with zipfile.ZipFile(BytesIO(synthetic_crate(20, 12))) as zf:
+        graph = json.loads(zf.read("ro-crate-metadata.json"))["@graph"]
+        names = zf.namelist()
+
+    objects = [node for node in graph if node.get("@type") == "RepositoryObject"]
+    assert len(objects) == 20
+    assert max(len(node) - 2 for node in objects) == 12
+    assert any(node["@id"] == corpus_id(20, 12) for node in graph)
+    assert "ro-crate-preview.html" in names
+    assert sum(name.startswith("text/") for name in names) == 20
+    assert synthetic_crate(20, 12) == synthetic_crate(20, 12)
+
+
+def test_large_synthetic_crates_are_skipped():
+    specs = list(crate_specs(bundled=False, objects=[10, 1000], properties=[10], max_cells=1000))
+
+    assert [details.get("skipped") is None for *_, details in specs] == [True, False]
+
+
+def test_run_suite_reports_every_operation():
+    specs = crate_specs(bundled=False, objects=[20], properties=[8])
+    doc = run_suite(specs, repeat=1)
+
+    entry = doc["results"][0]
+    assert entry["crate"] == corpus_id(20, 8)
+    assert set(entry["operations"]) == {
+        "cold_load", "warm_load", "get_text", "get_people", "drop_high_null_columns", "get_corpus_info",
+    }
+    assert "median" in entry["operations"]["cold_load"]
+    assert "median" in entry["operations"]["get_corpus_info"]
+    assert entry["stats"]["members_extracted"] == 22
+    json.dumps(doc)
+
+
+def test_compare_flags_slowdowns():
+    def doc(median):
+        return {"results": [{"crate": "c", "operations": {"get_text": {"median": median}}}]}
+
+    assert compare(doc(1.1), doc(1.0), threshold=1.25) == []
+    [regression] = compare(doc(2.0), doc(1.0), threshold=1.25)
+    assert regression["operation"] == "get_text"
+    assert regression["ratio"] == 2.0
@@ -0,0 +1,72 @@
+import contextlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ldacatabulator import cache as cache_module
+from src.ldacatabulator.cache import FrameCache
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"value": range(rows)})
+
+
+def _size(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def test_get_returns_isolated_copy():
+    cache = FrameCache(10**6)
+    cache.put("a", _frame(3))
+
+    df = cache.get("a")
+    # Copied on write, or read-only without Copy-on-Write
+    with contextlib.suppress(ValueError):
+        df.loc[0, "value"] = 99
+
+    assert cache.get("a")["value"].tolist() == [0, 1, 2]
+    assert cache.hits == 2
+
+
+def test_get_shares_read_only_data_without_copy_on_write(monkeypatch):
+    monkeypatch.setattr(cache_module, "_copy_on_write", lambda: False)
+    cached = pd.DataFrame({"value": range(3), "name": list("abc"), "n": pd.array([1, None, 3], dtype="Int64")})
+    expected = cached.copy()
+    cache = FrameCache(10**6)
+    cache.put("a", cached)
+
+    df = cache.get("a")
+    # A hit copies no numpy data; writing to it raises instead
+    assert np.shares_memory(df["value"].to_numpy(), cached["value"].to_numpy())
+    with pytest.raises(ValueError):
+        df.loc[0, "value"] = 99
+    df.loc[0, "n"] = 99
+    df["extra"] = 1
+
+    assert df.dtypes.drop("extra").equals(cached.dtypes)
+    pd.testing.assert_frame_equal(cache.get("a"), expected)
+
+
+def test_least_recently_used_frame_is_evicted():
+    small = _frame(10)
+    cache = FrameCache(2 * _size(small))
+    cache.put("a", small)
+    cache.put("b", small)
+    cache.get("a")
+
+    cache.put("c", small)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.current_bytes <= cache.max_bytes
+
+
+def test_frame_larger_than_budget_is_not_cached():
+    cache = FrameCache(10)
+
+    df = cache.put("big", _frame(1000))
+
+    assert len(df) == 1000
+    assert len(cache) == 0
+    assert cache.get("big") is None
@@ -0,0 +1,108 @@
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.ldacatabulator.bookkeeping import read_source_record
+from src.ldacatabulator.collection import LDaCACollection, load_many
+from src.ldacatabulator.registry import CorpusRegistry
+from src.ldacatabulator.storage import cache_info
+from src.ldacatabulator.tabulator import LDaCATabulator
+from tests.conftest import CRATES, zip_crate
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_load_many_isolates_failures(corpus_server, tmp_path, monkeypatch, use_processes):
+    monkeypatch.chdir(tmp_path)
+    urls = [
+        corpus_server.serve_file("/~minimal.zip", zip_crate(CRATES / "minimal")),
+        f"http://127.0.0.1:{corpus_server.server_address[1]}/~missing.zip",
+        corpus_server.serve_file("/~textfiles.zip", zip_crate(CRATES / "textfiles")),
+    ]
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        collection = load_many(urls, max_workers=3, build_workers=2, use_processes=use_processes)
+
+    assert list(collection.corpora) == [urls[0], urls[2]]
+    assert list(collection.errors) == [urls[1]]
+    for tab in collection:
+        assert tab.database.exists()
+        assert not tab._needs_build
+    # Both crates are called "Minimal crate"; each keeps its own copy
+    assert len({tab.extract_to for tab in collection}) == 2
+    assert len({tab.database for tab in collection}) == 2
+
+
+def test_load_many_keeps_same_named_corpora_apart(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Both crates are called "Minimal crate"
+    crates = {
+        corpus_server.serve_file(f"/~{name}.zip", zip_crate(CRATES / name)): CRATES / name
+        for name in ("minimal", "textfiles")
+    }
+
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        collection = load_many(crates, max_workers=2, use_processes=False)
+
+    assert list(collection.errors) == []
+    assert sorted(collection.corpus_name(tab) for tab in collection) == ["Minimal_crate", "Minimal_crate_2"]
+    for url, tab in collection.corpora.items():
+        files = sorted(p.relative_to(tab.extract_to) for p in tab.extract_to.rglob("*") if p.is_file())
+        assert files == sorted(p.relative_to(crates[url]) for p in crates[url].rglob("*") if p.is_file())
+        assert read_source_record(tab.database)["url"] == url
+        assert CorpusRegistry(tab.extract_to.parent, tab.database.parent).lookup(url)["database"] == tab.database
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_load_many_keeps_a_collection_larger_than_the_quota(corpus_server, tmp_path, use_processes):
+    cache = tmp_path / "cache"
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        old = LDaCATabulator(corpus_server.serve_file("/~wide.zip", zip_crate(CRATES / "wide")), cache_dir=cache)
+        old.close()
+        urls = [
+            corpus_server.serve_file(f"/~{name}.zip", zip_crate(CRATES / name))
+            for name in ("minimal", "textfiles", "utf8")
+        ]
+        # A one-byte quota: the whole collection stays, every other corpus goes
+        collection = load_many(
+            urls, max_workers=3, build_workers=2, use_processes=use_processes, cache_dir=cache, cache_quota=1
+        )
+
+    assert list(collection.corpora) == urls
+    assert sorted(cache_info(cache)["url"]) == sorted(urls)
+    assert all(tab.database.exists() and tab.extract_to.exists() for tab in collection)
+    assert not old.extract_to.exists()
+
+
+def _corpus(tmp_path, name: str, texts: list[str]) -> LDaCATabulator:
+    folder = tmp_path / name
+    folder.mkdir()
+    db_path = tmp_path / f"{name}.db"
+    with sqlite3.connect(db_path) as conn:
+        pd.DataFrame({"text": texts}).to_sql("RepositoryObject", conn, index=False)
+
+    tab = LDaCATabulator.__new__(LDaCATabulator)
+    tab.url = f"https://example.com/{name}.zip"
+    tab.database = db_path
+    tab.extract_to = folder
+    tab.tb = MagicMock(config={"tables": {}}, text_prop="ldac:mainText")
+    return tab
+
+
+def test_collection_get_text_adds_corpus_column(tmp_path):
+    broken = _corpus(tmp_path, "broken", ["x"])
+    broken.database = tmp_path / "missing" / "broken.db"
+    collection = LDaCACollection(
+        {
+            "a": _corpus(tmp_path, "alpha", ["a1", "a2"]),
+            "b": broken,
+            "c": _corpus(tmp_path, "gamma", ["c1"]),
+        }
+    )
+
+    df = collection.get_text()
+
+    assert list(df.columns) == ["corpus", "text"]
+    assert df.to_dict("list") == {"corpus": ["alpha", "alpha", "gamma"], "text": ["a1", "a2", "c1"]}
+    assert list(collection.errors) == ["b"]
@@ -0,0 +1,144 @@
+import sqlite3
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.ldacatabulator.connections import (
+    ReadConnections,
+    enable_wal,
+    remove_database,
+)
+from src.ldacatabulator.tabulator import LDaCATabulator
+
+
+def _make_database(path):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE Person (entity_id TEXT, name TEXT)")
+        conn.executemany("INSERT INTO Person VALUES (?, ?)", [("#p1", "Ann"), ("#p2", "Bob")])
+    return path
+
+
+def _corpus(db_path):
+    tab = LDaCATabulator.__new__(LDaCATabulator)
+    tab.url = "https://example.com/corpus.zip"
+    tab.database = db_path
+    tab.tb = MagicMock(config={"tables": {"Person": {}}}, text_prop="ldac:mainText")
+    return tab
+
+
+def test_read_connections_are_read_only_and_tuned(tmp_path):
+    connections = ReadConnections(_make_database(tmp_path / "corpus.db"))
+    conn = connections.get()
+
+    assert conn.execute("SELECT COUNT(*) FROM Person").fetchone() == (2,)
+    assert conn.execute("PRAGMA temp_store").fetchone() == (2,)
+    assert conn.execute("PRAGMA cache_size").fetchone() == (-64 * 1024,)
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO Person VALUES ('#p3', 'Cy')")
+    connections.close()
+
+
+def test_one_connection_per_thread(tmp_path):
+    connections = ReadConnections(_make_database(tmp_path / "corpus.db"))
+    main = connections.get()
+    assert connections.get() is main
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(connections.get()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main
+    assert len(connections) == 2
+    connections.close()
+    assert len(connections) == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        main.execute("SELECT 1")
+    # A read after close opens a new connection
+    assert connections.get().execute("SELECT COUNT(*) FROM Person").fetchone() == (2,)
+    connections.close()
+
+
+def test_rebuilt_database_gets_a_new_connection(tmp_path):
+    db_path = _make_database(tmp_path / "corpus.db")
+    connections = ReadConnections(db_path)
+    first = connections.get()
+
+    remove_database(db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE Person (entity_id TEXT, name TEXT)")
+    connections.invalidate()
+
+    second = connections.get()
+    assert second is not first
+    assert second.execute("SELECT COUNT(*) FROM Person").fetchone() == (0,)
+    connections.close()
+
+
+def test_wal_database_is_removed_with_its_log(tmp_path):
+    db_path = _make_database(tmp_path / "corpus.db")
+    assert enable_wal(db_path)
+    writer = sqlite3.connect(db_path)
+    writer.execute("INSERT INTO Person VALUES ('#p3', 'Cy')")
+    writer.commit()
+
+    # Readers see committed rows while the writer keeps its connection open
+    connections = ReadConnections(db_path)
+    assert connections.get().execute("SELECT COUNT(*) FROM Person").fetchone() == (3,)
+    connections.close()
+    writer.close()
+
+    remove_database(db_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_accessors_share_one_read_connection(tmp_path):
+    tab = _corpus(_make_database(tmp_path / "corpus.db"))
+
+    with patch("src.ldacatabulator.connections.sqlite3.connect", wraps=sqlite3.connect) as connect:
+        tab.get_people()
+        tab.get_people(where={"name": "Ann"})
+        tab.describe_table("Person")
+
+    read_only = [c for c in connect.call_args_list if "mode=ro" in str(c.args[0])]
+    assert len(read_only) == 1
+    assert len(tab._connections) == 1
+
+
+def test_warm_accessors_open_no_connections(tmp_path):
+    tab = _corpus(_make_database(tmp_path / "corpus.db"))
+    tab.get_people()
+
+    with patch("sqlite3.connect", wraps=sqlite3.connect) as connect:
+        for _ in range(10):
+            tab.get_people()
+
+    assert connect.call_count == 0
+    tab.close()
+
+
+def test_close_and_context_manager(tmp_path):
+    db_path = _make_database(tmp_path / "corpus.db")
+    with _corpus(db_path) as tab:
+        assert list(tab.get_people(columns=["name"])["name"]) == ["Ann", "Bob"]
+        db = tab.tb.db
+        assert len(tab._connections) == 1
+
+    assert len(tab._connections) == 0
+    db.close.assert_called_once_with()
+    assert tab.tb.db is None
+    # Still usable after closing
+    assert len(tab.get_people(columns=["name"])) == 2
+    tab.close()
+
+
+def test_built_database_uses_wal(tmp_path):
+    db_path = tmp_path / "corpus.db"
+    tb = MagicMock()
+    tb.crate_to_db.side_effect = lambda crate, database: _make_database(database)
+
+    LDaCATabulator._build_database(tb, tmp_path, db_path, None)
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("pandas", "numpy", "requests", "bs4", "rocrate_tabular", "asyncio")
+# Importing pandas alone takes longer than this
+IMPORT_BUDGET_SECONDS = 0.2
+
+
+def _import_profile(statement: str) -> tuple[float, list[str]]:
+    """
+    Run statement in a fresh interpreter and return the seconds spent
+    importing the package and which heavy modules ended up loaded.
+    """
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    micros = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level entries only; nested ones are part of their cumulative time
+        if name.startswith(" src") and not name.startswith("  "):
+            micros += int(cumulative)
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return micros / 1e6, loaded
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import src.ldacatabulator",
+        "import src.ldacatabulator.tabulator",
+        "import src.ldacatabulator.collection",
+    ],
+)
+def test_import_skips_heavy_dependencies_and_stays_within_budget(statement):
+    # Best of three, so a busy machine does not fail the budget
+    profiles = [_import_profile(statement) for _ in range(3)]
+
+    assert profiles[0][1] == []
+    assert min(seconds for seconds, _ in profiles) < IMPORT_BUDGET_SECONDS
+
+
+def test_lazy_exports_load_on_first_use():
+    code = (
+        "import sys\n"
+        "import src.ldacatabulator as pkg\n"
+        "assert 'src.ldacatabulator.tabulator' not in sys.modules\n"
+        "assert 'LDaCATabulator' in dir(pkg)\n"
+        "from src.ldacatabulator import LDaCATabulator, load_many\n"
+        "from src.ldacatabulator.tabulator import LDaCATabulator as direct\n"
+        "assert LDaCATabulator is direct\n"
+        "assert 'pandas' not in sys.modules\n"
+        "import src.ldacatabulator.tabulator as tabulator\n"
+        "assert tabulator.pd.__name__ == 'pandas'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
+
+    import src.ldacatabulator as pkg
+
+    with pytest.raises(AttributeError):
+        pkg.missing
@@ -0,0 +1,380 @@
+import json
+from pathlib import Path
+import shutil
+import sqlite3
+import zlib
+
+import pandas as pd
+import pytest
+
+from src.ldacatabulator import tabulator as tabulator_module
+from src.ldacatabulator.bookkeeping import (
+    base_is_stale,
+    config_hash,
+    read_column_stats,
+    read_table_records,
+    write_column_stats,
+    write_table_record,
+)
+from src.ldacatabulator.incremental import (
+    affected_ids,
+    apply_update,
+    changed_files,
+    diff_graphs,
+    file_members,
+    plan_update,
+    read_members,
+    text_files,
+)
+from src.ldacatabulator.metadata import CrateGraph
+from src.ldacatabulator.query import non_null_counts, table_columns
+from src.ldacatabulator.tabulator import LDaCATabulator
+from tests.conftest import zip_crate
+
+TEXT_PROP = "ldac:mainText"
+CONFIG = {
+    "tables": {
+        "RepositoryObject": {"all_props": [], "expand_props": ["author", TEXT_PROP], "ignore_props": []},
+        "Person": {"all_props": [], "expand_props": [], "ignore_props": []},
+    }
+}
+
+
+# --------------------------------------------------------------------
+# A small stand-in for ROCrateTabulator with the same layout:
+# ``crate_to_db`` writes one ``property`` row per entity property,
+# keyed by ``source_id``, and ``entity_table`` flattens the entities of
+# a type from those rows into a table keyed by ``entity_id``. Plain
+# values are copied, references become ``<prop>_id`` columns, expanded
+# references ``<prop>_name`` columns and text files are read into the
+# text property column.
+# --------------------------------------------------------------------
+PROPERTY_COLUMNS = (
+    "row_id INTEGER PRIMARY KEY, source_id TEXT, source_name TEXT, "
+    "property_label TEXT, target_id TEXT, value TEXT"
+)
+
+
+class FakeTabulator:
+    crates = []
+
+    def __init__(self):
+        self.db = None
+        self.config = {}
+        self.text_prop = None
+
+    def crate_to_db(self, crate_uri, db_file, rebuild=True):
+        self.crate = Path(crate_uri)
+        self.db = sqlite3.connect(db_file)
+        if not rebuild:
+            return
+        graph = json.loads((self.crate / "ro-crate-metadata.json").read_text(encoding="utf-8"))["@graph"]
+        FakeTabulator.crates.append(len(graph))
+        rows = []
+        for node in graph:
+            for prop, values in node.items():
+                if prop == "@id":
+                    continue
+                for value in values if isinstance(values, list) else [values]:
+                    target = value["@id"] if isinstance(value, dict) else None
+                    rows.append((node["@id"], node.get("name"), prop, target, None if target else value))
+        self.db.execute("DROP TABLE IF EXISTS property")
+        self.db.execute(f"CREATE TABLE property ({PROPERTY_COLUMNS})")
+        self.db.executemany(
+            "INSERT INTO property (source_id, source_name, property_label, target_id, value) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.db.commit()
+
+    def entity_table(self, table):
+        expand = self.config.get("tables", {}).get(table, {}).get("expand_props", [])
+        ids = self.db.execute(
+            "SELECT DISTINCT source_id FROM property WHERE property_label = '@type' AND value = ?", (table,)
+        ).fetchall()
+        rows = []
+        for (entity_id,) in ids:
+            row = {"entity_id": entity_id}
+            properties = self.db.execute(
+                "SELECT property_label, target_id, value FROM property WHERE source_id = ? ORDER BY row_id",
+                (entity_id,),
+            ).fetchall()
+            for prop, target, value in properties:
+                if prop == "@type":
+                    continue
+                if prop == self.text_prop:
+                    row[prop] = (self.crate / target).read_text(encoding="utf-8")
+                elif target is not None:
+                    row[f"{prop}_id"] = target
+                    if prop in expand:
+                        name = self.db.execute(
+                            "SELECT value FROM property WHERE source_id = ? AND property_label = 'name'",
+                            (target,),
+                        ).fetchone()
+                        row[f"{prop}_name"] = name[0] if name else None
+                else:
+                    row[prop] = value
+            rows.append(row)
+        if not rows:
+            raise KeyError(table)
+        columns = list(dict.fromkeys(c for row in rows for c in row))
+        quoted = ", ".join(f'"{c}"' for c in columns)
+        self.db.execute(f'DROP TABLE IF EXISTS "{table}"')
+        self.db.execute(f'CREATE TABLE "{table}" ({quoted})')
+        self.db.executemany(
+            f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(columns))})',
+            [[row.get(c) for c in columns] for row in rows],
+        )
+        self.db.commit()
+
+
+def _write_crate(path: Path, objects: dict, people: dict, texts: dict) -> Path:
+    """
+    Write a crate with RepositoryObjects ``{id: (name, author)}``, People
+    ``{id: name}`` and text files ``{id: text}`` (one per object).
+    """
+    graph = [
+        {"@id": "ro-crate-metadata.json", "@type": "CreativeWork", "about": {"@id": "./"}},
+        {
+            "@id": "./",
+            "@type": "Dataset",
+            "name": "Incremental corpus",
+            "hasMember": [{"@id": i} for i in objects],
+        },
+    ]
+    graph += [{"@id": i, "@type": "Person", "name": name} for i, name in people.items()]
+    for i, (name, author) in objects.items():
+        graph.append({
+            "@id": i,
+            "@type": "RepositoryObject",
+            "name": name,
+            "author": {"@id": author},
+            TEXT_PROP: {"@id": f"text/{i.strip('#')}.txt"},
+        })
+    if path.exists():
+        shutil.rmtree(path)
+    (path / "text").mkdir(parents=True)
+    metadata = {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": graph}
+    (path / "ro-crate-metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    for i, text in texts.items():
+        (path / "text" / f"{i.strip('#')}.txt").write_text(text, encoding="utf-8")
+    return path
+
+
+def _versions():
+    people = {"#p1": "Ann", "#p2": "Bob"}
+    objects = {f"#o{n}": (f"Doc {n}", "#p1" if n % 4 else "#p2") for n in range(20)}
+    texts = {i: f"text of {i}" for i in objects}
+    v1 = (objects, people, texts)
+
+    objects2 = dict(objects)
+    objects2["#o1"] = ("Doc one", "#p1")     # changed entity
+    del objects2["#o19"]                     # removed
+    objects2["#o20"] = ("Doc 20", "#p1")     # added
+    people2 = {**people, "#p2": "Robert"}    # expanded into #o0, #o4, ...
+    texts2 = {i: f"text of {i}" for i in objects2}
+    texts2["#o3"] = "revised text"           # same entity, new file content
+    return v1, (objects2, people2, texts2)
+
+
+def _full_build(crate: Path, database: Path, tabulator=FakeTabulator, tables=("RepositoryObject", "Person")):
+    tb = tabulator()
+    tb.config, tb.text_prop = CONFIG, TEXT_PROP
+    tb.crate_to_db(str(crate), str(database))
+    for table in tables:
+        tb.entity_table(table)
+        write_table_record(database, table, config_hash(CONFIG, table, TEXT_PROP))
+        with sqlite3.connect(database) as conn:
+            stats = non_null_counts(conn, table, table_columns(conn, table))
+        write_column_stats(database, table, *stats)
+    tb.db.close()
+
+
+def _members(crate: Path, graph: CrateGraph) -> dict:
+    return file_members(crate, text_files(graph, (TEXT_PROP,)))
+
+
+def _table(database: Path, table: str) -> pd.DataFrame:
+    with sqlite3.connect(database) as conn:
+        df = pd.read_sql(f'SELECT * FROM "{table}"', conn)
+    return df.sort_values("entity_id").reset_index(drop=True)[sorted(df.columns)]
+
+
+def _base_tables(database: Path) -> dict[str, pd.DataFrame]:
+    """
+    Return the tables ``crate_to_db`` filled, without their row ids, in a
+    stable order.
+    """
+    tables = {}
+    with sqlite3.connect(database) as conn:
+        names = [name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        for name in names:
+            if name in ("RepositoryObject", "Person") or name.startswith(("sqlite_", "_ldaca_")):
+                continue
+            info = conn.execute(f'PRAGMA table_info("{name}")').fetchall()
+            row_ids = [row[1] for row in info if row[5] and row[2].upper() == "INTEGER"]
+            df = pd.read_sql(f'SELECT * FROM "{name}"', conn).drop(columns=row_ids).astype(str)
+            tables[name] = df.sort_values(list(df.columns)).reset_index(drop=True)
+    return tables
+
+
+def _assert_same_base_tables(database: Path, expected: Path):
+    actual, wanted = _base_tables(database), _base_tables(expected)
+    assert actual.keys() == wanted.keys()
+    for name in wanted:
+        pd.testing.assert_frame_equal(actual[name], wanted[name])
+
+
+def test_diff_and_affected_entities(tmp_path):
+    v1, v2 = _versions()
+    old_dir, new_dir = _write_crate(tmp_path / "v1", *v1), _write_crate(tmp_path / "v2", *v2)
+    old = CrateGraph.from_file(old_dir / "ro-crate-metadata.json")
+    new = CrateGraph.from_file(new_dir / "ro-crate-metadata.json")
+
+    diff = diff_graphs(old, new)
+    old_members, new_members = _members(old_dir, new), _members(new_dir, new)
+    files = changed_files(old_members, new_members, new, (TEXT_PROP,))
+    plan = plan_update(old, new, old_members, new_members, [CONFIG], TEXT_PROP, (TEXT_PROP,))
+
+    assert diff.added == {"#o20"}
+    assert diff.changed == {"./", "#o1", "#p2"}
+    assert diff.removed == {"#o19"}
+    assert files == {"text/o3.txt", "text/o20.txt"}
+    affected = affected_ids(plan, new, "RepositoryObject", CONFIG)
+    # Changed entities, objects whose author was renamed and the object whose text changed
+    assert affected >= {"#o1", "#o19", "#o20", "#o0", "#o4", "#o3"}
+    assert "#o2" not in affected
+    assert affected_ids(plan, new, "Person", CONFIG) == diff.touched
+
+
+def _update(tmp_path, crate: Path, database: Path, tabulator) -> list[str]:
+    """
+    Replace crate by the second version and patch database to match it.
+    """
+    old = CrateGraph.from_file(crate / "ro-crate-metadata.json")
+    staging = _write_crate(tmp_path / "staging", *_versions()[1])
+    new = CrateGraph.from_file(staging / "ro-crate-metadata.json")
+    plan = plan_update(old, new, _members(crate, new), _members(staging, new), [CONFIG], TEXT_PROP, (TEXT_PROP,))
+    shutil.rmtree(crate)
+    staging.rename(crate)
+    return apply_update(plan, new, crate, database, tabulator)
+
+
+def test_apply_update_matches_a_full_build(tmp_path):
+    crate = _write_crate(tmp_path / "crate", *_versions()[0])
+    database = tmp_path / "corpus.db"
+    _full_build(crate, database)
+
+    FakeTabulator.crates.clear()
+    patched = _update(tmp_path, crate, database, FakeTabulator)
+
+    assert sorted(patched) == ["Person", "RepositoryObject"]
+    # Only the descriptor, the root, the 8 affected objects and the 2 people
+    # they expand were tabulated, out of 24 entities
+    assert FakeTabulator.crates == [12]
+    expected = tmp_path / "expected.db"
+    _full_build(crate, expected)
+    for table in ("RepositoryObject", "Person"):
+        pd.testing.assert_frame_equal(_table(database, table), _table(expected, table))
+        assert read_column_stats(database, table) == read_column_stats(expected, table)
+    # The property rows of the changed entities were replaced as well
+    _assert_same_base_tables(database, expected)
+    assert not base_is_stale(database)
+
+
+def test_apply_update_patches_base_tables_without_entity_tables(tmp_path):
+    crate = _write_crate(tmp_path / "crate", *_versions()[0])
+    database = tmp_path / "corpus.db"
+    _full_build(crate, database, tables=())
+
+    FakeTabulator.crates.clear()
+    assert _update(tmp_path, crate, database, FakeTabulator) == []
+    assert len(FakeTabulator.crates) == 1 and FakeTabulator.crates[0] < 10
+
+    expected = tmp_path / "expected.db"
+    _full_build(crate, expected, tables=())
+    _assert_same_base_tables(database, expected)
+    assert not base_is_stale(database)
+
+
+def test_apply_update_marks_unmatched_base_tables_stale(tmp_path):
+    class Unkeyed(FakeTabulator):
+        def crate_to_db(self, crate_uri, db_file, rebuild=True):
+            super().crate_to_db(crate_uri, db_file, rebuild)
+            if rebuild:
+                self.db.execute("CREATE TABLE crate_summary (entities INTEGER)")
+                self.db.commit()
+
+    crate = _write_crate(tmp_path / "crate", *_versions()[0])
+    database = tmp_path / "corpus.db"
+    _full_build(crate, database, Unkeyed)
+
+    assert sorted(_update(tmp_path, crate, database, Unkeyed)) == ["Person", "RepositoryObject"]
+    assert base_is_stale(database)
+
+
+def test_apply_update_with_rocrate_tabular(tmp_path):
+    # The real tabulator reads crates with ro-crate-py
+    pytest.importorskip("rocrate")
+    from rocrate_tabular.tabulator import ROCrateTabulator
+
+    crate = _write_crate(tmp_path / "crate", *_versions()[0])
+    database = tmp_path / "corpus.db"
+    _full_build(crate, database, ROCrateTabulator, tables=("RepositoryObject",))
+
+    assert _update(tmp_path, crate, database, ROCrateTabulator) == ["RepositoryObject"]
+    assert not base_is_stale(database)
+
+    # A table first materialised after the update reads the patched base tables
+    tb = ROCrateTabulator()
+    tb.config, tb.text_prop = CONFIG, TEXT_PROP
+    tb.crate_to_db(str(crate), str(database), rebuild=False)
+    tb.entity_table("Person")
+    tb.db.close()
+
+    expected = tmp_path / "expected.db"
+    _full_build(crate, expected, ROCrateTabulator)
+    for table in ("RepositoryObject", "Person"):
+        pd.testing.assert_frame_equal(_table(database, table), _table(expected, table))
+    _assert_same_base_tables(database, expected)
+
+
+def test_incremental_load_of_a_new_version(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tabulator_module, "_new_tabulator", FakeTabulator)
+    config_file = tmp_path / "configs" / "general" / "general-config.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text(json.dumps(CONFIG), encoding="utf-8")
+    v1, v2 = _versions()
+
+    url = corpus_server.serve_file("/incremental.zip", zip_crate(_write_crate(tmp_path / "src1", *v1)))
+    first = LDaCATabulator(url, tb=FakeTabulator(), incremental=True)
+    first.get_text()
+    # The CRC-32 and size of each file are taken from the ZIP as it is extracted
+    members = read_members(first._members_path(first.database))
+    assert members["text/o3.txt"] == (zlib.crc32(b"text of #o3"), len("text of #o3"))
+
+    corpus_server.serve_file("/incremental.zip", zip_crate(_write_crate(tmp_path / "src2", *v2)))
+    FakeTabulator.crates.clear()
+    # so comparing the versions reads none of the cached text files
+    monkeypatch.setattr(tabulator_module, "file_members", None)
+    second = LDaCATabulator(url, tb=FakeTabulator(), incremental=True)
+    text = second.get_text()
+
+    assert second.database == first.database
+    assert len(FakeTabulator.crates) == 1 and FakeTabulator.crates[0] < 20
+    assert "tabulate" in second.stats.stages
+    assert read_table_records(second.database) == {
+        "RepositoryObject": config_hash(CONFIG, "RepositoryObject", TEXT_PROP)
+    }
+    by_name = text.set_index("name")
+    assert "Doc 19" not in by_name.index
+    assert by_name.loc["Doc 20", TEXT_PROP] == "text of #o20"
+    assert by_name.loc["Doc 3", TEXT_PROP] == "revised text"
+    assert by_name.loc["Doc 4", "author_name"] == "Robert"
+
+    # A table that was never materialised is flattened from the patched base tables
+    assert not base_is_stale(second.database)
+    people = second.get_people()
+    assert sorted(people["name"]) == ["Ann", "Robert"]
+    assert len(FakeTabulator.crates) == 1
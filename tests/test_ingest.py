@@ -0,0 +1,459 @@
+import hashlib
+from io import BytesIO
+import os
+from unittest.mock import MagicMock
+import zipfile
+
+import pytest
+import requests
+
+from src.ldacatabulator import ingest
+from src.ldacatabulator.ingest import (
+    ChecksumMismatch,
+    MemberSelector,
+    download_archive,
+    extract_stream,
+    fetch_archive,
+    iter_stream_members,
+    read_remote_member,
+    same_archive,
+    zipinfo_digest,
+)
+from src.ldacatabulator.stats import LoadStats
+from src.ldacatabulator.tabulator import LDaCATabulator
+from tests.conftest import CRATES, assert_built_into, zip_crate
+
+
+class _Unseekable:
+    """Write-only stream that forces zipfile to emit data descriptors."""
+
+    def __init__(self):
+        self.buf = BytesIO()
+
+    def write(self, data):
+        return self.buf.write(data)
+
+    def flush(self):
+        pass
+
+
+def _chunks(data: bytes, size: int):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+def _payload_zip(audio_size: int = 3 * 1024 * 1024) -> bytes:
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("ro-crate-metadata.json", '{"@graph": []}')
+        zf.writestr("Text/doc.txt", "hello " * 100)
+        zf.writestr("Audio/big.mp3", os.urandom(audio_size), compress_type=zipfile.ZIP_STORED)
+    return buf.getvalue()
+
+
+# --------------------------------------------------------------------
+# Test: sequential stream parsing
+# --------------------------------------------------------------------
+def test_iter_stream_members_with_data_descriptors():
+    out = _Unseekable()
+    with zipfile.ZipFile(out, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("a.txt", "alpha " * 500)
+        zf.writestr("dir/b.txt", "beta")
+    data = out.buf.getvalue()
+
+    members = {
+        name: b"".join(chunks)
+        for name, chunks in iter_stream_members(_chunks(data, 7))
+    }
+
+    assert members == {"a.txt": b"alpha " * 500, "dir/b.txt": b"beta"}
+
+
+def test_iter_stream_members_detects_corruption():
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w") as zf:
+        zf.writestr("a.txt", "original content")
+    data = buf.getvalue().replace(b"original", b"tampered")
+
+    with pytest.raises(zipfile.BadZipFile):
+        for _ in iter_stream_members([data]):
+            pass
+
+
+def test_extract_stream_skips_excluded_members(tmp_path):
+    data = _payload_zip(audio_size=1024)
+
+    count = extract_stream(_chunks(data, 1000), tmp_path, MemberSelector(exclude=["Audio/*"]))
+
+    assert count == 2
+    assert (tmp_path / "Text" / "doc.txt").read_text() == "hello " * 100
+    assert not (tmp_path / "Audio").exists()
+
+
+def test_extract_stream_keeps_paths_inside_destination(tmp_path):
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w") as zf:
+        zf.writestr("../../escape.txt", "x")
+    dest = tmp_path / "dest"
+    dest.mkdir()
+
+    extract_stream([buf.getvalue()], dest)
+
+    assert (dest / "escape.txt").exists()
+    assert not (tmp_path / "escape.txt").exists()
+
+
+# --------------------------------------------------------------------
+# Test: fetch_archive against local HTTP servers
+# --------------------------------------------------------------------
+def test_fetch_archive_streams_without_range_support(httpserver, tmp_path):
+    httpserver.serve_content(_payload_zip(audio_size=2048), headers={"ETag": '"v1"'})
+
+    record = fetch_archive(f"{httpserver.url}/corpus.zip", tmp_path, selector=MemberSelector(exclude=["*.mp3"]))
+
+    assert record["etag"] == '"v1"'
+    assert record["digest"].startswith("sha256:")
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file()) == [
+        "Text/doc.txt",
+        "ro-crate-metadata.json",
+    ]
+
+
+def test_fetch_archive_streams_large_archive_without_range_support(corpus_server, tmp_path):
+    # A central directory spanning several chunks arrives after the last member
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w") as zf:
+        for n in range(15000):
+            zf.writestr(f"Text/document-{n:05d}.txt", f"{n:05d}".encode() * 30)
+    data = buf.getvalue()
+    assert len(data) > 3 * ingest.CHUNK_SIZE
+    corpus_server.ranges = False
+    url = corpus_server.serve_file("/corpus.zip", data)
+
+    record = fetch_archive(url, tmp_path)
+
+    assert f"sha256:{hashlib.sha256(data).hexdigest()}" in record["digest"].split()
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        assert zipinfo_digest(zf) in record["digest"].split()
+    assert len(list((tmp_path / "Text").iterdir())) == 15000
+
+
+def test_fetch_archive_range_requests_skip_excluded_members(corpus_server, tmp_path):
+    data = _payload_zip()
+    url = corpus_server.serve_file("/corpus.zip", data)
+
+    record = fetch_archive(url, tmp_path, selector=MemberSelector(exclude=["Audio/*"]))
+
+    assert record["digest"].startswith("zipinfo:")
+    assert (tmp_path / "Text" / "doc.txt").exists()
+    assert not (tmp_path / "Audio").exists()
+    assert corpus_server.bytes_sent < len(data) // 2
+
+
+def test_fetch_archive_range_requests_with_weak_etags(corpus_server, tmp_path):
+    corpus_server.weak_etags = True
+    url = corpus_server.serve_file("/corpus.zip", _payload_zip())
+
+    record = fetch_archive(url, tmp_path, selector=MemberSelector(exclude=["Audio/*"]))
+
+    assert record["etag"].startswith("W/")
+    assert record["digest"].startswith("zipinfo:")
+    assert (tmp_path / "Text" / "doc.txt").exists()
+    # The weak ETag is not sent as If-Range, which the server would ignore
+    assert [r["if_range"] for r in corpus_server.requests] == [None] * len(corpus_server.requests)
+    assert all(r["range"] for r in corpus_server.requests)
+
+
+def test_fetch_archive_streams_when_range_requests_stop_working(corpus_server, tmp_path):
+    data = _payload_zip()
+    url = corpus_server.serve_file("/corpus.zip", data)
+    # Only the first-byte probe gets a partial response
+    corpus_server.max_ranges = 1
+    members = {}
+
+    record = fetch_archive(url, tmp_path, members=members)
+
+    assert f"sha256:{hashlib.sha256(data).hexdigest()}" in record["digest"].split()
+    assert (tmp_path / "Audio" / "big.mp3").exists()
+    assert sorted(members) == ["Audio/big.mp3", "Text/doc.txt", "ro-crate-metadata.json"]
+    assert corpus_server.requests[-1]["range"] is None
+
+
+def test_fetch_archive_range_skips_extraction_for_known_digest(corpus_server, tmp_path):
+    url = corpus_server.serve_file("/corpus.zip", _payload_zip(audio_size=1024))
+    first = fetch_archive(url, tmp_path / "first")
+
+    record = fetch_archive(url, tmp_path / "second", cached={"digest": first["digest"]})
+
+    assert record["digest"] == first["digest"]
+    assert not (tmp_path / "second").exists()
+
+
+def test_fetch_archive_recognises_an_archive_whichever_way_it_was_fetched(corpus_server, tmp_path):
+    url = corpus_server.serve_file("/corpus.zip", _payload_zip(audio_size=1024))
+    by_range = fetch_archive(url, tmp_path / "range")
+    corpus_server.ranges = False
+    streamed = fetch_archive(url, tmp_path / "stream")
+    resumed = fetch_archive(url, tmp_path / "part", cached={"digest": by_range["digest"]}, resumable=True)
+
+    assert same_archive(by_range["digest"], streamed["digest"])
+    assert same_archive(streamed["digest"], resumed["digest"])
+    assert same_archive(by_range["digest"], resumed["digest"])
+    # The cached copy fetched by range is not extracted again
+    assert not (tmp_path / "part").exists()
+
+    corpus_server.serve_file("/corpus.zip", _payload_zip(audio_size=2048))
+    changed = fetch_archive(url, tmp_path / "changed")
+    assert not same_archive(by_range["digest"], changed["digest"])
+    assert not same_archive("sha256:00", "zipinfo:00")
+
+
+def test_unzip_corpus_streams_from_local_server(corpus_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url = corpus_server.serve_file("/~languageFamily.zip", zip_crate(CRATES / "languageFamily"))
+    fake_tb = MagicMock()
+    tab = LDaCATabulator.__new__(LDaCATabulator)
+    tab.url = url
+
+    db_path, extracted_path = LDaCATabulator._unzip_corpus(
+        tab, zip_url=url, tb=fake_tb, exclude=["Audio/*", "Images/*"]
+    )
+
+    assert (extracted_path / "ro-crate-metadata.json").exists()
+    assert len(list((extracted_path / "Text").iterdir())) == 11
+    assert not (extracted_path / "Audio").exists()
+    assert not list((tmp_path / "ldacaCollections").glob("*.zip"))
+    assert not list((tmp_path / "ldacaCollections").glob(".*.partial"))
+    assert_built_into(fake_tb, extracted_path, db_path)
+
+
+# --------------------------------------------------------------------
+# Test: MemberSelector extraction policies
+# --------------------------------------------------------------------
+_TEXT_METADATA = """
+{
+  "@graph": [
+    {"@id": "#doc1", "@type": "RepositoryObject", "ldac:mainText": {"@id": "Text/doc%201.txt"}},
+    {"@id": "#doc2", "@type": "RepositoryObject", "ldac:mainText": [{"@id": "./Text/doc2.txt"}]},
+    {"@id": "Text/doc 1.txt", "@type": "File"},
+    {"@id": "./Text/doc2.txt", "@type": "File"},
+    {"@id": "Audio/doc1.wav", "@type": "File"}
+  ]
+}
+"""
+
+
+def _text_crate_zip(metadata_last: bool = False) -> bytes:
+    buf = BytesIO()
+    members = [
+        ("Text/doc 1.txt", "one"),
+        ("Text/doc2.txt", "two"),
+        ("Text/notes.txt", "unreferenced"),
+        ("Audio/doc1.wav", "RIFF"),
+        ("ro-crate-preview.html", "<html></html>"),
+    ]
+    metadata = ("ro-crate-metadata.json", _TEXT_METADATA)
+    members = members + [metadata] if metadata_last else [metadata] + members
+    with zipfile.ZipFile(buf, mode="w") as zf:
+        for name, content in members:
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+def _files(root):
+    return sorted(p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file())
+
+
+def test_selector_text_policy_uses_referenced_files():
+    selector = MemberSelector("text", text_props=("ldac:mainText",))
+    selector.load_metadata(_TEXT_METADATA.encode())
+
+    assert selector("ro-crate-metadata.json")
+    assert selector("Text/doc 1.txt")
+    assert selector("Text/doc2.txt")
+    assert not selector("Text/notes.txt")
+    assert not selector("Audio/doc1.wav")
+
+
+def test_selector_include_and_exclude_patterns():
+    selector = MemberSelector("metadata", include=["Text/*"], exclude=["Text/notes.txt"])
+
+    assert selector("ro-crate-preview.html")
+    assert selector("Text/doc2.txt")
+    assert not selector("Text/notes.txt")
+    assert not selector("Audio/doc1.wav")
+
+
+def test_selector_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        MemberSelector("audio")
+
+
+@pytest.mark.parametrize("metadata_last", [False, True])
+def test_extract_stream_text_policy(tmp_path, metadata_last):
+    selector = MemberSelector("text", text_props=("ldac:mainText",))
+
+    count = extract_stream([_text_crate_zip(metadata_last)], tmp_path, selector)
+
+    assert count == 4
+    assert _files(tmp_path) == [
+        "Text/doc 1.txt",
+        "Text/doc2.txt",
+        "ro-crate-metadata.json",
+        "ro-crate-preview.html",
+    ]
+
+
+def test_fetch_archive_range_text_policy(corpus_server, tmp_path):
+    url = corpus_server.serve_file("/corpus.zip", _text_crate_zip(metadata_last=True))
+
+    fetch_archive(url, tmp_path, selector=MemberSelector("text", text_props=("ldac:mainText",)))
+
+    assert _files(tmp_path) == [
+        "Text/doc 1.txt",
+        "Text/doc2.txt",
+        "ro-crate-metadata.json",
+        "ro-crate-preview.html",
+    ]
+
+
+@pytest.mark.parametrize("ranges", [True, False])
+def test_read_remote_member(corpus_server, ranges):
+    corpus_server.ranges = ranges
+    url = corpus_server.serve_file("/corpus.zip", _text_crate_zip())
+
+    data = read_remote_member(url, "ro-crate-metadata.json")
+
+    assert data.decode() == _TEXT_METADATA
+
+
+# --------------------------------------------------------------------
+# Test: retries and resumable downloads
+# --------------------------------------------------------------------
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(ingest, "BACKOFF_BASE", 0)
+
+
+@pytest.mark.parametrize("ranges", [True, False])
+def test_fetch_archive_retries_dropped_connections(corpus_server, tmp_path, no_backoff, ranges):
+    corpus_server.ranges = ranges
+    url = corpus_server.serve_file("/corpus.zip", _payload_zip(audio_size=2 * 1024 * 1024))
+    corpus_server.drops, corpus_server.drop_after = 2, 64 * 1024
+
+    stats = LoadStats()
+    record = fetch_archive(url, tmp_path, retries=3, stats=stats)
+
+    assert record["digest"]
+    assert corpus_server.drops == 0
+    assert 2 * 1024 * 1024 < stats.bytes_downloaded <= corpus_server.bytes_sent
+    assert _files(tmp_path) == ["Audio/big.mp3", "Text/doc.txt", "ro-crate-metadata.json"]
+    assert (tmp_path / "Audio" / "big.mp3").stat().st_size == 2 * 1024 * 1024
+
+
+def test_fetch_archive_gives_up_after_retries(corpus_server, tmp_path, no_backoff):
+    corpus_server.ranges = False
+    url = corpus_server.serve_file("/corpus.zip", _payload_zip(audio_size=1024 * 1024))
+    corpus_server.drops, corpus_server.drop_after = 5, 1024
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        fetch_archive(url, tmp_path, retries=1)
+
+
+def test_resumable_download_without_content_length(corpus_server, tmp_path, no_backoff):
+    corpus_server.content_length = False
+    data = _payload_zip(audio_size=1024 * 1024)
+    url = corpus_server.serve_file("/corpus.zip", data)
+    part = tmp_path / "corpus.zip.part"
+    corpus_server.drops, corpus_server.drop_after = 1, len(data) // 2
+
+    # The body breaking off is only seen from the missing end record
+    record = download_archive(url, part, retries=1)
+
+    assert corpus_server.requests[-1]["range"] == f"bytes={len(data) // 2}-"
+    assert part.read_bytes() == data
+    assert record["digest"] == f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+    # A complete part file of unknown size is not requested again
+    requests_made = len(corpus_server.requests)
+    assert download_archive(url, part, retries=0)["digest"] == record["digest"]
+    assert len(corpus_server.requests) == requests_made
+
+
+def test_resumable_download_restarts_after_range_not_satisfiable(corpus_server, tmp_path, no_backoff):
+    corpus_server.content_length = False
+    data = _payload_zip(audio_size=1024)
+    url = corpus_server.serve_file("/corpus.zip", data)
+    part = tmp_path / "corpus.zip.part"
+    download_archive(url, part)
+    with open(part, "ab") as f:
+        f.write(b"trailing bytes")
+
+    record = download_archive(url, part, retries=1)
+
+    assert [r["range"] for r in corpus_server.requests[-2:]] == [f"bytes={len(data) + 14}-", None]
+    assert part.read_bytes() == data
+    assert record["digest"] == f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def test_fetch_archive_retries_a_body_cut_between_members(corpus_server, tmp_path, no_backoff):
+    corpus_server.ranges = corpus_server.content_length = False
+    data = _payload_zip(audio_size=1024)
+    url = corpus_server.serve_file("/corpus.zip", data)
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        corpus_server.drops, corpus_server.drop_after = 1, zf.start_dir
+
+    record = fetch_archive(url, tmp_path, retries=1)
+
+    assert len(corpus_server.requests) == 2
+    assert f"sha256:{hashlib.sha256(data).hexdigest()}" in record["digest"].split()
+
+
+def test_resumable_download_with_weak_etag_starts_over(corpus_server, tmp_path, no_backoff):
+    corpus_server.weak_etags = True
+    data = _payload_zip(audio_size=1024 * 1024)
+    url = corpus_server.serve_file("/corpus.zip", data)
+    part = tmp_path / "corpus.zip.part"
+    corpus_server.drops, corpus_server.drop_after = 1, len(data) // 2
+
+    record = download_archive(url, part, retries=1)
+
+    # A weak ETag cannot guard a Range request, so nothing is spliced
+    assert [r["if_range"] for r in corpus_server.requests] == [None, None]
+    assert corpus_server.requests[-1]["range"] is None
+    assert part.read_bytes() == data
+    assert record["digest"] == f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def test_resumable_download_continues_from_part_file(corpus_server, tmp_path, no_backoff):
+    data = _payload_zip(audio_size=1024 * 1024)
+    url = corpus_server.serve_file("/corpus.zip", data)
+    dest = tmp_path / ".corpus.partial"
+    dest.mkdir()
+    part = tmp_path / ".corpus.partial.zip.part"
+    corpus_server.drops, corpus_server.drop_after = 1, len(data) // 2
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        fetch_archive(url, dest, resumable=True, retries=0)
+    kept = part.stat().st_size
+    assert 0 < kept <= len(data) // 2
+
+    record = fetch_archive(url, dest, resumable=True, retries=0)
+
+    assert corpus_server.requests[-1]["range"] == f"bytes={kept}-"
+    assert f"sha256:{hashlib.sha256(data).hexdigest()}" in record["digest"].split()
+    assert (dest / "Audio" / "big.mp3").stat().st_size == 1024 * 1024
+    assert not part.exists()
+
+
+def test_download_archive_verifies_checksum(corpus_server, tmp_path):
+    data = _payload_zip(audio_size=1024)
+    url = corpus_server.serve_file("/corpus.zip", data)
+    part = tmp_path / "corpus.zip.part"
+
+    with pytest.raises(ChecksumMismatch):
+        download_archive(url, part, checksum="sha256:" + "0" * 64)
+    assert not part.exists()
+
+    record = download_archive(url, part, checksum=f"md5:{hashlib.md5(data).hexdigest()}")
+    assert record["digest"] == f"sha256:{hashlib.sha256(data).hexdigest()}"
+    assert part.read_bytes() == data
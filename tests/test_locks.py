@@ -0,0 +1,155 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.ldacatabulator.bookkeeping import read_source_record
+from src.ldacatabulator.ingest import replace_directory
+from src.ldacatabulator.locks import FileLock, corpus_lock_path
+from tests.conftest import CRATES, zip_crate
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _python(code: str, cwd: Path, args: list[str] = (), **kwargs) -> subprocess.Popen:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(REPO_ROOT), env.get("PYTHONPATH")) if p)
+    return subprocess.Popen(
+        [sys.executable, "-c", textwrap.dedent(code), *args],
+        cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, **kwargs
+    )
+
+
+def test_file_lock_excludes_other_processes(tmp_path):
+    lock_file = corpus_lock_path(tmp_path, "https://example.com/corpus.zip")
+    holder = _python(
+        f"""
+        import sys, time
+        from src.ldacatabulator.locks import FileLock
+        with FileLock({str(lock_file)!r}):
+            print("locked", flush=True)
+            time.sleep(60)
+        """,
+        tmp_path,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        with pytest.raises(TimeoutError):
+            with FileLock(lock_file, timeout=0.3):
+                pass
+    finally:
+        # A process that dies holding the lock releases it
+        holder.kill()
+        holder.wait()
+
+    with FileLock(lock_file, timeout=5):
+        assert lock_file.exists()
+
+
+def test_replace_directory_swaps_in_the_new_tree(tmp_path):
+    target, staging = tmp_path / "corpus", tmp_path / ".corpus.partial"
+    target.mkdir()
+    (target / "old.txt").write_text("old", encoding="utf-8")
+    staging.mkdir()
+    (staging / "new.txt").write_text("new", encoding="utf-8")
+
+    replace_directory(staging, target)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["corpus"]
+    assert [p.name for p in target.iterdir()] == ["new.txt"]
+
+
+def test_processes_loading_one_url_build_it_once(corpus_server, tmp_path):
+    data = zip_crate(CRATES / "languageFamily")
+    url = corpus_server.serve_file("/~languageFamily.zip", data)
+    config = tmp_path / "configs" / "general" / "general-config.json"
+    config.parent.mkdir(parents=True)
+    config.write_text(json.dumps({"tables": {}}), encoding="utf-8")
+    builds = tmp_path / "builds"
+    builds.mkdir()
+
+    # Each process tabulates with a stand-in that records its builds and
+    # takes long enough for the other process to ask for the same corpus.
+    script = f"""
+        import os, sqlite3, time
+        from src.ldacatabulator.tabulator import LDaCATabulator
+
+        class SlowTabulator:
+            db = None
+            def crate_to_db(self, crate_uri, db_file, rebuild=True):
+                self.db = sqlite3.connect(db_file)
+                if rebuild:
+                    open(os.path.join({str(builds)!r}, str(os.getpid())), "w").close()
+                    time.sleep(1)
+                    self.db.execute("CREATE TABLE entity (entity_id TEXT)")
+                    self.db.execute("INSERT INTO entity VALUES ('#1')")
+                    self.db.commit()
+
+        tab = LDaCATabulator({url!r}, tb=SlowTabulator())
+        with sqlite3.connect(tab.database) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM entity").fetchone()[0]
+        print(tab.database, rows, flush=True)
+    """
+    procs = [_python(script, tmp_path) for _ in range(2)]
+    outputs = []
+    for proc in procs:
+        out, err = proc.communicate(timeout=60)
+        assert proc.returncode == 0, err
+        outputs.append(out.split())
+
+    assert len(list(builds.iterdir())) == 1
+    assert outputs[0] == outputs[1]
+    database, rows = Path(outputs[0][0]), int(outputs[0][1])
+    assert rows == 1
+    with sqlite3.connect(database) as conn:
+        assert conn.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+    # The second process only validated the first one's download
+    assert any(r["if_none_match"] for r in corpus_server.requests)
+    assert corpus_server.bytes_sent < 1.5 * len(data)
+    leftovers = [p.name for root in ("ldacaCollections", "databases") for p in (tmp_path / root).glob(".*")
+                 if p.suffix in (".tmp", ".partial", ".old")]
+    assert leftovers == []
+
+
+def test_processes_loading_same_named_corpora_keep_them_apart(corpus_server, tmp_path):
+    # Both crates are called "Minimal crate"
+    urls = {
+        corpus_server.serve_file(f"/~{name}.zip", zip_crate(CRATES / name)): CRATES / name
+        for name in ("minimal", "textfiles")
+    }
+    config = tmp_path / "configs" / "general" / "general-config.json"
+    config.parent.mkdir(parents=True)
+    config.write_text(json.dumps({"tables": {}}), encoding="utf-8")
+
+    script = """
+        import sqlite3, sys, time
+        from src.ldacatabulator.tabulator import LDaCATabulator
+
+        class SlowTabulator:
+            db = None
+            def crate_to_db(self, crate_uri, db_file, rebuild=True):
+                self.db = sqlite3.connect(db_file)
+                time.sleep(0.5)
+                self.db.execute("CREATE TABLE entity (entity_id TEXT)")
+                self.db.commit()
+
+        tab = LDaCATabulator(sys.argv[1], tb=SlowTabulator())
+        print(tab.extract_to, tab.database, flush=True)
+    """
+    procs = {url: _python(script, tmp_path, args=[url]) for url in urls}
+    paths = {}
+    for url, proc in procs.items():
+        out, err = proc.communicate(timeout=60)
+        assert proc.returncode == 0, err
+        paths[url] = [Path(p) for p in out.split()]
+
+    assert sorted(extract_to.name for extract_to, _ in paths.values()) == ["Minimal_crate", "Minimal_crate_2"]
+    for url, (extract_to, database) in paths.items():
+        files = sorted(p.relative_to(extract_to) for p in extract_to.rglob("*") if p.is_file())
+        assert files == sorted(p.relative_to(urls[url]) for p in urls[url].rglob("*") if p.is_file())
+        assert read_source_record(database)["url"] == url
@@ -0,0 +1,122 @@
+import io
+import json
+import os
+import pickle
+
+import pytest
+
+from src.ldacatabulator import metadata
+from src.ldacatabulator.metadata import CrateGraph, find_corpus_nodes, iter_graph, reference_id
+
+
+class _CountingReader(io.StringIO):
+    def __init__(self, text):
+        super().__init__(text)
+        self.chars_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.chars_read += len(data)
+        return data
+
+
+def _document(objects: int = 200) -> dict:
+    graph = [
+        {"@id": "ro-crate-metadata.json", "about": {"@id": "corpus"}},
+        {"@id": "corpus", "@type": "Dataset", "name": "Corpus", "publisher": {"@id": "#pub"}},
+        {"@id": "#pub", "name": "Publisher", "score": 1.5e3, "ok": True, "none": None},
+    ]
+    graph += [{"@id": f"#o{i}", "name": f"Object {i}", "text": "é" * 50} for i in range(objects)]
+    return {"@context": {"@vocab": "http://schema.org/", "@graph": "not the graph"}, "@graph": graph, "extra": 12}
+
+
+def test_iter_graph_matches_json_load_across_small_reads(monkeypatch):
+    monkeypatch.setattr(metadata, "READ_SIZE", 7)
+    doc = _document()
+    text = json.dumps(doc, indent=1)
+
+    assert list(iter_graph(io.StringIO(text))) == doc["@graph"]
+
+
+def test_find_corpus_nodes_stops_early():
+    text = json.dumps(_document(objects=5000))
+    reader = _CountingReader(text)
+
+    root, publisher = find_corpus_nodes(iter_graph(reader), "corpus")
+
+    assert root["name"] == "Corpus"
+    assert publisher == "Publisher"
+    assert reader.chars_read < len(text) // 4
+
+
+def test_find_corpus_nodes_falls_back_to_root_dataset():
+    root, publisher = find_corpus_nodes(_document(objects=3)["@graph"], "~other-id")
+
+    assert root["@id"] == "corpus"
+    assert publisher == "Publisher"
+
+
+def test_iter_graph_rejects_non_objects():
+    with pytest.raises(ValueError):
+        list(iter_graph(io.StringIO("[1, 2]")))
+
+
+def test_reference_id():
+    assert reference_id([{"@id": "a"}, {"@id": "b"}]) == "a"
+    assert reference_id({"@id": "a"}) == "a"
+    assert reference_id("a") == "a"
+    assert reference_id(None) is None
+
+
+def _graph_file(tmp_path, doc=None):
+    path = tmp_path / "ro-crate-metadata.json"
+    path.write_text(json.dumps(doc or _document(objects=3)), encoding="utf-8")
+    return path
+
+
+def test_crate_graph_lookups(tmp_path):
+    graph = CrateGraph.from_file(_graph_file(tmp_path))
+
+    assert len(graph) == 6
+    assert graph.get("#o1")["name"] == "Object 1"
+    assert graph.root["@id"] == "corpus"
+    assert [n["@id"] for n in graph.of_type("Dataset")] == ["corpus"]
+    assert graph.resolve(graph.root["publisher"])["name"] == "Publisher"
+    assert graph.corpus_node("~unknown")["@id"] == "corpus"
+    assert graph.corpus_name("~unknown") == "Corpus"
+
+
+def test_crate_graph_load_reuses_cache_until_metadata_changes(tmp_path, monkeypatch):
+    path = _graph_file(tmp_path)
+    cache = tmp_path / "corpus.graph.json"
+    CrateGraph.load(path, cache)
+    assert cache.exists()
+
+    with monkeypatch.context() as m:
+        m.setattr(CrateGraph, "from_file", classmethod(lambda cls, p: pytest.fail("parsed again")))
+        assert CrateGraph.load(path, cache).get("#o2")["name"] == "Object 2"
+
+    doc = _document(objects=1)
+    doc["@graph"][1]["name"] = "Renamed corpus"
+    _graph_file(tmp_path, doc)
+    os.utime(path, ns=(0, 0))
+
+    assert CrateGraph.load(path, cache).root["name"] == "Renamed corpus"
+
+
+def test_crate_graph_cache_is_plain_json_and_never_unpickled(tmp_path):
+    path = _graph_file(tmp_path)
+    cache = tmp_path / "corpus.graph.json"
+    CrateGraph.load(path, cache)
+    cached = json.loads(cache.read_text())
+    assert cached["key"] == CrateGraph.source_key(path)
+    assert cached["nodes"]["#o1"]["name"] == "Object 1"
+
+    class Payload:
+        def __reduce__(self):
+            return (os.makedirs, (str(tmp_path / "executed"),))
+
+    cache.write_bytes(pickle.dumps((CrateGraph.source_key(path), Payload())))
+    assert CrateGraph.load(path, cache).get("#o1")["name"] == "Object 1"
+    assert not (tmp_path / "executed").exists()
+    assert json.loads(cache.read_text())["key"] == CrateGraph.source_key(path)
@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+
+from src.ldacatabulator.bookkeeping import write_source_record
+from src.ldacatabulator.registry import CorpusRegistry
+
+
+URL = "https://example.com/api/object/arcp%3A%2F%2Fname%2Chdl10.26180~123.zip"
+
+
+def _make_corpus(tmp_path: Path, folder: str, url: str = URL) -> tuple[Path, Path]:
+    extract_to = tmp_path / "ldacaCollections" / folder
+    extract_to.mkdir(parents=True)
+    (extract_to / "ro-crate-metadata.json").write_text('{"@graph": []}', encoding="utf-8")
+    database = tmp_path / "databases" / f"{folder}.db"
+    database.parent.mkdir(parents=True, exist_ok=True)
+    write_source_record(database, {"url": url, "etag": '"abc"', "digest": "sha256:00"})
+    return extract_to, database
+
+
+def _registry(tmp_path: Path) -> CorpusRegistry:
+    return CorpusRegistry(tmp_path / "ldacaCollections", tmp_path / "databases")
+
+
+def test_register_and_lookup(tmp_path):
+    extract_to, database = _make_corpus(tmp_path, "Corpus")
+    registry = _registry(tmp_path)
+    registry.register(URL, extract_to, database, {"etag": '"abc"', "built_at": "2025-01-01"})
+
+    entry = _registry(tmp_path).lookup(URL)
+
+    assert entry["extract_to"] == extract_to
+    assert entry["database"] == database
+    assert entry["etag"] == '"abc"'
+    assert entry["corpus_id"] == "arcp://name,hdl10.26180~123"
+    assert entry["built_at"] == "2025-01-01"
+
+
+def test_lookup_drops_entry_removed_outside_tool(tmp_path):
+    extract_to, database = _make_corpus(tmp_path, "Corpus")
+    registry = _registry(tmp_path)
+    registry.register(URL, extract_to, database, {})
+
+    database.unlink()
+
+    assert registry.lookup(URL) is None
+    assert registry.entries() == []
+
+
+def test_lookup_drops_entry_when_metadata_changes(tmp_path):
+    extract_to, database = _make_corpus(tmp_path, "Corpus")
+    registry = _registry(tmp_path)
+    registry.register(URL, extract_to, database, {})
+
+    metadata = extract_to / "ro-crate-metadata.json"
+    stat = metadata.stat()
+    os.utime(metadata, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert registry.lookup(URL) is None
+
+
+def test_lookup_rebuilds_when_folders_added_outside_tool(tmp_path):
+    registry = _registry(tmp_path)
+    assert registry.lookup(URL) is None
+
+    extract_to, database = _make_corpus(tmp_path, "Copied_Corpus")
+    root = tmp_path / "ldacaCollections"
+    stat = root.stat()
+    os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    entry = registry.lookup(URL)
+
+    assert entry["extract_to"] == extract_to
+    assert entry["database"] == database
+    assert entry["digest"] == "sha256:00"
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import sys
+
+import pandas as pd
+import pytest
+
+from src.ldacatabulator.stats import LoadStats, directory_usage
+
+
+def test_stage_times_accumulate_and_reach_the_callback(caplog):
+    events = []
+    stats = LoadStats(label="corpus", callback=lambda event, info: events.append((event, info)))
+
+    with caplog.at_level(logging.INFO):
+        with stats.stage("fetch"):
+            pass
+        with stats.stage("fetch"):
+            pass
+
+    assert list(stats.stages) == ["fetch"]
+    assert stats.stages["fetch"] >= 0
+    assert [event for event, _ in events] == ["stage_start", "stage_end"] * 2
+    assert "corpus: fetch took" in caplog.text
+
+
+def test_counters_tables_and_cache():
+    stats = LoadStats()
+    stats.add("bytes_downloaded", 10)
+    stats.add("bytes_downloaded", 5)
+    stats.hit("frame")
+    stats.hit("frame", False)
+    stats.record_table("Person", pd.DataFrame({"name": ["a", "b", "c"]}), 0.5, "sqlite")
+
+    data = stats.as_dict()
+    assert data["bytes_downloaded"] == 15
+    assert data["cache"] == {"frame_hits": 1, "frame_misses": 1}
+    assert data["tables"]["Person"] == {"rows": 3, "columns": 1, "seconds": 0.5, "source": "sqlite"}
+    assert "callback" not in data
+
+    with pytest.raises(ValueError):
+        stats.add("rows", 1)
+
+
+def test_concurrent_updates_are_not_lost():
+    stats = LoadStats()
+
+    def count():
+        for _ in range(2000):
+            stats.add("bytes_downloaded", 1)
+            stats.hit("frame")
+
+    # Switch threads often, so unguarded read-modify-writes would collide
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(count) for _ in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert stats.bytes_downloaded == 16000
+    assert stats.cache == {"frame_hits": 16000}
+
+
+def test_callback_errors_abort_the_stage():
+    def cancel(event, info):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        with LoadStats(callback=cancel).stage("fetch"):
+            pytest.fail("stage body should not run")
+
+
+def test_directory_usage(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "x.txt").write_bytes(b"12345")
+    (tmp_path / "y.txt").write_bytes(b"123")
+
+    assert directory_usage(tmp_path) == (2, 8)
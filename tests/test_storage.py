@@ -0,0 +1,133 @@
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.ldacatabulator.locks import FileLock, corpus_lock_path
+from src.ldacatabulator.storage import (
+    cache_info,
+    cache_prune,
+    cache_root,
+    parse_size,
+)
+from src.ldacatabulator.tabulator import LDaCATabulator
+from tests.conftest import CRATES, zip_crate
+
+
+class _Tabulator:
+    """Stand-in that writes a small database for every crate."""
+
+    db = None
+
+    def crate_to_db(self, crate_uri, db_file, rebuild=True):
+        self.db = sqlite3.connect(db_file)
+        self.db.execute("CREATE TABLE entity (entity_id TEXT)")
+        self.db.commit()
+
+
+def _load(corpus_server, crate: str, cache_dir: Path, **options) -> LDaCATabulator:
+    url = corpus_server.serve_file(f"/~{crate}.zip", zip_crate(CRATES / crate))
+    with patch.object(LDaCATabulator, "load_config", return_value={"tables": {}}):
+        return LDaCATabulator(url, tb=_Tabulator(), cache_dir=cache_dir, **options)
+
+
+@pytest.fixture
+def elsewhere(tmp_path, monkeypatch):
+    # Nothing may be written to the working directory when a cache root is set
+    cwd = tmp_path / "project"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    yield tmp_path / "cache"
+    assert list(cwd.iterdir()) == []
+
+
+def test_cache_root_from_argument_environment_or_cwd(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LDACA_CACHE_DIR", raising=False)
+    assert cache_root() == tmp_path
+
+    monkeypatch.setenv("LDACA_CACHE_DIR", str(tmp_path / "env"))
+    assert cache_root() == tmp_path / "env"
+    assert cache_root(tmp_path / "arg") == tmp_path / "arg"
+
+
+def test_parse_size():
+    assert parse_size(None) is None
+    assert parse_size(1000) == 1000
+    assert parse_size("1000") == 1000
+    assert parse_size("500K") == 500 * 1024
+    assert parse_size("1.5gb") == int(1.5 * 1024**3)
+    with pytest.raises(ValueError):
+        parse_size("lots")
+    with pytest.raises(ValueError):
+        LDaCATabulator("https://example.com/~1.zip", tb=_Tabulator(), lazy=True, cache_quota="lots")
+
+
+def test_cache_info_reports_sizes_and_last_access(corpus_server, elsewhere):
+    first = _load(corpus_server, "minimal", elsewhere)
+    second = _load(corpus_server, "wide", elsewhere)
+
+    info = cache_info(elsewhere)
+    assert list(info["url"]) == [second.url, first.url]
+    row = info.iloc[1]
+    assert row["folder"] == first.extract_to
+    assert row["database"] == first.database
+    assert row["folder_bytes"] == sum(p.stat().st_size for p in first.extract_to.rglob("*") if p.is_file())
+    assert row["database_bytes"] >= first.database.stat().st_size
+    assert row["total_bytes"] == row["folder_bytes"] + row["database_bytes"]
+    assert row["last_access"] >= row["built_at"]
+
+    # Loading a cached corpus again makes it the most recently used
+    first.close()
+    first = _load(corpus_server, "minimal", elsewhere, offline=True)
+    assert list(cache_info(elsewhere)["url"]) == [first.url, second.url]
+
+
+def test_prune_evicts_least_recently_used(corpus_server, elsewhere):
+    oldest = _load(corpus_server, "minimal", elsewhere)
+    middle = _load(corpus_server, "wide", elsewhere)
+    newest = _load(corpus_server, "utf8", elsewhere)
+    for tab in (oldest, middle, newest):
+        tab.close()
+    sizes = cache_info(elsewhere).set_index("url")["total_bytes"]
+
+    assert cache_prune(None, elsewhere) == []
+    evicted = cache_prune(sizes[newest.url] + 1, elsewhere)
+
+    assert evicted == [oldest.url, middle.url]
+    assert list(cache_info(elsewhere)["url"]) == [newest.url]
+    for tab in (oldest, middle):
+        assert not tab.extract_to.exists()
+        assert not tab.database.exists()
+    assert [p.name for p in (elsewhere / "ldacaCollections").iterdir()] == [newest.extract_to.name]
+
+
+def test_prune_skips_corpora_being_loaded_and_kept(corpus_server, elsewhere):
+    busy = _load(corpus_server, "minimal", elsewhere)
+    kept = _load(corpus_server, "wide", elsewhere)
+    idle = _load(corpus_server, "utf8", elsewhere)
+    for tab in (busy, kept, idle):
+        tab.close()
+
+    with FileLock(corpus_lock_path(elsewhere / "databases", busy.url)):
+        evicted = cache_prune(0, elsewhere, keep=[kept.url])
+
+    assert evicted == [idle.url]
+    assert sorted(cache_info(elsewhere)["url"]) == sorted([busy.url, kept.url])
+
+
+def test_quota_evicts_other_corpora_after_a_load(corpus_server, elsewhere, monkeypatch):
+    first = _load(corpus_server, "minimal", elsewhere)
+    second = _load(corpus_server, "wide", elsewhere)
+    first.close()
+    second.close()
+
+    # A one-byte budget: the corpus just loaded stays, the others go
+    monkeypatch.setenv("LDACA_CACHE_QUOTA", "1")
+    third = _load(corpus_server, "utf8", elsewhere)
+
+    assert list(cache_info(elsewhere)["url"]) == [third.url]
+    assert third.database.exists()
+    assert not first.extract_to.exists()
+    third.close()
@@ -0,0 +1,121 @@
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.ldacatabulator import tabulator as tabulator_module
+from src.ldacatabulator.bookkeeping import read_table_records
+from src.ldacatabulator.cache import FrameCache
+from src.ldacatabulator.tabulator import LDaCATabulator
+
+THREADS = 12
+CALLS_PER_THREAD = 24
+GENERAL = {
+    "name": "general",
+    "tables": {
+        "RepositoryObject": {"columns": ["name", "text"]},
+        "Person": {"columns": ["name"]},
+    },
+}
+CORPUS = {"name": "corpus", "tables": {"Speaker": {"columns": ["name", "role"]}}}
+
+
+# --------------------------------------------------------------------
+# A tabulator that writes the columns its configuration lists, filled
+# with the configuration's name, and records every build and whether
+# two builds ever ran at the same time.
+# --------------------------------------------------------------------
+class ConfigTabulator:
+    builds = []
+    active = 0
+    overlapped = False
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.db = None
+        self.config = {}
+        self.text_prop = None
+
+    def crate_to_db(self, crate_uri, db_file, rebuild=True):
+        self.db = sqlite3.connect(db_file, check_same_thread=False)
+
+    def entity_table(self, table):
+        cls = ConfigTabulator
+        with cls.lock:
+            cls.active += 1
+            cls.overlapped |= cls.active > 1
+        try:
+            spec = self.config["tables"].get(table)
+            if spec is None:
+                raise KeyError(table)
+            # Leave other threads time to ask for the same table
+            time.sleep(0.05)
+            columns = ["entity_id", *spec["columns"]]
+            self.db.execute(f'DROP TABLE IF EXISTS "{table}"')
+            self.db.execute(f'CREATE TABLE "{table}" ({", ".join(columns)})')
+            self.db.executemany(
+                f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(columns))})',
+                [[f"#{table}{n}", *[self.config["name"]] * len(spec["columns"])] for n in range(50)],
+            )
+            self.db.commit()
+            with cls.lock:
+                cls.builds.append((table, self.config["name"]))
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+
+def _shared_corpus(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tabulator_module, "_new_tabulator", ConfigTabulator)
+    monkeypatch.setattr(ConfigTabulator, "builds", [])
+    config_file = tmp_path / "configs" / "corpora" / "123.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text(json.dumps(CORPUS), encoding="utf-8")
+
+    tab = LDaCATabulator.__new__(LDaCATabulator)
+    tab.url = "https://example.com/~123.zip"
+    tab.database = tmp_path / "corpus.db"
+    sqlite3.connect(tab.database).close()
+    tab.extract_to = tmp_path
+    tab.tb = ConfigTabulator()
+    tab.tb.config, tab.tb.text_prop = GENERAL, "ldac:mainText"
+    tab._frame_cache = FrameCache(10**7)
+    return tab
+
+
+def test_concurrent_general_and_corpus_specific_reads(tmp_path, monkeypatch):
+    tab = _shared_corpus(tmp_path, monkeypatch)
+    calls = [
+        lambda: ("RepositoryObject", tab.get_text()),
+        lambda: ("Person", tab.get_people()),
+        lambda: ("Speaker", tab.corpus_specific_tables("Speaker")),
+        lambda: ("Person", tab.get_people(where={"entity_id": ["#Person1", "#Person2"]})),
+        lambda: ("RepositoryObject", tab.iter_text(batch_size=20).__next__()),
+    ]
+    start = threading.Barrier(THREADS)
+
+    def worker(offset):
+        start.wait()
+        return [calls[(offset + i) % len(calls)]() for i in range(CALLS_PER_THREAD)]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = [r for rs in pool.map(worker, range(THREADS)) for r in rs]
+
+    # Each table was built once, with its own configuration, one at a time
+    assert sorted(ConfigTabulator.builds) == [
+        ("Person", "general"), ("RepositoryObject", "general"), ("Speaker", "corpus")
+    ]
+    assert not ConfigTabulator.overlapped
+    assert tab.tb.config is GENERAL
+    assert len(results) == THREADS * CALLS_PER_THREAD
+    expected_columns = {"RepositoryObject": {"name", "text"}, "Person": {"name"}, "Speaker": {"name", "role"}}
+    for table, df in results:
+        assert set(df.columns) == expected_columns[table]
+        assert set(df.stack()) == {"corpus" if table == "Speaker" else "general"}
+    assert set(read_table_records(tab.database)) == {"RepositoryObject", "Person", "Speaker"}
+    # Every thread read through a connection of its own
+    assert len(tab._connections) == THREADS
+    tab.close()
+    assert len(tab._connections) == 0